@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Which images each story references, which of those are missing from images/, and which
+files in images/ no story references (orphans) — from one scan of images/ and cached
+story metadata.
+.asset_cache.json keeps every story's image references (filename and generation prompt)
+keyed by file size and mtime, so unchanged stories are not re-read; a story that fails to
+parse is reported and keeps its last good references. Used by list_missing_images.py,
+compress_images.py and generate_web.py, which all name story images with image_filename().
+Usage: python3 asset_graph.py [--json]
+"""
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+STORIES_DIR = ROOT / "stories"
+IMAGES_DIR = ROOT / "images"
+ASSET_CACHE_PATH = ROOT / ".asset_cache.json"
+# Bump when the cached reference format changes.
+ASSET_CACHE_VERSION = "2"
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff")
+
+
+def image_filename(filename: str) -> str:
+    """Name a story image is saved under in images/: stripped, with .png added if it has no extension."""
+    fn = filename.strip() if isinstance(filename, str) else ""
+    if fn and not os.path.splitext(fn)[1]:
+        fn = fn + ".png"
+    return fn
+
+
+def image_blocks(data: dict) -> list[dict]:
+    """The thumbnail and content image blocks of a story, in page order."""
+    thumb = data.get("thumbnail")
+    blocks = [thumb] if isinstance(thumb, dict) else []
+    blocks.extend(
+        item for item in data.get("content") or [] if isinstance(item, dict) and item.get("type") == "image"
+    )
+    return blocks
+
+
+def content_images(data: dict) -> list[str]:
+    """image_filename() of every image block in a story's content."""
+    blocks = [item for item in data.get("content") or [] if isinstance(item, dict) and item.get("type") == "image"]
+    return [fn for fn in (image_filename(item.get("filename")) for item in blocks) if fn]
+
+
+def story_images(data: dict) -> list[str]:
+    """image_filename() of the thumbnail and content images a story references."""
+    return [fn for fn, _ in story_refs(data)]
+
+
+def story_refs(data: dict) -> list[list[str]]:
+    """[[filename, generation prompt]] for the thumbnail and content images, in page order."""
+    out = []
+    for block in image_blocks(data):
+        fn = image_filename(block.get("filename"))
+        if fn:
+            out.append([fn, block.get("generation_prompt") or ""])
+    return out
+
+
+def scan_images(folder: Path = IMAGES_DIR) -> dict:
+    """{name: (size, mtime_ns)} of the image files directly in folder, from one directory scan."""
+    out = {}
+    try:
+        entries = list(os.scandir(folder))
+    except OSError:
+        return out
+    for e in entries:
+        if e.name.lower().endswith(IMAGE_EXTS) and e.is_file():
+            st = e.stat()
+            out[e.name] = (st.st_size, st.st_mtime_ns)
+    return out
+
+
+@dataclass
+class AssetGraph:
+    """Story -> image references and the image files present in images/."""
+    # {name: (size, mtime_ns)} for every image file in images/
+    images: dict = field(default_factory=dict)
+    # {story id: [[filename, generation prompt], ...]}
+    stories: dict = field(default_factory=dict)
+
+    def story_images(self, sid: str) -> list[str]:
+        return [fn for fn, _ in self.stories.get(sid, ())]
+
+    def referenced(self) -> dict:
+        """{filename: [story ids]} for every referenced image."""
+        out = {}
+        for sid, refs in self.stories.items():
+            for fn, _ in refs:
+                out.setdefault(fn, []).append(sid)
+        return out
+
+    def missing(self) -> list[tuple[str, str, str]]:
+        """[(story id, filename, prompt)] for every reference to an image not in images/, in story
+        order (an image several stories use is listed for each of them)."""
+        return [(sid, fn, prompt) for sid, refs in self.stories.items() for fn, prompt in refs if fn not in self.images]
+
+    def orphaned(self) -> list[str]:
+        """Files in images/ that no story references."""
+        referenced = self.referenced()
+        return sorted(name for name in self.images if name not in referenced)
+
+
+def load_asset_cache() -> dict:
+    try:
+        cache = json.loads(ASSET_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("version") != ASSET_CACHE_VERSION:
+        return {"version": ASSET_CACHE_VERSION, "stories": {}}
+    return cache
+
+
+def build_graph(images_dir: Path = IMAGES_DIR, stories_dir: Path = STORIES_DIR) -> AssetGraph:
+    """Scan images_dir once and collect story references, re-reading only stories whose
+    size or mtime changed since .asset_cache.json was written (which it then updates).
+    A story that cannot be read keeps its last cached references (and is retried next
+    time), or is left out if it has none."""
+    cache = load_asset_cache()
+    old = cache["stories"]
+    stories = {}
+    changed = False
+    paths = sorted(stories_dir.glob("*.json")) if stories_dir.is_dir() else []
+    for path in paths:
+        if path.name == "manifest.json":
+            continue
+        sid = path.stem
+        st = path.stat()
+        cached = old.get(sid)
+        if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime_ns:
+            stories[sid] = cached
+            continue
+        try:
+            data = json.loads(path.read_bytes().decode("utf-8"))
+            if not isinstance(data, dict):
+                raise ValueError("not a JSON object")
+        except (OSError, ValueError) as e:
+            print(f"Error reading {path}: {e}", file=sys.stderr)
+            if cached:
+                stories[sid] = cached
+            continue
+        stories[sid] = {"size": st.st_size, "mtime": st.st_mtime_ns, "refs": story_refs(data)}
+        changed = True
+    if changed or set(stories) != set(old):
+        cache["stories"] = stories
+        tmp = ASSET_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(ASSET_CACHE_PATH)
+    return AssetGraph(
+        images=scan_images(images_dir),
+        stories={sid: record["refs"] for sid, record in stories.items()},
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report missing and orphaned story images.")
+    parser.add_argument("--json", action="store_true", help="print the full graph as JSON")
+    args = parser.parse_args(argv)
+    graph = build_graph()
+    missing = graph.missing()
+    orphaned = graph.orphaned()
+    if args.json:
+        print(json.dumps({
+            "stories": {sid: graph.story_images(sid) for sid in graph.stories},
+            "missing": [{"story": sid, "filename": fn} for sid, fn, _ in missing],
+            "orphaned": orphaned,
+        }, ensure_ascii=False, indent=1))
+        return
+    referenced = graph.referenced()
+    print(f"{len(graph.stories)} stories reference {len(referenced)} images; {len(graph.images)} files in images/.")
+    print(f"Missing ({len(missing)}):")
+    for sid, fn, _ in missing:
+        print(f"  {fn}  ({sid})")
+    print(f"Orphaned ({len(orphaned)}):")
+    for fn in orphaned:
+        print(f"  {fn}")
+
+
+if __name__ == "__main__":
+    main()
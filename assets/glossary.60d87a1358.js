@@ -0,0 +1,19 @@
+// Story pages built with --shared-glossary: fill the glossary from the shared vocab/ chunks.
+(function () {
+  var chunks = window.__vocab || {};
+  var list = document.querySelector('#glossary dl[data-vocab]');
+  if (!list) return;
+  function escapeHtml(s) {
+    var div = document.createElement('div');
+    div.textContent = s == null ? '' : s;
+    return div.innerHTML;
+  }
+  var words = JSON.parse(list.getAttribute('data-words') || '{}');  // this story's casing, where it differs
+  var html = '';
+  list.getAttribute('data-vocab').split(' ').forEach(function (id) {
+    var e = chunks[id];
+    if (!e) return;
+    html += '<dt>' + escapeHtml(words[id] || e[0]) + ' — ' + escapeHtml(e[1]) + '</dt><dd>' + escapeHtml(e[2]) + '</dd>';
+  });
+  list.innerHTML = html;
+})();
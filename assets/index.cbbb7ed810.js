@@ -0,0 +1,124 @@
+// index.html and the level/category listings (build_facets.py): virtualized story grid fed by
+// the sharded manifest (MANIFEST_INDEX / MANIFEST_FIRST_SHARD), with shards under MANIFEST_BASE
+// and story links relative to SITE_ROOT.
+(function () {
+  var app = document.getElementById('app');
+  function escapeHtml(s) {
+    if (s == null) return '';
+    var div = document.createElement('div');
+    div.textContent = s;
+    return div.innerHTML;
+  }
+  if (!MANIFEST_INDEX || !MANIFEST_INDEX.total) {
+    app.innerHTML = '<p class="error">No stories found.</p>';
+    return;
+  }
+  // The manifest is split into shards; only the shards covering the
+  // visible rows are loaded, and only the visible cards are in the DOM.
+  var total = MANIFEST_INDEX.total;
+  var shardSize = MANIFEST_INDEX.shardSize;
+  var shards = { 0: MANIFEST_FIRST_SHARD };
+  var pending = {};
+  var MIN_CARD_WIDTH = 280, CARD_HEIGHT = 240, BUFFER_ROWS = 2;
+  function shardUrl(n, ext) {
+    var s = MANIFEST_INDEX.shards[n];
+    return MANIFEST_BASE + s.file + ext + '?v=' + s.hash;
+  }
+  function shardLoaded(n, list) {
+    shards[n] = list;
+    delete pending[n];
+    scheduleRender(true);
+  }
+  // Shard .js files call this; they are the fallback where fetch() is unavailable (file://).
+  window.__manifestShard = shardLoaded;
+  function loadShardScript(n) {
+    var script = document.createElement('script');
+    script.src = shardUrl(n, '.js');
+    script.onerror = function () { delete pending[n]; };
+    document.head.appendChild(script);
+  }
+  function loadShard(n) {
+    if (shards[n] || pending[n]) return;
+    pending[n] = true;
+    if (location.protocol === 'file:' || !window.fetch) { loadShardScript(n); return; }
+    fetch(shardUrl(n, '.json'))
+      .then(function (r) { if (!r.ok) throw new Error(r.status); return r.json(); })
+      .then(function (list) { shardLoaded(n, list); })
+      .catch(function () { loadShardScript(n); });
+  }
+  function cardHtml(item) {
+    var id = item.id || '';
+    var slug = item.slug || id;
+    var title = item.title || id;
+    var titleTranslation = item.titleTranslation || '';
+    var level = item.level || '';
+    var thumb = (item.thumbnail && item.thumbnail.trim()) ? (IMAGES_BASE + item.thumbnail.trim()) : '';
+    var bgStyle = '';
+    if (thumb) {
+      // The inline placeholder sits under the thumbnail until it arrives.
+      var under = item.thumbnailPlaceholder ? ', url(\'' + item.thumbnailPlaceholder + '\')' : '';
+      bgStyle = 'background-image: url(\'' + thumb + '\')' + under;
+      // Small WebP/AVIF card thumbnails where supported; the PNG declaration above is the fallback.
+      if (item.thumbnailSources && item.thumbnailSources.length) {
+        bgStyle += '; background-image: image-set(' + item.thumbnailSources.map(function (s) {
+          return 'url(\'' + IMAGES_BASE + s.src + '\') type(\'' + s.type + '\')';
+        }).join(', ') + ', url(\'' + thumb + '\') type(\'image/png\'))' + under;
+      }
+      bgStyle = ' style="' + bgStyle + '"';
+    }
+    var html = '<a class="card" href="' + SITE_ROOT + 'story/' + encodeURIComponent(slug) + '/">';
+    html += '<div class="card-bg"' + bgStyle + '><span class="level">' + escapeHtml(level) + '</span></div>';
+    html += '<div class="card-body"><h2 class="card-title">' + escapeHtml(title) + '</h2>';
+    if (titleTranslation) html += '<p class="card-meta">' + escapeHtml(titleTranslation) + '</p>';
+    return html + '</div></a>';
+  }
+  var grid = document.createElement('div');
+  grid.className = 'grid';
+  var win = document.createElement('div');
+  win.className = 'grid-window';
+  grid.appendChild(win);
+  app.appendChild(grid);
+  var gap = parseFloat(getComputedStyle(win).rowGap) || 24;
+  var rendered = '';
+  function render(force) {
+    var cols = Math.max(1, Math.floor((grid.clientWidth + gap) / (MIN_CARD_WIDTH + gap)));
+    var rows = Math.ceil(total / cols);
+    var stride = CARD_HEIGHT + gap;
+    grid.style.height = (rows * stride - gap) + 'px';
+    var top = grid.getBoundingClientRect().top;
+    var first = Math.max(0, Math.floor(-top / stride) - BUFFER_ROWS);
+    var last = Math.min(rows - 1, Math.ceil((window.innerHeight - top) / stride) + BUFFER_ROWS);
+    var key = cols + ':' + first + ':' + last;
+    if (!force && key === rendered) return;
+    rendered = key;
+    var start = first * cols, end = Math.min(total, (last + 1) * cols);
+    var html = '';
+    for (var i = start; i < end; i++) {
+      var n = Math.floor(i / shardSize);
+      var shard = shards[n];
+      if (shard) {
+        html += cardHtml(shard[i - n * shardSize]);
+      } else {
+        html += '<div class="card loading"></div>';
+        loadShard(n);
+      }
+    }
+    win.style.gridTemplateColumns = 'repeat(' + cols + ', 1fr)';
+    win.style.transform = 'translateY(' + (first * stride) + 'px)';
+    win.innerHTML = html;
+  }
+  var frame = 0, forceNext = false;
+  function scheduleRender(force) {
+    forceNext = forceNext || !!force;
+    if (frame) return;
+    frame = requestAnimationFrame(function () {
+      frame = 0;
+      var f = forceNext;
+      forceNext = false;
+      render(f);
+    });
+  }
+  window.addEventListener('scroll', function () { scheduleRender(false); }, { passive: true });
+  window.addEventListener('resize', function () { scheduleRender(false); });
+  render(true);
+})();
@@ -0,0 +1,147 @@
+// index.html: full-text search over the sharded index in search/ (built by build_index.py).
+(function () {
+  var input = document.getElementById('search');
+  var results = document.getElementById('searchResults');
+  var app = document.getElementById('app');
+  if (!input || !results) return;
+  var MAX_RESULTS = 50, DEBOUNCE_MS = 120;
+  // Same folding as build_index.fold(): strip accents, lowercase ("Año" -> "ano").
+  function fold(s) {
+    return s.normalize('NFKD').replace(/\p{M}/gu, '').toLowerCase();
+  }
+  function tokenize(s) {
+    return fold(s).match(/[\p{L}\p{N}]+/gu) || [];
+  }
+  function escapeHtml(s) {
+    var div = document.createElement('div');
+    div.textContent = s == null ? '' : s;
+    return div.innerHTML;
+  }
+  // Each search/*.json has a .js twin calling one of these; that is the file:// fallback.
+  var loaded = {}, waiting = {};
+  function settle(key, data) {
+    loaded[key] = Promise.resolve(data);
+    (waiting[key] || []).forEach(function (fn) { fn(data); });
+    delete waiting[key];
+  }
+  window.__searchIndex = function (root) { settle('index', root); };
+  window.__searchShard = function (prefix, terms) { settle('t:' + prefix, terms); };
+  window.__searchDocs = function (n, docs) { settle('d:' + n, docs); };
+  function loadScript(key, url) {
+    return new Promise(function (resolve, reject) {
+      (waiting[key] = waiting[key] || []).push(resolve);
+      var script = document.createElement('script');
+      script.src = url;
+      script.onerror = function () { delete loaded[key]; reject(new Error(url)); };
+      document.head.appendChild(script);
+    });
+  }
+  function load(key, stem, hash) {
+    if (loaded[key]) return loaded[key];
+    var url = 'search/' + stem;
+    var v = hash ? '?v=' + hash : '';
+    if (location.protocol === 'file:' || !window.fetch) {
+      loaded[key] = loadScript(key, url + '.js' + v);
+    } else {
+      // The root index is not content-hashed, so revalidate it instead of trusting the HTTP cache.
+      loaded[key] = fetch(url + '.json' + v, hash ? {} : { cache: 'no-cache' })
+        .then(function (r) { if (!r.ok) throw new Error(r.status); return r.json(); })
+        .catch(function () { return loadScript(key, url + '.js' + v); });
+    }
+    return loaded[key];
+  }
+  function loadRoot() { return load('index', 'index', ''); }
+
+  // {doc: score} for one query word: every indexed term starting with it, from its prefix shard.
+  function termScores(root, word) {
+    var prefix = word.slice(0, root.prefixLength);
+    var shard = root.shards[prefix];
+    if (!shard) return Promise.resolve({});
+    return load('t:' + prefix, shard.file, shard.hash).then(function (terms) {
+      var scores = {};
+      var exact = word.length < root.prefixLength;
+      Object.keys(terms).forEach(function (term) {
+        if (exact ? term !== word : term.lastIndexOf(word, 0) !== 0) return;
+        var postings = terms[term];
+        var boost = term === word ? 2 : 1;
+        for (var i = 0; i < postings.length; i += 2) {
+          scores[postings[i]] = (scores[postings[i]] || 0) + boost * postings[i + 1];
+        }
+      });
+      return scores;
+    });
+  }
+  function search(root, words) {
+    return Promise.all(words.map(function (w) { return termScores(root, w); })).then(function (perWord) {
+      // Every word must match; rank by summed occurrences.
+      var ranked = [];
+      Object.keys(perWord[0]).forEach(function (doc) {
+        var score = 0;
+        for (var i = 0; i < perWord.length; i++) {
+          if (!perWord[i][doc]) return;
+          score += perWord[i][doc];
+        }
+        ranked.push([+doc, score]);
+      });
+      ranked.sort(function (a, b) { return b[1] - a[1] || a[0] - b[0]; });
+      return ranked;
+    });
+  }
+  function docMeta(root, ids) {
+    var chunks = {};
+    ids.forEach(function (id) { chunks[Math.floor(id / root.docChunkSize)] = true; });
+    return Promise.all(Object.keys(chunks).map(function (n) {
+      var entry = root.docs[n];
+      return entry ? load('d:' + n, entry.file, entry.hash) : Promise.resolve({});
+    })).then(function (parts) {
+      var meta = {};
+      parts.forEach(function (docs) { Object.keys(docs).forEach(function (id) { meta[id] = docs[id]; }); });
+      return meta;
+    });
+  }
+  function show(html) {
+    results.innerHTML = html;
+    results.hidden = false;
+    app.hidden = true;
+  }
+  function clear() {
+    results.hidden = true;
+    results.innerHTML = '';
+    if (app.hidden) {
+      app.hidden = false;
+      window.dispatchEvent(new Event('resize'));
+    }
+  }
+  var seq = 0, timer = 0;
+  function run() {
+    var words = tokenize(input.value);
+    var mine = ++seq;
+    if (!words.length) { clear(); return; }
+    loadRoot().then(function (root) {
+      return search(root, words).then(function (ranked) {
+        var top = ranked.slice(0, MAX_RESULTS);
+        return docMeta(root, top.map(function (r) { return r[0]; })).then(function (meta) {
+          if (mine !== seq) return;
+          if (!top.length) { show('<p class="search-empty">No stories match “' + escapeHtml(input.value.trim()) + '”.</p>'); return; }
+          var html = '<p class="search-count">' + ranked.length + (ranked.length === 1 ? ' story' : ' stories') + '</p><ul class="search-list">';
+          top.forEach(function (r) {
+            var m = meta[r[0]];
+            if (!m) return;
+            html += '<li><a href="story/' + encodeURIComponent(m[0]) + '/"><span class="level">' + escapeHtml(m[3]) + '</span> '
+              + '<strong>' + escapeHtml(m[1] || m[0]) + '</strong>'
+              + (m[2] ? ' <span class="search-meta">' + escapeHtml(m[2]) + '</span>' : '') + '</a></li>';
+          });
+          show(html + '</ul>');
+        });
+      });
+    }).catch(function () {
+      if (mine === seq) show('<p class="error">Search index not available.</p>');
+    });
+  }
+  input.addEventListener('input', function () {
+    clearTimeout(timer);
+    timer = setTimeout(run, DEBOUNCE_MS);
+  });
+  // Start fetching the small root index as soon as the user shows intent to search.
+  input.addEventListener('focus', function () { loadRoot().catch(function () {}); }, { once: true });
+})();
@@ -0,0 +1,107 @@
+// --client-render story pages: builds the page DOM once from EMBEDDED_STORY; story.js handles interaction.
+(function () {
+  function escapeHtml(s) {
+    if (s == null) return '';
+    var div = document.createElement('div');
+    div.textContent = s;
+    return div.innerHTML;
+  }
+  var story = EMBEDDED_STORY;
+  // Columnar payloads (--compact-payload, web/story-columns.js) are decoded one item at a time.
+  var columns = story.columns === 1 ? window.decodeStoryColumns(story) : null;
+  var meta = columns ? columns.meta : story;
+  document.getElementById('title').textContent = meta.title;
+  document.getElementById('meta').textContent = meta.level + ' · ' + (meta.language || 'es') + (meta.titleTranslation ? ' — ' + meta.titleTranslation : '');
+  var tagsHtml = '';
+  if (meta.tags && meta.tags.length) {
+    meta.tags.forEach(function (t) {
+      tagsHtml += '<span class="tag"><strong>' + escapeHtml(t.name) + '</strong> ' + escapeHtml(t.description) + '</span>';
+    });
+  }
+  document.getElementById('tags').innerHTML = tagsHtml || '—';
+  function hideImage() { this.classList.add('hide'); }
+  var frag = document.createDocumentFragment();
+  function renderItem(item, i) {
+    if (item.type === 'sentence') {
+      var block = document.createElement('div');
+      block.className = 'sentence-block';
+      block.dataset.sentenceIndex = i;
+      var text = item.text;
+      var span = document.createElement('span');
+      span.className = 'text';
+      if (item.highlights && item.highlights.length) {
+        var last = 0;
+        item.highlights.slice().sort(function (a, b) { return a.startIndex - b.startIndex; }).forEach(function (h) {
+          if (h.startIndex > last) span.appendChild(document.createTextNode(text.slice(last, h.startIndex)));
+          var hl = document.createElement('span');
+          hl.className = 'hl';
+          hl.textContent = text.slice(h.startIndex, h.endIndex);
+          span.appendChild(hl);
+          last = h.endIndex;
+        });
+        if (last < text.length) span.appendChild(document.createTextNode(text.slice(last)));
+      } else {
+        span.textContent = text;
+      }
+      block.appendChild(span);
+      var trans = document.createElement('div');
+      trans.className = 'translation';
+      trans.textContent = item.translation || '';
+      block.appendChild(trans);
+      if (item.detailedTranslation && item.detailedTranslation.length) {
+        var ul = document.createElement('ul');
+        ul.className = 'detailed-translation';
+        item.detailedTranslation.forEach(function (bullet) {
+          var li = document.createElement('li');
+          li.textContent = bullet;
+          ul.appendChild(li);
+        });
+        block.appendChild(ul);
+      }
+      frag.appendChild(block);
+    } else if (item.type === 'image') {
+      var img = document.createElement('img');
+      img.alt = item.generation_prompt || item.filename;
+      img.loading = 'lazy';
+      img.onerror = hideImage;
+      img.src = IMAGES_BASE + (IMAGE_FILES[item.filename] || item.filename);
+      var meta = IMAGE_META[item.filename];
+      if (meta && meta.width) {
+        img.width = meta.width;
+        img.height = meta.height;
+      }
+      if (meta && meta.placeholder) img.style.backgroundImage = 'url(' + meta.placeholder + ')';
+      var sources = IMAGE_SOURCES[item.filename];
+      if (sources && sources.length) {
+        var picture = document.createElement('picture');
+        sources.forEach(function (s) {
+          var source = document.createElement('source');
+          source.type = s.type;
+          source.srcset = s.srcset.split(', ').map(function (c) { return IMAGES_BASE + c; }).join(', ');
+          source.sizes = IMAGE_SIZES;
+          picture.appendChild(source);
+        });
+        picture.appendChild(img);
+        frag.appendChild(picture);
+      } else {
+        frag.appendChild(img);
+      }
+    }
+  }
+  if (columns) {
+    for (var i = 0; i < columns.count; i++) renderItem(columns.item(i), i);
+  } else {
+    story.content.forEach(renderItem);
+  }
+  document.getElementById('content').appendChild(frag);
+  var glossary = columns ? columns.glossary() : story.glossary;
+  if (glossary && Object.keys(glossary).length) {
+    var gEl = document.getElementById('glossary');
+    var gHtml = '<h2>Glossary</h2><dl>';
+    Object.keys(glossary).forEach(function (key) {
+      var e = glossary[key];
+      gHtml += '<dt>' + escapeHtml(key) + ' — ' + escapeHtml(e.translation) + '</dt><dd>' + escapeHtml(e.explanation) + '</dd>';
+    });
+    gEl.innerHTML = gHtml + '</dl>';
+  }
+})();
@@ -0,0 +1,50 @@
+// Story pages: translation toggles and per-sentence expand/collapse, applied by switching classes.
+(function () {
+  var content = document.getElementById('content');
+  var showTranslations = document.getElementById('showTranslations');
+  var showDetailedTranslation = document.getElementById('showDetailedTranslation');
+  var blocks = content.querySelectorAll('.sentence-block');
+  var expandedSentences = new Set();
+  var collapsedSentences = new Set();
+  function isSentenceVisible(i) {
+    return showTranslations.checked ? !collapsedSentences.has(i) : expandedSentences.has(i);
+  }
+  function applyBlock(block) {
+    var isVisible = isSentenceVisible(parseInt(block.dataset.sentenceIndex, 10));
+    block.classList.toggle('show-translation', isVisible);
+    block.classList.toggle('show-detailed', isVisible && showDetailedTranslation.checked);
+  }
+  function applyAll() {
+    for (var k = 0; k < blocks.length; k++) applyBlock(blocks[k]);
+  }
+  function hideSentence(i) {
+    expandedSentences.delete(i);
+    if (showTranslations.checked) collapsedSentences.add(i);
+  }
+  content.addEventListener('click', function (e) {
+    var block = e.target.closest('.sentence-block');
+    if (!block || block.dataset.sentenceIndex === undefined) return;
+    var i = parseInt(block.dataset.sentenceIndex, 10);
+    if (e.target.closest('.translation') || e.target.closest('.detailed-translation')) {
+      hideSentence(i);
+    } else if (e.target.closest('.text')) {
+      if (isSentenceVisible(i)) {
+        hideSentence(i);
+      } else {
+        expandedSentences.add(i);
+        collapsedSentences.delete(i);
+      }
+    } else {
+      return;
+    }
+    applyBlock(block);
+  });
+  showTranslations.addEventListener('change', function () {
+    if (!showTranslations.checked) expandedSentences.clear();
+    collapsedSentences.clear();
+    applyAll();
+  });
+  showDetailedTranslation.addEventListener('change', applyAll);
+  // Browsers may restore checkbox state on back/forward navigation.
+  applyAll();
+})();
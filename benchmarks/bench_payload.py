@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Embedded story payload benchmark: the story JSON that --client-render pages embed versus
+the --compact-payload columns (generate_web.compact_story), on raw size, gzip -9 size and
+parse time. Runs over synthetic stories (--sentences, several sizes) and every story in
+stories/. Parse times come from the Node harness (benchmarks/payload_harness.js): JSON.parse,
+evaluation as the embedded object literal, and for the columns a full item-by-item decode
+with web/story-columns.js, which is also checked against the JSON (python json.loads
+times are printed instead when node is not installed).
+Usage: python3 benchmarks/bench_payload.py [--sentences 100,1000,5000] [--repeat N] [--no-real]
+"""
+import argparse
+import gzip
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+import generate_web as gw  # noqa: E402
+from synthetic import synthetic_story  # noqa: E402
+
+
+def payloads(story: dict) -> dict:
+    """{format: text} as the page would embed it (compact separators: --minify)."""
+    compact = gw.compact_story(story)
+    return {
+        "json": json.dumps(story, ensure_ascii=False),
+        "json-min": json.dumps(story, ensure_ascii=False, separators=(",", ":")),
+        "columns": json.dumps(compact, ensure_ascii=False),
+        "columns-min": json.dumps(compact, ensure_ascii=False, separators=(",", ":")),
+    }
+
+
+def python_parse_ms(text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json.loads(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare story JSON and columnar payload size and parse time.")
+    parser.add_argument("--sentences", default="100,1000,5000", help="comma-separated synthetic story sizes")
+    parser.add_argument("--repeat", type=int, default=20, help="parse runs per payload (best is reported)")
+    parser.add_argument("--no-real", dest="real", action="store_false", help="skip the stories in stories/")
+    args = parser.parse_args()
+
+    stories = {
+        f"synthetic-{n}": synthetic_story(seed=n, sentences=n, highlights=2, bullets=3, images=max(1, n // 50))
+        for n in (int(s) for s in args.sentences.split(",") if s.strip())
+    }
+    if args.real:
+        for path in gw.story_paths():
+            data = gw.parse_story(path.read_bytes(), path.name)
+            if data is not None:
+                stories[path.stem] = data
+
+    node = shutil.which("node")
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = []
+        files = []
+        for name, story in stories.items():
+            texts = payloads(story)
+            sizes = {fmt: (len(t.encode("utf-8")), len(gzip.compress(t.encode("utf-8"), 9))) for fmt, t in texts.items()}
+            verbose, columns = Path(tmp) / f"{name}.json", Path(tmp) / f"{name}.columns.json"
+            verbose.write_text(texts["json-min"], encoding="utf-8")
+            columns.write_text(texts["columns-min"], encoding="utf-8")
+            files += [verbose, columns]
+            rows.append((name, texts, sizes))
+        parse = {}
+        if node:
+            out = subprocess.run(
+                ["node", str(HERE / "payload_harness.js"), *map(str, files), "--repeat", str(args.repeat)],
+                check=True, capture_output=True, text=True,
+            )
+            parse = json.loads(out.stdout)
+
+        print(f"{'story':<26} {'format':<12} {'KB':>8} {'gzip KB':>8} {'vs json':>8} {'gz vs json':>10} {'parse ms':>9} {'decode ms':>10}")
+        mismatched = []
+        for name, texts, sizes in rows:
+            base, base_gz = sizes["json"]
+            for fmt, (raw, gz) in sizes.items():
+                if node and fmt.endswith("-min"):
+                    r = parse[f"{name}.columns.json" if fmt.startswith("columns") else f"{name}.json"]
+                    ms, decode = f"{r['literalMs']:9.3f}", f"{r['decodeAllMs']:10.3f}" if "decodeAllMs" in r else ""
+                    if r.get("matchesVerbose") is False:
+                        mismatched.append(name)
+                elif not node:
+                    ms, decode = f"{python_parse_ms(texts[fmt], args.repeat):9.3f}", ""
+                else:
+                    ms, decode = "", ""
+                print(
+                    f"{name[:26]:<26} {fmt:<12} {raw / 1024:8.1f} {gz / 1024:8.1f} {raw / base:8.0%} {gz / base_gz:10.0%} "
+                    f"{ms:>9} {decode:>10}"
+                )
+        if not node:
+            print("(node not found: parse times are Python json.loads)")
+        else:
+            print("parse ms: evaluating the embedded object literal (best of --repeat); decode ms: every item and the glossary")
+        if mismatched:
+            print("Decoded columns differ from the story JSON for:", ", ".join(mismatched))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Build-pipeline benchmark over synthetic catalogs (benchmarks/synthetic.py), by default at
+10, 1,000 and 50,000 stories. Each catalog is measured in its own process, started in a
+temporary copy of the generator's code (root *.py, web/, schemas/, benchmarks/) so every
+output and cache lands in the copy and the repository is left untouched. Every stage is
+timed (wall and CPU) and re-run under tracemalloc for its peak Python memory:
+  load_stories, build_manifest, story_page_html (every story), write_story_pages,
+  build (cold, warm with no changes, one story edited), build_manifest_only,
+  compress_image (when Pillow is installed; synthetic line-art PNGs)
+Runs offline. Results go to a JSON file (default benchmarks/results/pipeline-<time>.json);
+--compare OLD.json prints each stage's change against an earlier run.
+Usage: python3 benchmarks/bench_pipeline.py [--sizes 10,1000,50000] [--sentences N]
+           [--highlights N] [--bullets N] [--images N] [--no-memory] [--out FILE] [--compare FILE]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+import generate_web as gw  # noqa: E402
+from synthetic import synthetic_story  # noqa: E402
+
+RESULTS_DIR = HERE / "results"
+# What copy_code() copies besides the root *.py modules.
+CODE_DIRS = ("web", "schemas", "benchmarks")
+
+
+def copy_code(dest: Path) -> None:
+    """Copy the generator's code into dest, with empty stories/ and images/ folders. Every
+    module derives its paths from its own location, so the copy reads and writes only dest."""
+    for path in HERE.parent.glob("*.py"):
+        shutil.copy2(path, dest / path.name)
+    for name in CODE_DIRS:
+        shutil.copytree(HERE.parent / name, dest / name, ignore=shutil.ignore_patterns("results", "__pycache__"))
+    for name in ("stories", "images"):
+        (dest / name).mkdir()
+
+
+def write_catalog(count: int, args) -> int:
+    """Write count synthetic stories to gw.STORIES_DIR. Returns total bytes."""
+    total = 0
+    for i in range(count):
+        story = synthetic_story(
+            seed=i, sentences=args.sentences, highlights=args.highlights, bullets=args.bullets, images=args.story_images,
+        )
+        text = json.dumps(story, ensure_ascii=False, indent=2)
+        (gw.STORIES_DIR / f"synthetic_{i:06d}.json").write_text(text, encoding="utf-8")
+        total += len(text.encode("utf-8"))
+    return total
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime
+
+
+def measure(fn, setup=None, memory: bool = True) -> dict:
+    """Time fn() once; then, if memory, run setup() and fn() again under tracemalloc."""
+    if setup:
+        setup()
+    cpu, start = cpu_seconds(), time.perf_counter()
+    fn()
+    result = {"seconds": round(time.perf_counter() - start, 4), "cpu_seconds": round(cpu_seconds() - cpu, 4)}
+    if memory:
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            fn()
+            result["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def clean_outputs() -> None:
+    """Back to a cold build: no cache and no generated pages."""
+    gw.BUILD_CACHE_PATH.unlink(missing_ok=True)
+    shutil.rmtree(gw.STORY_OUTPUT_DIR, ignore_errors=True)
+    shutil.rmtree(gw.MANIFEST_DIR, ignore_errors=True)
+    gw.MANIFEST_DIR.mkdir()
+    (gw.ROOT / "index.html").unlink(missing_ok=True)
+
+
+def edit_one_story() -> None:
+    """Change one story's title so exactly one page and one manifest shard go stale."""
+    path = gw.story_paths()[0]
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["title"] = f"Edited {time.perf_counter_ns()}"
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def compress_stage(root: Path, count: int, memory: bool) -> dict:
+    """Time compress_images.compress_image over synthetic line-art PNGs; skipped without Pillow."""
+    try:
+        from PIL import Image, ImageDraw
+
+        import compress_images
+    except ImportError as e:
+        return {"skipped": f"{e}"}
+    folder = root / "images"
+    folder.mkdir(exist_ok=True)
+    rng = random.Random(0)
+    paths = []
+
+    def make_images():
+        paths.clear()
+        for i in range(count):
+            img = Image.new("RGBA", (1536, 864), (255, 255, 255, 0))
+            draw = ImageDraw.Draw(img)
+            for _ in range(200):
+                xy = [rng.randrange(1536), rng.randrange(864), rng.randrange(1536), rng.randrange(864)]
+                draw.line(xy, fill=(0, 0, 0, 255), width=rng.randint(1, 4))
+            path = folder / f"synthetic_{i}.png"
+            img.save(path)
+            paths.append(path)
+
+    result = measure(lambda: [compress_images.compress_image(p) for p in paths], make_images, memory)
+    result["images"] = count
+    return result
+
+
+def measure_catalog(count: int, args) -> dict:
+    """Write the catalog and time every stage; runs in the copy made by run_size()."""
+    started = time.perf_counter()
+    for d in (gw.STORY_OUTPUT_DIR, gw.MANIFEST_DIR, gw.ASSETS_DIR):
+        d.mkdir(parents=True, exist_ok=True)
+    catalog_bytes = write_catalog(count, args)
+    print(f"{count} stories ({catalog_bytes / 2**20:.1f} MB) written in {time.perf_counter() - started:.1f} s")
+    stages = {}
+    memory = args.memory
+    holder = {}
+
+    def load():
+        holder["stories"] = gw.load_stories()
+
+    stages["load_stories"] = measure(load, memory=memory)
+    stories = holder["stories"]
+    stages["build_manifest"] = measure(lambda: gw.build_manifest(stories), memory=memory)
+    stages["story_page_html"] = measure(
+        lambda: [gw.story_page_html(data, gw.slugify(sid)) for sid, data in stories.items()], memory=memory,
+    )
+    stages["write_story_pages"] = measure(lambda: gw.write_story_pages(stories), clean_outputs, memory)
+    del stories, holder["stories"]
+    stages["build_cold"] = measure(lambda: gw.build(jobs=args.jobs), clean_outputs, memory)
+    stages["build_warm"] = measure(lambda: gw.build(jobs=args.jobs), memory=memory)
+    stages["build_one_edited"] = measure(lambda: gw.build(jobs=args.jobs), edit_one_story, memory)
+    stages["build_manifest_only"] = measure(gw.build_manifest_only, memory=memory)
+    stages["compress_image"] = compress_stage(gw.ROOT, args.images, memory)
+    for name, r in stages.items():
+        if "skipped" in r:
+            print(f"  {name:<20} skipped ({r['skipped']})")
+        else:
+            mem = f"{r['peak_mb']:9.1f} MB" if "peak_mb" in r else ""
+            print(f"  {name:<20} {r['seconds']:9.3f} s  cpu {r['cpu_seconds']:9.3f} s {mem}")
+    return {
+        "stories": count, "catalog_bytes": catalog_bytes, "stages": stages,
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_size(count: int, args) -> dict:
+    """Measure one catalog size in a child process started in a temporary copy of the code."""
+    with tempfile.TemporaryDirectory(prefix="bench-pipeline-") as tmp:
+        root = Path(tmp)
+        copy_code(root)
+        result = root / "result.json"
+        cmd = [
+            sys.executable, str(root / "benchmarks" / Path(__file__).name), "--worker", str(count),
+            "--result", str(result), "--sentences", str(args.sentences), "--highlights", str(args.highlights),
+            "--bullets", str(args.bullets), "--story-images", str(args.story_images), "--images", str(args.images),
+            "--jobs", str(args.jobs),
+        ] + ([] if args.memory else ["--no-memory"])
+        subprocess.run(cmd, cwd=root, check=True)
+        return json.loads(result.read_text(encoding="utf-8"))
+
+
+def git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=HERE.parent, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(current: dict, old_path: Path) -> None:
+    old = json.loads(old_path.read_text(encoding="utf-8"))
+    old_runs = {r["stories"]: r for r in old.get("runs", [])}
+    print(f"Compared with {old_path} ({old.get('meta', {}).get('commit') or 'unknown commit'}):")
+    for run in current["runs"]:
+        before = old_runs.get(run["stories"])
+        if not before:
+            continue
+        for name, r in run["stages"].items():
+            b = before["stages"].get(name)
+            if not b or "seconds" not in b or "seconds" not in r or not b["seconds"]:
+                continue
+            ratio = r["seconds"] / b["seconds"]
+            flag = "  <-- slower" if ratio > 1.2 else ""
+            print(f"  {run['stories']:>6} {name:<20} {b['seconds']:9.3f} s -> {r['seconds']:9.3f} s ({ratio:5.2f}x){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time generate_web.py stages over synthetic catalogs.")
+    parser.add_argument("--sizes", default="10,1000,50000", help="comma-separated story counts")
+    parser.add_argument("--sentences", type=int, default=40, help="sentences per story")
+    parser.add_argument("--highlights", type=int, default=1, help="highlights per sentence")
+    parser.add_argument("--bullets", type=int, default=3, help="detailedTranslation lines per sentence")
+    parser.add_argument("--story-images", type=int, default=3, help="image blocks per story")
+    parser.add_argument("--images", type=int, default=10, help="PNGs for the compress_image stage")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="worker processes for the build stages")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc re-runs")
+    parser.add_argument("--out", type=Path, help="results file (default benchmarks/results/pipeline-<time>.json)")
+    parser.add_argument("--compare", type=Path, metavar="OLD.json", help="print changes against an earlier results file")
+    parser.add_argument("--worker", type=int, metavar="N", help=argparse.SUPPRESS)  # run_size()'s child process
+    parser.add_argument("--result", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker is not None:
+        args.result.write_text(json.dumps(measure_catalog(args.worker, args), default=str), encoding="utf-8")
+        return
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    now = datetime.now(timezone.utc)
+    results = {
+        "meta": {
+            "date": now.isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "settings": {k: v for k, v in vars(args).items() if k not in ("out", "compare", "worker", "result")},
+        },
+        "runs": [],
+    }
+    for count in sizes:
+        results["runs"].append(run_size(count, args))
+    results["meta"]["max_rss_mb"] = max(run["max_rss_mb"] for run in results["runs"]) if results["runs"] else 0
+
+    out = args.out or RESULTS_DIR / f"pipeline-{now.strftime('%Y%m%d-%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(results, indent=1, default=str), encoding="utf-8")
+    print(f"Results written to {out}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Generated-page benchmark: renders a synthetic story (2,000 sentences by default) as a
+prerendered page and as --client-render pages (story JSON, and --compact-payload columns),
+then times each in the headless Node harness (benchmarks/page_harness.js): initial script
+run, sentence clicks, and toggles.
+Extra pages (e.g. from an older build) can be compared with --html.
+Usage: python3 benchmarks/bench_story_page.py [--sentences N] [--clicks N] [--html page.html ...]
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+import generate_web as gw  # noqa: E402
+from synthetic import synthetic_story  # noqa: E402
+
+
+def run_harness(page: Path, clicks: int, toggles: int) -> dict:
+    out = subprocess.run(
+        ["node", str(HERE / "page_harness.js"), str(page), "--clicks", str(clicks), "--toggles", str(toggles)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time generated story pages in a headless DOM harness.")
+    parser.add_argument("--sentences", type=int, default=2000)
+    parser.add_argument("--clicks", type=int, default=200, help="sentences clicked (each twice)")
+    parser.add_argument("--toggles", type=int, default=20, help="checkbox flips per toggle")
+    parser.add_argument("--html", nargs="*", default=[], help="additional page files to time")
+    args = parser.parse_args()
+
+    if not shutil.which("node"):
+        print("node is required for the page harness")
+        sys.exit(1)
+
+    story = synthetic_story(seed=7, sentences=args.sentences, highlights=2, bullets=4, images=40)
+    with tempfile.TemporaryDirectory() as tmp:
+        pages = {}
+        variants = (
+            ("prerender", gw.PageOptions(inline_assets=True)),
+            ("client-render", gw.PageOptions(client_render=True, inline_assets=True)),
+            ("client-columns", gw.PageOptions(client_render=True, compact_payload=True, inline_assets=True)),
+        )
+        for name, options in variants:
+            path = Path(tmp) / f"{name}.html"
+            path.write_text(gw.story_page_html(story, "synthetic", options), encoding="utf-8")
+            pages[name] = path
+        for extra in args.html:
+            pages[extra] = Path(extra)
+
+        print(f"{args.sentences} sentences, {args.clicks} sentences clicked twice, {args.toggles} toggles")
+        print(f"{'page':<16} {'KB':>7} {'script ms':>10} {'click ms':>9} {'toggle ms':>10} {'nodes/click':>12}")
+        for name, path in pages.items():
+            r = run_harness(path, args.clicks, args.toggles)
+            per_click = r["nodesCreatedByInteraction"] / max(1, 2 * args.clicks)
+            print(
+                f"{name:<16} {path.stat().st_size / 1024:7.0f} {r['scriptMs']:10.2f} {r['clickMs']:9.4f} "
+                f"{r['toggleMs']:10.4f} {per_click:12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
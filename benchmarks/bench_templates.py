@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-page cost of filling the story page template.
+Compares the old str.replace-per-placeholder loop with the compiled single-join
+renderer in generate_web.py, over every story in stories/.
+Usage: python3 benchmarks/bench_templates.py [--repeat N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_web as gw  # noqa: E402
+
+
+def replace_loop(template: str, values: dict) -> str:
+    """The pre-compilation renderer: one full copy and rescan per placeholder."""
+    html = template
+    for k, v in values.items():
+        html = html.replace(k, v)
+    return html
+
+
+def page_values(story: dict, slug: str) -> dict:
+    """The slot values story_page_html() fills the story template with, captured from a real
+    render so the benchmark follows the template's current slots."""
+    captured = {}
+    render = gw.render_template
+
+    def capture(compiled: tuple, values: dict) -> str:
+        if compiled is gw._STORY_PAGE:
+            captured.update(values)
+        return render(compiled, values)
+
+    gw.render_template = capture
+    try:
+        gw.story_page_html(story, slug)
+    finally:
+        gw.render_template = render
+    return captured
+
+
+def time_per_page(fn, pages: list, repeat: int) -> float:
+    """Best-of-repeat average seconds per page."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for values in pages:
+            fn(values)
+        best = min(best, (time.perf_counter() - start) / len(pages))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="timing rounds (best is reported)")
+    args = parser.parse_args()
+
+    stories = gw.load_stories()
+    if not stories:
+        print("No story JSONs found in stories/")
+        return
+    pages = [page_values(story, gw.slugify(sid)) for sid, story in stories.items()]
+    for values in pages:
+        assert replace_loop(gw._STORY_PAGE_TEMPLATE, values) == gw.render_template(gw._STORY_PAGE, values)
+
+    before = time_per_page(lambda v: replace_loop(gw._STORY_PAGE_TEMPLATE, v), pages, args.repeat)
+    after = time_per_page(lambda v: gw.render_template(gw._STORY_PAGE, v), pages, args.repeat)
+    print(f"{len(pages)} stories, best of {args.repeat} rounds")
+    print(f"replace loop:      {before * 1e6:8.1f} µs/page")
+    print(f"compiled template: {after * 1e6:8.1f} µs/page  ({before / after:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
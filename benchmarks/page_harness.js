@@ -0,0 +1,249 @@
+#!/usr/bin/env node
+// Headless timing harness for generated story pages.
+// Loads a page into a minimal DOM (enough for the generated markup and page scripts),
+// runs its scripts (inline, or linked files resolved next to the page), then times
+// sentence clicks and translation toggles.
+// Prints one JSON object: script run time, per-click and per-toggle times, DOM nodes created.
+// Usage: node benchmarks/page_harness.js story.html [--clicks N] [--toggles N]
+'use strict';
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const stats = { nodesCreated: 0 };
+const VOID = new Set(['img', 'input', 'br', 'meta', 'link', 'hr', 'path', 'circle']);
+
+class Node {
+  constructor() { this.childNodes = []; this.parentNode = null; stats.nodesCreated++; }
+  appendChild(child) {
+    if (child instanceof Fragment) {
+      const kids = child.childNodes;
+      child.childNodes = [];
+      kids.forEach((k) => this.appendChild(k));
+      return child;
+    }
+    if (child.parentNode) child.parentNode.removeChild(child);
+    child.parentNode = this;
+    this.childNodes.push(child);
+    return child;
+  }
+  removeChild(child) {
+    const i = this.childNodes.indexOf(child);
+    if (i >= 0) this.childNodes.splice(i, 1);
+    child.parentNode = null;
+    return child;
+  }
+  get textContent() { return this.childNodes.map((c) => c.textContent).join(''); }
+  set textContent(s) { this.childNodes = []; if (s !== '') this.appendChild(new Text(String(s))); }
+}
+
+class Text extends Node {
+  constructor(data) { super(); this.data = data; }
+  get textContent() { return this.data; }
+  set textContent(s) { this.data = String(s); }
+}
+
+class Fragment extends Node {}
+
+function escapeText(s) {
+  return s.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+function unescapeText(s) {
+  return s.replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&quot;/g, '"').replace(/&#x27;/g, "'").replace(/&amp;/g, '&');
+}
+
+class Element extends Node {
+  constructor(tag) {
+    super();
+    this.tagName = tag.toUpperCase();
+    this.attributes = {};
+    this.dataset = {};
+    this.style = {};
+    this.listeners = {};
+    this.checked = false;
+    const classes = new Set();
+    this._classes = classes;
+    this.classList = {
+      add: (c) => classes.add(c),
+      remove: (c) => classes.delete(c),
+      contains: (c) => classes.has(c),
+      toggle: (c, force) => {
+        const on = force === undefined ? !classes.has(c) : !!force;
+        if (on) classes.add(c); else classes.delete(c);
+        return on;
+      },
+    };
+  }
+  get className() { return Array.from(this._classes).join(' '); }
+  set className(s) { this._classes.clear(); String(s).split(/\s+/).filter(Boolean).forEach((c) => this._classes.add(c)); }
+  get id() { return this.attributes.id || ''; }
+  setAttribute(name, value) {
+    value = String(value);
+    this.attributes[name] = value;
+    if (name === 'class') this.className = value;
+    else if (name === 'checked') this.checked = true;
+    else if (name.startsWith('data-')) {
+      this.dataset[name.slice(5).replace(/-([a-z])/g, (m, c) => c.toUpperCase())] = value;
+    }
+  }
+  get innerHTML() {
+    return this.childNodes.map((c) => (c instanceof Text ? escapeText(c.data) : c.outerHTML)).join('');
+  }
+  set innerHTML(s) {
+    this.childNodes = [];
+    parseInto(this, String(s));
+  }
+  get outerHTML() {
+    const tag = this.tagName.toLowerCase();
+    const cls = this.className ? ` class="${this.className}"` : '';
+    return `<${tag}${cls}>${this.innerHTML}</${tag}>`;
+  }
+  matches(sel) { return sel.startsWith('.') ? this._classes.has(sel.slice(1)) : this.tagName === sel.toUpperCase(); }
+  closest(sel) {
+    for (let n = this; n instanceof Element; n = n.parentNode) if (n.matches(sel)) return n;
+    return null;
+  }
+  querySelectorAll(sel) {
+    const out = [];
+    (function walk(n) {
+      n.childNodes.forEach((c) => { if (c instanceof Element) { if (c.matches(sel)) out.push(c); walk(c); } });
+    })(this);
+    return out;
+  }
+  addEventListener(type, fn) { (this.listeners[type] = this.listeners[type] || []).push(fn); }
+}
+
+// Tokenizer for the well-formed markup the generator emits (no comments or CDATA).
+function parseInto(root, html) {
+  const re = /<(\/?)([a-zA-Z][a-zA-Z0-9]*)((?:\s+[^\s=>\/]+(?:="[^"]*")?)*)\s*(\/?)>|<!DOCTYPE[^>]*>|([^<]+)/g;
+  let cur = root;
+  let m;
+  while ((m = re.exec(html))) {
+    if (m[5] !== undefined) { cur.appendChild(new Text(unescapeText(m[5]))); continue; }
+    if (!m[2]) continue;
+    const tag = m[2].toLowerCase();
+    if (m[1]) {
+      for (let n = cur; n && n !== root.parentNode; n = n.parentNode) {
+        if (n.tagName === tag.toUpperCase()) { cur = n.parentNode; break; }
+      }
+      continue;
+    }
+    const el = new Element(tag);
+    const attrRe = /([^\s=>\/]+)(?:="([^"]*)")?/g;
+    let a;
+    while ((a = attrRe.exec(m[3]))) el.setAttribute(a[1], unescapeText(a[2] === undefined ? '' : a[2]));
+    cur.appendChild(el);
+    if (tag === 'script' || tag === 'style') {
+      const close = html.indexOf('</' + tag, re.lastIndex);
+      el.textContent = html.slice(re.lastIndex, close);
+      re.lastIndex = html.indexOf('>', close) + 1;
+    } else if (!VOID.has(tag) && !m[4]) {
+      cur = el;
+    }
+  }
+}
+
+function dispatch(target, type) {
+  const event = { type, target, defaultPrevented: false, preventDefault() { this.defaultPrevented = true; } };
+  for (let n = target; n; n = n.parentNode) (n.listeners && n.listeners[type] || []).forEach((fn) => fn.call(n, event));
+}
+
+function load(html, dir) {
+  const doc = new Element('#document');
+  parseInto(doc, html);
+  const [htmlEl] = doc.querySelectorAll('html');
+  const [body] = doc.querySelectorAll('body');
+  const byId = (id) => {
+    let found = null;
+    (function walk(n) { for (const c of n.childNodes) { if (found) return; if (c instanceof Element) { if (c.id === id) found = c; else walk(c); } } })(doc);
+    return found;
+  };
+  const document = {
+    body, documentElement: htmlEl,
+    getElementById: byId,
+    createElement: (t) => new Element(t),
+    createTextNode: (s) => new Text(String(s)),
+    createDocumentFragment: () => new Fragment(),
+    querySelectorAll: (sel) => doc.querySelectorAll(sel),
+    addEventListener() {},
+  };
+  const store = {};
+  const sandbox = {
+    document,
+    localStorage: { getItem: (k) => (k in store ? store[k] : null), setItem: (k, v) => { store[k] = String(v); } },
+    location: { protocol: 'file:', href: 'file:///story/index.html' },
+    navigator: {},
+    addEventListener() {},
+    requestAnimationFrame: (fn) => setTimeout(fn, 0),
+    getComputedStyle: () => ({}),
+    console,
+    Set, Map, JSON, Math, Object, Array, String, Number, parseInt, parseFloat, setTimeout,
+  };
+  sandbox.window = sandbox;
+  sandbox.self = sandbox;
+  vm.createContext(sandbox);
+  const scripts = doc.querySelectorAll('script');
+  const start = process.hrtime.bigint();
+  for (const s of scripts) {
+    const code = s.attributes.src ? fs.readFileSync(path.resolve(dir, s.attributes.src), 'utf8') : s.textContent;
+    vm.runInContext(code, sandbox);
+  }
+  const scriptMs = Number(process.hrtime.bigint() - start) / 1e6;
+  return { document, scriptMs };
+}
+
+function timeEach(items, fn) {
+  if (!items.length) return 0;
+  const start = process.hrtime.bigint();
+  items.forEach(fn);
+  return Number(process.hrtime.bigint() - start) / 1e6 / items.length;
+}
+
+function main() {
+  const args = process.argv.slice(2);
+  const opt = (name, dflt) => { const i = args.indexOf(name); return i >= 0 ? parseInt(args[i + 1], 10) : dflt; };
+  const file = args.find((a) => !a.startsWith('--') && !/^\d+$/.test(a));
+  if (!file) { console.error('Usage: node page_harness.js story.html [--clicks N] [--toggles N]'); process.exit(2); }
+  const clicks = opt('--clicks', 200);
+  const toggles = opt('--toggles', 20);
+
+  const parseStart = process.hrtime.bigint();
+  stats.nodesCreated = 0;
+  const { document, scriptMs } = load(fs.readFileSync(file, 'utf8'), path.dirname(file));
+  const loadMs = Number(process.hrtime.bigint() - parseStart) / 1e6;
+  const nodesAfterLoad = stats.nodesCreated;
+
+  const content = document.getElementById('content');
+  const blocks = content.querySelectorAll('.sentence-block');
+  const step = Math.max(1, Math.floor(blocks.length / Math.max(1, clicks)));
+  // Click each block's text (or a highlight inside it) twice: expand, then collapse again.
+  const targets = [];
+  for (let i = 0; i < blocks.length && targets.length < clicks; i += step) {
+    const text = blocks[i].querySelectorAll('.text')[0];
+    targets.push(text.querySelectorAll('.hl')[0] || text);
+  }
+  const before = stats.nodesCreated;
+  const clickMs = timeEach(targets.concat(targets), (t) => dispatch(t, 'click'));
+  const expanded = blocks.filter((b) => b.classList.contains('show-translation')).length;
+
+  const showAll = document.getElementById('showTranslations');
+  const showDetailed = document.getElementById('showDetailedTranslation');
+  const flips = Array.from({ length: toggles }, (_, i) => i);
+  const toggleMs = timeEach(flips, () => { showAll.checked = !showAll.checked; dispatch(showAll, 'change'); });
+  const detailedMs = timeEach(flips, () => { showDetailed.checked = !showDetailed.checked; dispatch(showDetailed, 'change'); });
+
+  console.log(JSON.stringify({
+    file,
+    sentences: blocks.length,
+    loadMs: +loadMs.toFixed(3),
+    scriptMs: +scriptMs.toFixed(3),
+    clickMs: +clickMs.toFixed(4),
+    toggleMs: +toggleMs.toFixed(4),
+    detailedToggleMs: +detailedMs.toFixed(4),
+    nodesAfterLoad,
+    nodesCreatedByInteraction: stats.nodesCreated - before,
+    expandedAfterClicks: expanded,
+  }));
+}
+
+main();
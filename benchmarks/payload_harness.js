@@ -0,0 +1,68 @@
+#!/usr/bin/env node
+// Parse-time harness for embedded story payloads (bench_payload.py).
+// For each file: JSON.parse, and evaluation as the object literal pages embed, best of
+// --repeat runs. Files named *.columns.json are also decoded item by item with
+// web/story-columns.js and checked against the matching *.json story.
+// Prints one JSON object keyed by file.
+// Usage: node benchmarks/payload_harness.js a.json a.columns.json ... [--repeat N]
+'use strict';
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const args = process.argv.slice(2);
+const r = args.indexOf('--repeat');
+const repeat = r >= 0 ? parseInt(args[r + 1], 10) : 20;
+const files = args.filter((a, i) => !a.startsWith('--') && args[i - 1] !== '--repeat');
+
+const sandbox = { window: {} };
+vm.createContext(sandbox);
+vm.runInContext(fs.readFileSync(path.join(__dirname, '..', 'web', 'story-columns.js'), 'utf8'), sandbox);
+const decode = sandbox.window.decodeStoryColumns;
+
+function best(fn) {
+  let min = Infinity;
+  for (let i = 0; i < repeat; i++) {
+    const start = process.hrtime.bigint();
+    fn();
+    min = Math.min(min, Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  return +min.toFixed(4);
+}
+
+// The verbose item as the page reads it: highlight text is not used, so it is not compared.
+function expected(item) {
+  if (item.type === 'image') return { type: 'image', filename: item.filename, generation_prompt: item.generation_prompt };
+  if (item.type !== 'sentence') return {};
+  return {
+    type: 'sentence', text: item.text, translation: item.translation,
+    detailedTranslation: item.detailedTranslation || [],
+    highlights: (item.highlights || []).map((h) => ({ startIndex: h.startIndex || 0, endIndex: h.endIndex || 0, glossaryKey: h.glossaryKey })),
+  };
+}
+
+const out = {};
+for (const file of files) {
+  const text = fs.readFileSync(file, 'utf8');
+  const result = {
+    jsonParseMs: best(() => JSON.parse(text)),
+    literalMs: best(() => vm.runInContext('(' + text + ')', sandbox)),
+  };
+  if (file.endsWith('.columns.json')) {
+    const payload = JSON.parse(text);
+    result.decodeAllMs = best(() => {
+      const story = decode(payload);
+      for (let i = 0; i < story.count; i++) story.item(i);
+      story.glossary();
+    });
+    const verbose = JSON.parse(fs.readFileSync(file.replace(/\.columns\.json$/, '.json'), 'utf8'));
+    const story = decode(payload);
+    const items = [];
+    for (let i = 0; i < story.count; i++) items.push(story.item(i));
+    const same = JSON.stringify(items) === JSON.stringify((verbose.content || []).map(expected))
+      && JSON.stringify(story.glossary()) === JSON.stringify(verbose.glossary);
+    result.matchesVerbose = same;
+  }
+  out[path.basename(file)] = result;
+}
+console.log(JSON.stringify(out));
@@ -0,0 +1,81 @@
+"""
+Synthetic stories matching schemas/story.schema.json, for benchmarks.
+Stories are deterministic for a given seed, with configurable sentence, highlight,
+bullet and image counts.
+"""
+import random
+
+WORDS = (
+    "el la los las un una casa perro gato playa mar sol luna calle coche tren amigo amiga "
+    "fiesta silla mesa noche día mañana tarde ciudad pueblo montaña nieve río año vida "
+    "comer beber hablar vivir conducir alquilar escuchar bailar cantar volver salir llegar "
+    "rápido lento grande pequeño feliz triste raro nuevo viejo bonito caro barato "
+    "siempre nunca luego ahora también pero porque cuando donde mientras"
+).split()
+LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+TAGS = ("Grammar", "Vocabulary", "Themes", "Culture", "Music", "Travel")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def synthetic_story(
+    seed: int = 0,
+    sentences: int = 40,
+    highlights: int = 1,
+    bullets: int = 3,
+    images: int = 3,
+) -> dict:
+    """One story dict: sentences with `highlights` glossary-linked spans and `bullets`
+    detailedTranslation lines each, plus `images` image blocks spread through the content."""
+    rng = random.Random(seed)
+    prefix = f"synthetic_{seed}"
+    glossary = {}
+    content = []
+    image_every = max(1, sentences // images) if images else 0
+    placed = 0
+    for i in range(sentences):
+        text = _sentence(rng, rng.randint(6, 16))
+        item = {
+            "type": "sentence",
+            "text": text,
+            "translation": _sentence(rng, rng.randint(6, 16)),
+            "detailedTranslation": [f"{rng.choice(WORDS)} — {_sentence(rng, 5)}" for _ in range(bullets)],
+        }
+        spans = []
+        pos = 0
+        for _ in range(highlights):
+            start = text.find(" ", pos) + 1
+            if start <= 0:
+                break
+            end = text.find(" ", start)
+            if end < 0:
+                end = len(text) - 1
+            if end <= start:
+                break
+            word = text[start:end]
+            glossary.setdefault(word, {"translation": rng.choice(WORDS), "explanation": _sentence(rng, 10)})
+            spans.append({"startIndex": start, "endIndex": end, "text": word, "glossaryKey": word})
+            pos = end
+        if spans:
+            item["highlights"] = spans
+        content.append(item)
+        if image_every and (i + 1) % image_every == 0 and placed < images:
+            placed += 1
+            content.append({
+                "type": "image",
+                "filename": f"{prefix}_{i}.png",
+                "generation_prompt": _sentence(rng, 12),
+            })
+    return {
+        "title": _sentence(rng, 4).rstrip("."),
+        "titleTranslation": _sentence(rng, 4).rstrip("."),
+        "level": rng.choice(LEVELS),
+        "language": "es",
+        "thumbnail": {"filename": f"{prefix}_thumbnail.png", "generation_prompt": _sentence(rng, 12)},
+        "tags": [{"name": t, "description": _sentence(rng, 6)} for t in rng.sample(TAGS, 3)],
+        "content": content,
+        "glossary": glossary,
+    }
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Precomputed listing pages for each CEFR level and each category (a story's first tag), so
+learners can browse level/B1/ or category/grammar/ without loading the whole manifest:
+  level/index.json, category/index.json   every value with its name, story count and page
+  <facet>/<value>/index.html              the index grid over that value's stories
+  <facet>/<value>/NNNN.json, index.json   its manifest shards (.js twins for file://), as in manifest/
+index.html and every listing page link all values (index.html with their counts).
+Updates are incremental: the build cache keeps a digest of each value's stories, so only the
+listings a changed story belongs to are rewritten (all of them when a value appears or goes
+away, since every page links the full list), and listings of values no story has any more
+are removed. Written by generate_web.py with the manifest, and by watch.py per change.
+"""
+import re
+import shutil
+import unicodedata
+from html import escape as escape_html
+
+from generate_web import (
+    MANIFEST_SHARD_SIZE, ROOT, PageOptions, json_text, listing_page_html, sha256_hex,
+    write_if_changed, write_manifest_shards,
+)
+
+# Facet folder: the manifest entry field it groups stories by.
+FACETS = {"level": "level", "category": "category"}
+FACET_LABELS = {"level": "Levels", "category": "Categories"}
+# Levels are listed in this order, any others after them alphabetically.
+CEFR_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def facet_slug(facet: str, value: str) -> str:
+    """Folder name of a facet value: level "b1" -> "B1", category "Gramática básica" -> "gramatica-basica"."""
+    ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    slug = _SLUG_RE.sub("-", ascii_value.lower()).strip("-")
+    return slug.upper() if facet == "level" else slug
+
+
+def _value_order(facet: str, slug: str) -> tuple:
+    if facet == "level" and slug in CEFR_LEVELS:
+        return 0, CEFR_LEVELS.index(slug), slug
+    return 1, 0, slug
+
+
+def facet_groups(manifest: list) -> dict:
+    """{facet: {slug: {"name", "entries"}}} with values in listing order and entries in manifest
+    order. Stories without a level or category are only left out of that facet."""
+    groups = {}
+    for facet, field in FACETS.items():
+        values = {}
+        for entry in manifest:
+            name = (entry.get(field) or "").strip()
+            slug = facet_slug(facet, name) if name else ""
+            if slug:
+                group = values.setdefault(slug, {"name": slug if facet == "level" else name, "entries": []})
+                group["entries"].append(entry)
+        groups[facet] = dict(sorted(values.items(), key=lambda kv: _value_order(facet, kv[0])))
+    return groups
+
+
+def facet_nav_html(groups: dict, root: str, counts: bool = False, current: tuple = None) -> str:
+    """Links to every listing page, one row per facet; root is the path to the site root.
+    current (facet, slug) marks the page's own link."""
+    rows = []
+    for facet, values in groups.items():
+        if not values:
+            continue
+        links = []
+        for slug, group in values.items():
+            attrs = ' aria-current="page"' if current == (facet, slug) else ""
+            count = f' <span class="count">{len(group["entries"])}</span>' if counts else ""
+            links.append(f'<a href="{root}{facet}/{slug}/index.html"{attrs}>{escape_html(group["name"])}{count}</a>')
+        rows.append(f'<p><span class="facet-label">{FACET_LABELS[facet]}</span> {" ".join(links)}</p>')
+    return f'<nav class="facets" aria-label="Browse stories">{"".join(rows)}</nav>' if rows else ""
+
+
+def index_nav_html(manifest: list) -> str:
+    """The facet links index.html shows, with story counts."""
+    return facet_nav_html(facet_groups(manifest), "", counts=True)
+
+
+def listing_text(facet: str, group: dict) -> tuple[str, str]:
+    """(heading, summary) of a listing page."""
+    count = len(group["entries"])
+    stories = f"{count} {'story' if count == 1 else 'stories'}"
+    if facet == "level":
+        return f"Level {group['name']} stories", f"{stories} for Spanish learners at CEFR level {group['name']}."
+    return f"{group['name']} stories", f"{stories} tagged {group['name']}."
+
+
+def listing_html(facet: str, slug: str, groups: dict, root: dict, options: PageOptions = PageOptions()) -> str:
+    """The listing page of one facet value, over its manifest shards (root: their root index)."""
+    group = groups[facet][slug]
+    heading, summary = listing_text(facet, group)
+    nav = facet_nav_html(groups, "../../", current=(facet, slug))
+    return listing_page_html(heading, summary, nav, root, group["entries"][:MANIFEST_SHARD_SIZE], options)
+
+
+def facet_digest(facet: str, slug: str, groups: dict) -> str:
+    """Digest of everything a listing writes: its stories, sharding and the linked values."""
+    linked = [[f, list(values)] for f, values in groups.items()]
+    data = [MANIFEST_SHARD_SIZE, facet, slug, groups[facet][slug], linked]
+    return sha256_hex(json_text(data, PageOptions(minify=True)).encode("utf-8"))
+
+
+def update_facets(manifest: list, cache: dict, options: PageOptions = PageOptions()) -> dict:
+    """Write the listings whose digest differs from cache["facets"] (or whose page is missing),
+    the per-facet index.json files, and remove listings of values that are gone.
+    Records the new digests in cache. Returns {values, written, removed}."""
+    groups = facet_groups(manifest)
+    old = cache.get("facets") or {}
+    digests = {}
+    written = removed = 0
+    for facet, values in groups.items():
+        folder = ROOT / facet
+        for slug in values:
+            key = f"{facet}/{slug}"
+            digests[key] = facet_digest(facet, slug, groups)
+            if digests[key] == old.get(key) and (folder / slug / "index.html").is_file():
+                continue
+            root = write_manifest_shards(values[slug]["entries"], options, folder / slug)
+            write_if_changed(folder / slug / "index.html", listing_html(facet, slug, groups, root, options))
+            written += 1
+        if folder.is_dir():
+            for p in folder.iterdir():
+                if p.is_dir() and p.name not in values:
+                    shutil.rmtree(p)
+                    removed += 1
+        if values:
+            summary = {"facet": facet, "values": [
+                {"slug": slug, "name": group["name"], "count": len(group["entries"]), "href": f"{slug}/index.html"}
+                for slug, group in values.items()
+            ]}
+            write_if_changed(folder / "index.json", json_text(summary, options))
+        elif folder.is_dir():
+            shutil.rmtree(folder)
+    cache["facets"] = digests
+    return {"values": len(digests), "written": written, "removed": removed}
+
+
+def describe(result: dict) -> str:
+    return (
+        f"Listings: {result['values']} level/category pages, {result['written']} rewritten, "
+        f"{result['removed']} removed."
+    )
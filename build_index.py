@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build the full-text search index that index.html queries: an inverted index over every
+story's sentence text and translation, glossary keys and explanations, and titles.
+Words are folded to lowercase without accents ("Año" and "ano" are the same term) and the
+index is split into small shards by the first two letters of each term, so a query only
+downloads the shards for its own words. Output goes to search/:
+  search/index.json           shard and doc-chunk names with content hashes
+  search/t-<prefix>.json      {term: [doc, count, doc, count, ...]}
+  search/docs-<n>.json        {doc: [slug, title, titleTranslation, level]}
+Each JSON file has a .js twin that index.html loads via <script> from file://.
+Rebuilds are incremental: .search_cache.json keeps each story's terms by content hash,
+and only shards whose terms changed are rebuilt (and only written if their bytes differ).
+Doc numbers are the stories' position in file-name order, so an incremental build writes
+the same index as a fresh one; a story that fails to parse keeps its last indexed terms.
+Usage: python3 build_index.py [--force]
+"""
+import argparse
+import json
+import re
+import unicodedata
+
+from generate_web import ROOT, parse_story, prune_dir, sha256_hex, slugify, story_paths, write_if_changed
+
+SEARCH_DIR = ROOT / "search"
+SEARCH_CACHE_PATH = ROOT / ".search_cache.json"
+# Bump when tokenization or the output format changes.
+INDEX_VERSION = "3"
+# Term shards are keyed by this many leading characters of the folded term.
+PREFIX_LEN = 2
+# Stories per docs-<n>.json chunk.
+DOC_CHUNK_SIZE = 500
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_SAFE_PREFIX_RE = re.compile(r"[a-z0-9]+")
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents: 'Año Pequeño' -> 'ano pequeno'. Must match fold() in
+    web/search.js (NFKD, drop marks, lowercase), so no casefold(): it turns 'ß' into 'ss'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.category(c).startswith("M")).lower()
+
+
+def tokenize(text: str) -> list[str]:
+    return _WORD_RE.findall(fold(text))
+
+
+def story_terms(data: dict) -> dict:
+    """{term: occurrences} over the searchable fields of one story."""
+    texts = [data.get("title") or "", data.get("titleTranslation") or ""]
+    for item in data.get("content") or []:
+        if isinstance(item, dict) and item.get("type") == "sentence":
+            texts.append(item.get("text") or "")
+            texts.append(item.get("translation") or "")
+    glossary = data.get("glossary")
+    if isinstance(glossary, dict):
+        for key, entry in glossary.items():
+            texts.append(key)
+            if isinstance(entry, dict):
+                texts.append(entry.get("explanation") or "")
+    counts = {}
+    for text in texts:
+        if isinstance(text, str):
+            for term in tokenize(text):
+                counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+def shard_key(term: str) -> str:
+    return term[:PREFIX_LEN]
+
+
+def shard_name(prefix: str) -> str:
+    """File stem for a term shard; non-ASCII prefixes are hex-encoded to keep URLs plain."""
+    if _SAFE_PREFIX_RE.fullmatch(prefix):
+        return "t-" + prefix
+    return "t-x" + prefix.encode("utf-8").hex()
+
+
+def load_search_cache() -> dict:
+    try:
+        cache = json.loads(SEARCH_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("version") != INDEX_VERSION:
+        return {"version": INDEX_VERSION, "stories": {}}
+    return cache
+
+
+def write_json_pair(stem: str, callback: str, key, data) -> str:
+    """Write search/<stem>.json and its file:// twin search/<stem>.js. Returns the content hash."""
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    write_if_changed(SEARCH_DIR / f"{stem}.json", text)
+    write_if_changed(SEARCH_DIR / f"{stem}.js", f"{callback}({json.dumps(key)}, {text});\n")
+    return sha256_hex(text.encode("utf-8"))[:12]
+
+
+def build_search_index(force: bool = False) -> dict:
+    """Incrementally rebuild search/. Returns counts for reporting."""
+    cache = {"version": INDEX_VERSION, "stories": {}} if force else load_search_cache()
+    old = cache["stories"]
+    records = {}
+    changed = set()  # stories whose terms or meta were re-read
+    touched = set()  # shard prefixes whose postings may have changed
+    changed_docs = set()
+    for path in story_paths():
+        sid = path.stem
+        cached = old.get(sid)
+        st = path.stat()
+        if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime_ns:
+            records[sid] = cached
+            continue
+        raw = path.read_bytes()
+        digest = sha256_hex(raw)
+        if cached and cached["hash"] == digest:
+            records[sid] = dict(cached, size=st.st_size, mtime=st.st_mtime_ns)
+            continue
+        data = parse_story(raw, path.name)
+        if data is None:
+            if cached:  # keep the last good record (retried next build) rather than renumber the rest
+                records[sid] = cached
+            continue
+        terms = story_terms(data)
+        records[sid] = {
+            "hash": digest,
+            "size": st.st_size,
+            "mtime": st.st_mtime_ns,
+            "doc": cached["doc"] if cached else None,
+            "meta": [
+                slugify(sid),
+                (data.get("title") or "").strip(),
+                (data.get("titleTranslation") or "").strip(),
+                (data.get("level") or "").strip(),
+            ],
+            "terms": terms,
+        }
+        changed.add(sid)
+        if cached:
+            touched.update(shard_key(t) for t in cached["terms"])
+    # Number docs in story order; a story that moved (one was added or removed before it)
+    # rewrites its postings and doc chunks like a changed one.
+    for doc, sid in enumerate(records):
+        record = records[sid]
+        if sid in changed or record["doc"] != doc:
+            if record["doc"] is not None:
+                changed_docs.add(record["doc"])
+            records[sid] = record = dict(record, doc=doc)
+            changed_docs.add(doc)
+            touched.update(shard_key(t) for t in record["terms"])
+    for sid, cached in old.items():
+        if sid not in records:  # deleted story
+            changed_docs.add(cached["doc"])
+            touched.update(shard_key(t) for t in cached["terms"])
+
+    # Postings for every shard prefix, from all stories' cached terms.
+    postings = {}
+    for record in records.values():
+        for term, count in record["terms"].items():
+            postings.setdefault(shard_key(term), {}).setdefault(term, []).extend((record["doc"], count))
+
+    SEARCH_DIR.mkdir(exist_ok=True)
+    try:
+        previous = json.loads((SEARCH_DIR / "index.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+    prev_shards = {} if force else previous.get("shards", {})
+    prev_docs = {} if force else previous.get("docs", {})
+
+    shards = {}
+    for prefix in sorted(postings):
+        if prefix in touched or prefix not in prev_shards:
+            terms = dict(sorted(postings[prefix].items()))
+            stem = shard_name(prefix)
+            shards[prefix] = {"file": stem, "hash": write_json_pair(stem, "__searchShard", prefix, terms)}
+        else:
+            shards[prefix] = prev_shards[prefix]
+
+    chunks = {}
+    for record in records.values():
+        chunks.setdefault(record["doc"] // DOC_CHUNK_SIZE, {})[record["doc"]] = record["meta"]
+    changed_chunks = {doc // DOC_CHUNK_SIZE for doc in changed_docs}
+    docs = {}
+    for n in sorted(chunks):
+        key = str(n)
+        if n in changed_chunks or key not in prev_docs:
+            stem = f"docs-{n}"
+            docs[key] = {"file": stem, "hash": write_json_pair(stem, "__searchDocs", n, chunks[n])}
+        else:
+            docs[key] = prev_docs[key]
+
+    root = {"version": INDEX_VERSION, "prefixLength": PREFIX_LEN, "docChunkSize": DOC_CHUNK_SIZE,
+            "shards": shards, "docs": docs}
+    root_text = json.dumps(root, ensure_ascii=False, separators=(",", ":"))
+    write_if_changed(SEARCH_DIR / "index.json", root_text)
+    write_if_changed(SEARCH_DIR / "index.js", f"__searchIndex({root_text});\n")
+
+    keep = {"index.json", "index.js"}
+    for entry in list(shards.values()) + list(docs.values()):
+        keep.update((entry["file"] + ".json", entry["file"] + ".js"))
+    prune_dir(SEARCH_DIR, keep)
+
+    cache["stories"] = records
+    write_if_changed(SEARCH_CACHE_PATH, json.dumps(cache, ensure_ascii=False))
+    rebuilt = sum(1 for prefix in shards if prefix in touched or prefix not in prev_shards)
+    return {"stories": len(records), "terms": sum(len(t) for t in postings.values()),
+            "shards": len(shards), "rebuilt": rebuilt}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the sharded search index in search/.")
+    parser.add_argument("--force", action="store_true", help="ignore .search_cache.json and rebuild every shard")
+    args = parser.parse_args(argv)
+    result = build_search_index(force=args.force)
+    print(
+        f"Indexed {result['stories']} stories: {result['terms']} terms in {result['shards']} shards "
+        f"({result['rebuilt']} rebuilt)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build instrumentation shared by generate_web.py and compress_images.py: wall and CPU time
+per stage, bytes read and written, the largest and slowest items (stories or images) and
+peak RSS, reported as JSON with --stats; --profile dumps a cProfile of the whole run.
+Work done in worker processes is reported back per item and added in by the parent.
+"""
+import cProfile
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Largest/slowest items kept in the report.
+TOP_N = 10
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process and its finished children (worker pools)."""
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def peak_rss_mb() -> dict:
+    """Peak resident set size of this process and of its largest child, in MB."""
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KB on Linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {"self": round(own * scale / 2**20, 1), "children": round(children * scale / 2**20, 1)}
+
+
+class Stats:
+    """Accumulates stage timings, I/O byte counts and per-item costs for one run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.bytes = {"read": 0, "written": 0, "files_written": 0}
+        self.items = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block; repeated stages add up."""
+        wall, cpu = time.perf_counter(), cpu_seconds()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - wall, cpu_seconds() - cpu)
+
+    def add_stage(self, name: str, wall: float, cpu: float = None) -> None:
+        entry = self.stages.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+        entry["wall"] += wall
+        entry["cpu"] += wall if cpu is None else cpu
+
+    def read(self, n: int) -> None:
+        self.bytes["read"] += n
+
+    def wrote(self, n: int) -> None:
+        self.bytes["written"] += n
+        self.bytes["files_written"] += 1
+
+    def snapshot(self) -> tuple:
+        return {k: dict(v) for k, v in self.stages.items()}, dict(self.bytes)
+
+    def since(self, snapshot: tuple) -> dict:
+        """Stage times and byte counts added since snapshot(), to send back from a worker."""
+        stages, counts = snapshot
+        zero = {"wall": 0.0, "cpu": 0.0}
+        return {
+            "stages": {
+                k: {f: v[f] - stages.get(k, zero)[f] for f in ("wall", "cpu")}
+                for k, v in self.stages.items() if v != stages.get(k)
+            },
+            "bytes": {k: v - counts[k] for k, v in self.bytes.items()},
+        }
+
+    def merge(self, delta: dict) -> None:
+        """Add in a worker's since() delta."""
+        for name, v in delta["stages"].items():
+            self.add_stage(name, v["wall"], v["cpu"])
+        for k, v in delta["bytes"].items():
+            self.bytes[k] += v
+
+    def item(self, name: str, size: int, seconds: float) -> None:
+        """One story or image: its input size and the time spent on it."""
+        self.items.append((name, size, seconds))
+
+    def report(self, **extra) -> dict:
+        largest = sorted(self.items, key=lambda i: i[1], reverse=True)[:TOP_N]
+        slowest = sorted(self.items, key=lambda i: i[2], reverse=True)[:TOP_N]
+        return {
+            "wall_seconds": round(time.perf_counter() - self.started, 4),
+            "cpu_seconds": round(cpu_seconds(), 4),
+            "stages": {k: {"wall": round(v["wall"], 4), "cpu": round(v["cpu"], 4)} for k, v in self.stages.items()},
+            "bytes": dict(self.bytes),
+            "items": len(self.items),
+            "largest": [{"name": n, "bytes": s, "seconds": round(t, 4)} for n, s, t in largest],
+            "slowest": [{"name": n, "bytes": s, "seconds": round(t, 4)} for n, s, t in slowest],
+            "peak_rss_mb": peak_rss_mb(),
+            **extra,
+        }
+
+
+stats = Stats()
+
+
+def write_report(target: str, report: dict) -> None:
+    """Write the JSON report to a file, or to stdout for '-'."""
+    text = json.dumps(report, indent=1, ensure_ascii=False)
+    if target == "-":
+        print(text)
+    else:
+        Path(target).write_text(text + "\n", encoding="utf-8")
+        print(f"Stats written to {target}")
+
+
+@contextmanager
+def profiled(target: str = None):
+    """cProfile the block and dump it to target (inspect with python3 -m pstats FILE)."""
+    if not target:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(target)
+        print(f"Profile written to {target}")
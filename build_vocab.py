@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build the global vocabulary: every story's glossary entries, deduplicated, with stable
+numeric IDs. Identical (word, translation, explanation) entries across stories share an ID
+(see generate_web.vocab_entry_key); entries whose explanation is written for one story stay
+separate, so how much is shared depends on the catalog: pages link the chunks only where
+enough of their entries are shared (generate_web.VOCAB_MIN_SHARED), and the summary
+reports how many entries and bytes sharing saves.
+Output goes to vocab/:
+  vocab/<n>.<hash>.js    chunk n: IDs n*CHUNK_SIZE .. (n+1)*CHUNK_SIZE-1 as {id: [word, translation, explanation]}
+  vocab/words.json       {folded word: [{id, word, translation, stories: {slug: highlight count}}]}
+Entries keep the first story's casing of the word; pages of stories that spell it
+differently carry their own casing. IDs are handed out in order of first appearance and never reused, so chunks fill up and then
+stop changing; pages built with generate_web.py --shared-glossary link the chunks they need
+and browsers cache them once for every story. Chunks are small, so a new word renames only
+the last chunk and re-renders only the pages that link it. words.json answers "which stories use this
+word" (highlights[].glossaryKey references are counted per story).
+.vocab_cache.json keeps the ID table and each story's entries by content hash, so only
+changed stories are re-read. --force reassigns IDs from scratch (dropping unused entries).
+Usage: python3 build_vocab.py [--force] [--uses WORD]
+"""
+import argparse
+import json
+
+from build_index import fold
+from generate_web import (
+    VOCAB_CACHE_PATH,
+    VOCAB_DIR,
+    parse_story,
+    prune_dir,
+    sha256_hex,
+    slugify,
+    story_paths,
+    vocab_entry_key,
+    vocab_pays,
+    write_if_changed,
+)
+
+# Bump when the entry identity or the output format changes.
+VOCAB_VERSION = "3"
+# Vocabulary entries per vocab/<n>.<hash>.js chunk. Each chunk's name carries its content hash,
+# so the open (last) chunk is renamed whenever a word is added: kept small, that only affects
+# the pages of the stories whose words are in it.
+CHUNK_SIZE = 64
+
+
+def empty_vocab_cache() -> dict:
+    return {"version": VOCAB_VERSION, "chunkSize": CHUNK_SIZE, "ids": {}, "entries": [], "chunks": [], "stories": {}}
+
+
+def load_vocab_cache() -> dict:
+    try:
+        cache = json.loads(VOCAB_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("version") != VOCAB_VERSION or cache.get("chunkSize") != CHUNK_SIZE:
+        return empty_vocab_cache()
+    return cache
+
+
+def story_vocab(data: dict) -> tuple[list, dict]:
+    """([(entry key, [word, translation, explanation])] in glossary order, {glossaryKey: highlight count})."""
+    glossary = data.get("glossary")
+    entries = []
+    if isinstance(glossary, dict):
+        for word, entry in glossary.items():
+            e = entry if isinstance(entry, dict) else {}
+            entries.append((vocab_entry_key(word, entry), [word, e.get("translation") or "", e.get("explanation") or ""]))
+    highlights = {}
+    for item in data.get("content") or []:
+        if not isinstance(item, dict):
+            continue
+        for h in item.get("highlights") or []:
+            key = h.get("glossaryKey") if isinstance(h, dict) else None
+            if key:
+                highlights[key] = highlights.get(key, 0) + 1
+    return entries, highlights
+
+
+def build_vocabulary(force: bool = False) -> dict:
+    """Incrementally rebuild vocab/ and .vocab_cache.json. Returns counts for reporting."""
+    cache = empty_vocab_cache() if force else load_vocab_cache()
+    ids, entries, old = cache["ids"], cache["entries"], cache["stories"]
+    records = {}
+    for path in story_paths():
+        sid = path.stem
+        cached = old.get(sid)
+        st = path.stat()
+        if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime_ns:
+            records[sid] = cached
+            continue
+        raw = path.read_bytes()
+        digest = sha256_hex(raw)
+        if cached and cached["hash"] == digest:
+            records[sid] = dict(cached, size=st.st_size, mtime=st.st_mtime_ns)
+            continue
+        data = parse_story(raw, path.name)
+        if data is None:
+            continue
+        story_entries, highlights = story_vocab(data)
+        refs = []
+        for key, triple in story_entries:
+            if key not in ids:
+                ids[key] = len(entries)
+                entries.append(triple)
+            refs.append([ids[key], highlights.get(triple[0], 0)])
+        records[sid] = {"hash": digest, "size": st.st_size, "mtime": st.st_mtime_ns, "slug": slugify(sid), "refs": refs}
+
+    VOCAB_DIR.mkdir(exist_ok=True)
+    chunks = []
+    for n in range(0, len(entries), CHUNK_SIZE):
+        body = {i: entries[i] for i in range(n, min(n + CHUNK_SIZE, len(entries)))}
+        text = "Object.assign(window.__vocab = window.__vocab || {}, " + json.dumps(
+            body, ensure_ascii=False, separators=(",", ":")) + ");\n"
+        name = f"{n // CHUNK_SIZE}.{sha256_hex(text.encode('utf-8'))[:10]}.js"
+        write_if_changed(VOCAB_DIR / name, text)
+        chunks.append(name)
+
+    words = {}
+    used = {}
+    for record in records.values():
+        for i, count in record["refs"]:
+            used.setdefault(i, {})[record["slug"]] = count
+    uses = [len(used.get(i, ())) for i in range(len(entries))]
+    for i in sorted(used):
+        word, translation, _ = entries[i]
+        words.setdefault(fold(word), []).append(
+            {"id": i, "word": word, "translation": translation, "stories": used[i]}
+        )
+    words_json = json.dumps(dict(sorted(words.items())), ensure_ascii=False, separators=(",", ":"))
+    write_if_changed(VOCAB_DIR / "words.json", words_json)
+
+    prune_dir(VOCAB_DIR, set(chunks) | {"words.json"})
+
+    cache.update(chunks=chunks, stories=records, uses=uses)
+    write_if_changed(VOCAB_CACHE_PATH, json.dumps(cache, ensure_ascii=False))
+    glossary_total = sum(len(r["refs"]) for r in records.values())
+    # Bytes of glossary text every page would embed, against each used entry stored once.
+    entry_bytes = [len(json.dumps(e, ensure_ascii=False).encode("utf-8")) for e in entries]
+    embedded = sum(entry_bytes[i] for r in records.values() for i, _ in r["refs"])
+    linking = sum(1 for r in records.values() if vocab_pays([i for i, _ in r["refs"]]))
+    return {"stories": len(records), "entries": len(entries), "used": len(used),
+            "glossary": glossary_total, "chunks": len(chunks),
+            "shared": sum(1 for n in uses if n > 1), "saved": embedded - sum(entry_bytes[i] for i in used),
+            "linking": linking}
+
+
+def lookup(word: str) -> list[dict]:
+    """Vocabulary entries whose folded word matches, with the stories that use them."""
+    try:
+        words = json.loads((VOCAB_DIR / "words.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return words.get(fold(word.strip()), [])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the deduplicated vocabulary in vocab/.")
+    parser.add_argument("--force", action="store_true", help="ignore .vocab_cache.json and reassign IDs")
+    parser.add_argument("--uses", metavar="WORD", help="after building, list the stories that use WORD")
+    args = parser.parse_args(argv)
+    result = build_vocabulary(force=args.force)
+    print(
+        f"{result['glossary']} glossary entries in {result['stories']} stories -> "
+        f"{result['used']} unique ({result['entries']} IDs assigned) in {result['chunks']} chunk(s)."
+    )
+    print(
+        f"{result['shared']} entries are used by more than one story, saving {result['saved'] / 1024:,.1f} KB "
+        f"of glossary text; {result['linking']} of {result['stories']} pages link the shared chunks."
+    )
+    if args.uses:
+        matches = lookup(args.uses)
+        if not matches:
+            print(f"No stories use {args.uses!r}.")
+        for m in matches:
+            stories = ", ".join(f"{slug} ({n} highlight{'s' if n != 1 else ''})" for slug, n in m["stories"].items())
+            print(f"#{m['id']} {m['word']} — {m['translation']}: {stories}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+__manifestShard(0, [{"id": "apres_ski_pastel", "slug": "apres-ski-pastel", "title": "El après-ski y el pastelito", "titleTranslation": "The après-ski and the little pastry", "level": "A2", "thumbnail": "apres_ski_pastel_thumbnail_snow_mountains.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAoklEQVR42lXOSw6CMBAA0BlaCFhFoybGT4hx5f1vYkyMG4lLNiqFQmmnLW7c+E7wcIR/HGBUjJJM+wlZzzNslNPLRgzz2LBAbhVBxdHFrRvkULuaPBdQhliD8guJ7azruboWr2c47np5MhV77LEte71dKzLpYJytcjTeMUnscjh/xP2NBY7dbSMSbKPUBptOMxwBbCAOgJGNPOX4mwZEcAwBvh98VrUnGe79AAAAAElFTkSuQmCC"}, {"id": "azotea_caja_preguntas", "slug": "azotea-caja-preguntas", "title": "La caja de las preguntas", "titleTranslation": "The box of questions", "level": "C1", "thumbnail": "azotea_caja_preguntas_thumbnail_rooftop.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAwElEQVR42gXBy26CQBQA0Dt3xqFIwEdDKmof6sqNa/d+Sb+zSVeNCxPXjTHGlWimKFqReQF6DslLUgcAANClhPgVrVMd5DEXN6FUbf2tWD1DX4HOlT1dFmbEWWlvLz6S05wG4qk9kCzdg3mz6E855marPTqjARZ6F5MvUfxWjQv9tIm+Z+efiCRypdIW7TjXj038jK4LIQZZhw25WIbRlQW8GrSTP8M8OjkfR7bbdCL0zPidLEnJ+8gLfic1+Z/2Hqk1WD0Z18kFAAAAAElFTkSuQmCC"}, {"id": "bad_bunny_dtmf", "slug": "bad-bunny-dtmf", "title": "Bad Bunny - DtMf (DeBÍ TiRAR MáS FOToS)", "titleTranslation": "Bad Bunny - I Should Have Taken More Photos", "level": "B2", "thumbnail": "bad_bunny_dtmf_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAoElEQVR42lXByQ6CMBQF0PugAkUpIGpINNH//yDjwgWJMxtGxWJ9de05xNeo0gaeT0Y2K09SdQim4bGbZsH3FchMOYMc+LaAfYlHUBYRRH6yfX5JU3eX6q5n14GabRqW4UBJDF/DwQZ2XIZ93n1HtzYg7u7z4azWhU1SensxsdEjt6xa4yUzQRAQYlI969VeuIgIIAaXpbZb9YmsA4AY/37RE0glTq7VlAAAAABJRU5ErkJggg=="}, {"id": "bali_scooter", "slug": "bali-scooter", "title": "El surfista y la scooter en Bali", "titleTranslation": "The surfer and the scooter in Bali", "level": "B1", "thumbnail": "bali_scooter_thumbnail_surfer_beach.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAqklEQVR42mP8t36bmb84Axwwvdt6+DSM8/sXAwPLPS1HLiEGBoa/n9h+M///y8mstz1a7+80dY6/7BzsTAwVwiw8NTos3/48/flT5A/zvw9uL5jucv94eCv9xRf2//+Y2O6+/sC47LGIBsNafeXvos/5T0kKyjDePijP/O8FzydeIdkfXPwCDIx/nn//fEtEUuEHGwfrHxYGBsbfr39L/+BihDuM8T8DKgAAhLk/jN5yTd8AAAAASUVORK5CYII="}, {"id": "elefantes_mari_coco", "slug": "elefantes-mari-coco", "title": "Mari, Coco y la bolsa de gusanitos", "titleTranslation": "Mari, Coco and the bag of cheese puffs", "level": "A1", "thumbnail": "elefantes_mari_coco_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAKCAAAAACY1YFAAAAAj0lEQVR42gXB2Q6CMBAF0DulWBIwJC4Rn/z/L9MYjFBZusxMPYdUSpkMZ4tLEqKW4nez8+JEVPomtg9SsI86VJ5/9DLDYBfvwHmEmtvanw+WJEkddj5tNrrUdLDk2DuvoYuZXOxgkMU929rSO+88J5jC6TOOhxBVtqQJtE/rXYEwXUsx5WhIUaLLigZSAcAfVXFZToRFj4AAAAAASUVORK5CYII="}, {"id": "espana_2021_silla_rota", "slug": "espana-2021-silla-rota", "title": "La silla rota del Airbnb", "titleTranslation": "The broken chair at the Airbnb", "level": "B2", "thumbnail": "espana_2021_silla_rota_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAMCAAAAABOjGJdAAAAv0lEQVR42gXBy3LCIAAF0AtCAgMmih11Wu1j6cY/6P9vunSpnW6qsbaMojElQfAcEhFpYGhkPHAdeY9dRCX//evHu/3+nOFtwn523WlJbB02ejxwvxPWzG12ls6s9JGncQRtvszM6yNv2rliPgOtq+2fWpt8eNitUVPQbpDK0L/qYG4Plc1AlTRues6vISNFMeqBLp5exKlz3CMflo8UrBDp1kpZuiSU1wmMCkz3zzbC52pEABKBVLf80udRAsAdWvhS0F4Q7mgAAAAASUVORK5CYII="}, {"id": "vecino_televisor", "slug": "vecino-televisor", "title": "Lo que oía a través de la pared", "titleTranslation": "What I heard through the wall", "level": "C1", "thumbnail": "vecino_televisor_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAKCAAAAACY1YFAAAAAi0lEQVR42gXBuQ6CQBRA0ftghj1IRCko/f/fsbTQxkTD5hIws3mOeKzyIkBAAIWfjusz100041ohms8La2e3OzYJV4is8dhb+2jAFQsoqYth6XU9lmbyFShHUpwuaWdgFwyozB2GPI1shWgPKDo+aVxajbyCdrGq+eVj795BZB+yGPHgvokthS0D+AOxbzsWnkAIqwAAAABJRU5ErkJggg=="}]);
@@ -2,19 +2,74 @@
 """
 Remove transparency (composite onto white) and compress images in place.
 Defaults to the project images/ folder. Overwrites originals with compressed PNGs.
-Usage: python3 compress_images.py [folder]
+With --derivatives, also writes responsive width variants in modern formats (WebP,
+and AVIF when Pillow can encode it) to <folder>/derived/, listed in
+<folder>/derived/manifest.json for generate_web.py's srcset/sizes output.
+<folder>/.compress_cache.json remembers the content hash of every processed image and
+the settings used, so unchanged images are skipped without being decoded; --jobs
+spreads the work over worker processes. The folder is listed in one scan (asset_graph.py);
+--skip-orphans leaves alone images that no story references.
+--line-art re-encodes near-monochrome images (the black-line sketches BASE_PROMPT in
+list_missing_images.py asks for) as 1-bit or gray-palette PNGs: an image qualifies when at
+most --line-art-threshold of its pixels are coloured, and each candidate encoding must stay
+within --max-diff of the original (RMS gray-level difference after a slight blur), else
+the image is kept as RGB.
+--stats FILE writes stage times, bytes read and written, the largest and slowest images
+and peak RSS as JSON (see build_stats.py); --profile FILE dumps a cProfile.
+Usage: python3 compress_images.py [folder] [--derivatives] [--jobs N] [--force] [--skip-orphans]
+                                  [--line-art [--line-art-threshold F] [--max-diff D]]
+                                  [--stats FILE] [--profile FILE]
        (default folder: images)
 """
+import argparse
+import hashlib
+import io
+import json
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
-from PIL import Image
+from PIL import Image, ImageChops, ImageFilter, ImageStat
+
+from asset_graph import build_graph, scan_images
+from build_stats import profiled, stats, write_report
+
+try:  # AVIF support for Pillow builds without it
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
 
 # White background when removing transparency (use (0,0,0) for black)
 BG_COLOR = (255, 255, 255)
 # PNG compression: 9 = max (smaller file, slower)
 PNG_COMPRESS_LEVEL = 9
+# Responsive derivatives: target widths (never upscaled; the original width is always
+# included) and encoder settings per format. Formats Pillow cannot save are skipped.
+DERIVED_DIRNAME = "derived"
+DERIVED_MANIFEST = "manifest.json"
+DERIVED_WIDTHS = (320, 640, 1280)
+# Variant file name; keeps the source extension so foo.png and foo.jpg never share a file.
+DERIVED_NAME = "{name}-{width}.{fmt}"
+DERIVED_FORMATS = {
+    "avif": {"quality": 55},
+    "webp": {"quality": 80, "method": 6},
+}
+CACHE_NAME = ".compress_cache.json"
+# --line-art: a pixel counts as coloured when max(R,G,B) - min(R,G,B) exceeds
+# LINE_ART_CHROMA; an image qualifies when at most LINE_ART_THRESHOLD of its pixels do.
+LINE_ART_CHROMA = 24
+LINE_ART_THRESHOLD = 0.01
+# Candidate encodings: 1-bit (gray >= BILEVEL_CUTOFF is paper), an adaptive palette of
+# LINE_ART_COLORS grays (4-bit PNG), and 8-bit gray; the smallest within the guard wins.
+BILEVEL_CUTOFF = 160
+LINE_ART_COLORS = 16
+# Perceptual guard: RMS gray-level difference (0-255) after a GUARD_BLUR px Gaussian blur,
+# so stair-stepped line edges count for little and lost or thickened strokes for a lot.
+LINE_ART_MAX_DIFF = 6.0
+GUARD_BLUR = 1.0
 
 
 def remove_transparency(img, bg_color=(255, 255, 255)):
@@ -41,49 +96,382 @@ def remove_transparency(img, bg_color=(255, 255, 255)):
     return img.convert("RGB")
 
 
-def compress_image(path: Path) -> None:
-    """Overwrite path with compressed, non-transparent PNG."""
-    try:
-        with Image.open(path) as img:
+def encode_png(img) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=True)
+    return buf.getvalue()
+
+
+def coloured_share(img) -> float:
+    """Share of an RGB image's pixels whose channels differ by more than LINE_ART_CHROMA."""
+    r, g, b = img.split()
+    high = ImageChops.lighter(ImageChops.lighter(r, g), b)
+    low = ImageChops.darker(ImageChops.darker(r, g), b)
+    histogram = ImageChops.subtract(high, low).histogram()
+    return sum(histogram[LINE_ART_CHROMA + 1:]) / (img.width * img.height)
+
+
+def perceptual_diff(original, candidate) -> float:
+    """RMS gray-level difference (0-255) between two images after a slight blur."""
+    blur = ImageFilter.GaussianBlur(GUARD_BLUR)
+    a = original.convert("L").filter(blur)
+    b = candidate.convert("L").filter(blur)
+    return ImageStat.Stat(ImageChops.difference(a, b)).rms[0]
+
+
+def line_art_encode(img, threshold: float, max_diff: float) -> tuple[str, Optional[bytes]]:
+    """(encoding, PNG bytes) of the smallest line-art encoding of an RGB image that passes
+    the guard, or ("rgb: <reason>", None) when the image is coloured or none passes."""
+    share = coloured_share(img)
+    if share > threshold:
+        return f"rgb: {share:.1%} coloured", None
+    gray = img.convert("L")
+    candidates = (
+        ("1-bit", gray.point(lambda v: 255 if v >= BILEVEL_CUTOFF else 0, mode="1")),
+        (f"{LINE_ART_COLORS}-gray", gray.quantize(colors=LINE_ART_COLORS, dither=Image.Dither.NONE)),
+        ("gray", gray),
+    )
+    best = None
+    worst = 0.0
+    for encoding, candidate in candidates:
+        diff = perceptual_diff(img, candidate)
+        if diff > max_diff:
+            worst = max(worst, diff)
+            continue
+        data = encode_png(candidate)
+        if best is None or len(data) < len(best[1]):
+            best = (encoding, data)
+    return best or (f"rgb: diff {worst:.1f} > {max_diff:g}", None)
+
+
+def compress_image(path: Path, line_art: Optional[tuple] = None) -> str:
+    """Overwrite path with compressed, non-transparent PNG. With line_art
+    (threshold, max_diff), near-monochrome images become 1-bit or gray-palette PNGs.
+    Returns the encoding used ("rgb", "1-bit", ..., or "rgb: <why not line art>")."""
+    with Image.open(path) as img:
+        if img.mode in ("1", "L", "P") and "transparency" not in img.info:
+            # Nothing to composite: keep the mode (e.g. an earlier --line-art result)
+            # rather than growing it back to 24-bit RGB.
+            encoding, data = {"1": "1-bit", "L": "gray", "P": "palette"}[img.mode], encode_png(img)
+        else:
             img = remove_transparency(img, BG_COLOR)
-            # Write to temp then replace, so we don't corrupt on failure
-            tmp = path.with_suffix(path.suffix + ".tmp")
-            img.save(
-                tmp,
-                format="PNG",
-                compress_level=PNG_COMPRESS_LEVEL,
-                optimize=True,
-            )
-            tmp.replace(path)
-        print(f"✔ {path.name}")
+            encoding, data = "rgb", None
+            if line_art:
+                encoding, data = line_art_encode(img, *line_art)
+            if data is None:
+                data = encode_png(img)
+    # Write to temp then replace, so we don't corrupt on failure
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return encoding
+
+
+def derivative_formats() -> list[str]:
+    """The DERIVED_FORMATS this Pillow build can encode."""
+    Image.init()
+    return [fmt for fmt in DERIVED_FORMATS if fmt.upper() in Image.SAVE]
+
+
+def make_derivatives(path: Path, out_dir: Path, formats: list[str]) -> dict:
+    """Write width variants of one image to out_dir. Returns its derived manifest entry:
+    intrinsic size plus {file, width, height, format} for every variant."""
+    with Image.open(path) as img:
+        img = remove_transparency(img, BG_COLOR)
+        w, h = img.size
+        widths = [x for x in DERIVED_WIDTHS if x < w] + [w]
+        variants = []
+        for width in widths:
+            height = max(1, round(h * width / w))
+            resized = img if width == w else img.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                name = DERIVED_NAME.format(name=path.name, width=width, fmt=fmt)
+                tmp = out_dir / (name + ".tmp")
+                resized.save(tmp, format=fmt.upper(), **DERIVED_FORMATS[fmt])
+                tmp.replace(out_dir / name)
+                variants.append({"file": name, "width": width, "height": height, "format": fmt})
+    return {"width": w, "height": h, "variants": variants}
+
+
+def compress_settings(line_art: Optional[tuple] = None) -> str:
+    """Identifies the in-place compression settings; cached results only count if they match."""
+    settings = ["png", PNG_COMPRESS_LEVEL, BG_COLOR]
+    if line_art:
+        settings.append(["line-art", *line_art, LINE_ART_CHROMA, BILEVEL_CUTOFF, LINE_ART_COLORS, GUARD_BLUR])
+    return json.dumps(settings)
+
+
+def derivative_settings(formats: list[str]) -> str:
+    return json.dumps(["derived", DERIVED_WIDTHS, {f: DERIVED_FORMATS[f] for f in formats}, BG_COLOR, DERIVED_NAME])
+
+
+def load_cache(folder: Path) -> dict:
+    """<folder>/.compress_cache.json: {name: {hash, size, mtime, settings}} of processed images."""
+    try:
+        cache = json.loads((folder / CACHE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def derivatives_fresh(entry: Optional[dict], digest: str, settings: str, out_dir: Path) -> bool:
+    """A derived manifest entry was made from this exact source with these settings and its files exist."""
+    return (
+        bool(entry)
+        and entry.get("source") == digest
+        and entry.get("settings") == settings
+        and all((out_dir / v["file"]).is_file() for v in entry["variants"])
+    )
+
+
+def process_image(
+    path: Path, cached: Optional[dict], derived: Optional[dict], formats: list[str], line_art: Optional[tuple] = None,
+) -> dict:
+    """Compress one image in place and (if formats) refresh its derivatives, skipping any
+    step whose cached content hash and settings show it is already done.
+    Returns a result record; runs in worker processes with --jobs."""
+    start = time.perf_counter()
+    result = {
+        "name": path.name, "compressed": False, "encoding": None, "derived": None, "derivatives": 0, "error": None,
+    }
+    try:
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        result["before"] = len(raw)
+        settings = compress_settings(line_art)
+        if not cached or cached.get("hash") != digest or cached.get("settings") != settings:
+            result["encoding"] = compress_image(path, line_art)
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            result["compressed"] = True
+        result["after"] = len(raw)
+        result["hash"] = digest
+        if formats:
+            out_dir = path.parent / DERIVED_DIRNAME
+            dsettings = derivative_settings(formats)
+            if derivatives_fresh(derived, digest, dsettings, out_dir):
+                result["derived"] = derived
+            else:
+                entry = make_derivatives(path, out_dir, formats)
+                entry.update(source=digest, settings=dsettings)
+                result["derived"] = entry
+                result["derivatives"] = len(entry["variants"])
+        st = path.stat()
+        result.update(size=st.st_size, mtime=st.st_mtime_ns)
     except Exception as e:
-        print(f"✘ {path.name}: {e}")
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _process_batch(batch: list) -> list:
+    return [process_image(*task) for task in batch]
+
+
+def run_tasks(tasks: list, jobs: int) -> list:
+    """process_image() over tasks, in order, serially or across jobs worker processes."""
+    if jobs <= 1 or len(tasks) < 2:
+        return _process_batch(tasks)
+    size = max(1, -(-len(tasks) // (jobs * 4)))
+    batches = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return [r for results in pool.map(_process_batch, batches) for r in results]
+
+
+def write_derived_manifest(folder: Path, entries: dict) -> None:
+    """Rewrite derived/manifest.json and remove variant files no entry lists. An entry whose
+    variant file another image already claims is dropped (with a warning), since the file
+    holds only one of them."""
+    out_dir = folder / DERIVED_DIRNAME
+    owners = {}
+    for name in sorted(entries):
+        files = [v["file"] for v in entries[name]["variants"]]
+        clash = next((f for f in files if f in owners), None)
+        if clash:
+            print(f"✘ {name}: derived/{clash} is also a variant of {owners[clash]}; its derivatives are left out")
+            del entries[name]
+            continue
+        owners.update((f, name) for f in files)
+    keep = set(owners) | {DERIVED_MANIFEST}
+    for p in out_dir.iterdir():
+        if p.is_file() and p.name not in keep:
+            p.unlink()
+    (out_dir / DERIVED_MANIFEST).write_text(
+        json.dumps(entries, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8"
+    )
+
+
+def format_kb(n: int) -> str:
+    return f"{n / 1024:,.0f} KB"
+
+
+def print_summary(results: list, skipped: int, folder: Path, elapsed: float) -> None:
+    done = [r for r in results if not r["error"]]
+    before = sum(r["before"] for r in done)
+    after = sum(r["after"] for r in done)
+    compressed = sum(r["compressed"] for r in done)
+    derived = [r for r in done if r["derivatives"]]
+    print(f"Done. Processed {len(results) + skipped} image(s) in {folder}")
+    print(
+        f"  {compressed} compressed, {len(done) - compressed + skipped} already optimized, "
+        f"{len(results) - len(done)} failed"
+    )
+    if derived:
+        print(f"  {sum(r['derivatives'] for r in derived)} derivative(s) written for {len(derived)} image(s)")
+    if before:
+        print(f"  saved {format_kb(before - after)} ({(before - after) / before:.0%} of {format_kb(before)})")
+    encodings = {}
+    for r in done:
+        if r["encoding"]:
+            kind = r["encoding"].split(":")[0]
+            encodings[kind] = encodings.get(kind, 0) + 1
+    if set(encodings) - {"rgb"}:
+        print("  encodings: " + ", ".join(f"{n} {kind}" for kind, n in sorted(encodings.items())))
+    if results:
+        slowest = max(results, key=lambda r: r["seconds"])
+        total = sum(r["seconds"] for r in results)
+        print(
+            f"  {total / len(results):.2f} s per processed image, slowest {slowest['name']} "
+            f"({slowest['seconds']:.2f} s), wall time {elapsed:.2f} s"
+        )
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Remove transparency and compress images in place.")
+    parser.add_argument("folder", nargs="?", default="images", help="image folder (default: images)")
+    parser.add_argument(
+        "--derivatives", action="store_true",
+        help="also write responsive WebP/AVIF width variants to <folder>/derived/",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=0, metavar="N",
+        help="worker processes (default 0 = one per CPU)",
+    )
+    parser.add_argument("--force", action="store_true", help="ignore the cache and reprocess every image")
+    parser.add_argument(
+        "--skip-orphans", action="store_true",
+        help="only process images some story in stories/ references",
+    )
+    parser.add_argument(
+        "--line-art", action="store_true",
+        help="re-encode near-monochrome images as 1-bit or gray-palette PNGs",
+    )
+    parser.add_argument(
+        "--line-art-threshold", type=float, default=LINE_ART_THRESHOLD, metavar="F",
+        help=f"largest share of coloured pixels a line-art image may have (default {LINE_ART_THRESHOLD:g})",
+    )
+    parser.add_argument(
+        "--max-diff", type=float, default=LINE_ART_MAX_DIFF, metavar="D",
+        help=f"largest blurred RMS gray difference (0-255) a line-art encoding may add, else RGB is kept "
+             f"(default {LINE_ART_MAX_DIFF:g})",
+    )
+    parser.add_argument("--stats", metavar="FILE", help="write run statistics as JSON; - for stdout")
+    parser.add_argument("--profile", metavar="FILE", help="write a cProfile dump of the run (python3 -m pstats FILE)")
+    args = parser.parse_args()
+    if not 0 <= args.line_art_threshold <= 1:
+        parser.error("--line-art-threshold must be between 0 and 1")
+    if args.max_diff < 0:
+        parser.error("--max-diff must not be negative")
+
+    with profiled(args.profile):
+        run(args)
+    if args.stats:
+        write_report(args.stats, stats.report(argv=sys.argv[1:]))
+
+
+def run(args) -> None:
     root = Path(__file__).resolve().parent
-    if len(sys.argv) > 1:
-        folder = Path(sys.argv[1])
-        if not folder.is_absolute():
-            folder = root / folder
-    else:
-        folder = root / "images"
+    folder = Path(args.folder)
+    if not folder.is_absolute():
+        folder = root / folder
 
     if not folder.is_dir():
         print(f"Folder does not exist: {folder}")
         sys.exit(1)
 
-    exts = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff")
-    count = 0
-    for path in sorted(folder.iterdir()):
-        if path.suffix.lower() in exts:
-            compress_image(path)
-            count += 1
-
-    if count == 0:
+    # One directory scan gives every image's size and mtime for the cache check below.
+    with stats.stage("scan"):
+        scanned = scan_images(folder)
+        orphans = set(build_graph(images_dir=folder).orphaned()) if args.skip_orphans else set()
+    paths = [folder / name for name in sorted(scanned) if name not in orphans]
+    if orphans:
+        print(f"Skipping {len(orphans)} image(s) no story references.")
+    if not paths:
         print("No images found.")
-    else:
-        print(f"Done. Processed {count} image(s) in {folder}")
+        return
+
+    formats = []
+    derived = {}
+    if args.derivatives:
+        formats = derivative_formats()
+        if not formats:
+            print("No derivative formats available (Pillow lacks WebP/AVIF support).")
+        (folder / DERIVED_DIRNAME).mkdir(exist_ok=True)
+        try:
+            derived = json.loads((folder / DERIVED_DIRNAME / DERIVED_MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            derived = {}
+    cache = {} if args.force else load_cache(folder)
+    if args.force:
+        derived = {}
+
+    line_art = (args.line_art_threshold, args.max_diff) if args.line_art else None
+    settings = compress_settings(line_art)
+    started = time.perf_counter()
+    tasks = []
+    skipped = 0
+    new_cache = {}
+    dsettings = derivative_settings(formats)
+    for path in paths:
+        cached = cache.get(path.name)
+        size, mtime = scanned[path.name]
+        # Unchanged since last run (stat only): nothing to read, hash or decode.
+        if (
+            cached and cached.get("size") == size and cached.get("mtime") == mtime
+            and cached.get("settings") == settings
+            and (not formats or derivatives_fresh(derived.get(path.name), cached["hash"], dsettings,
+                                                  folder / DERIVED_DIRNAME))
+        ):
+            new_cache[path.name] = cached
+            skipped += 1
+            continue
+        tasks.append((path, cached, derived.get(path.name), formats, line_art))
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    with stats.stage("process"):
+        results = run_tasks(tasks, jobs)
+    for r in results:
+        if r["error"]:
+            print(f"✘ {r['name']}: {r['error']}")
+            continue
+        stats.item(r["name"], r["before"], r["seconds"])
+        stats.read(r["before"] + (r["after"] if r["compressed"] else 0))  # re-read to hash the result
+        if r["compressed"]:
+            stats.wrote(r["after"])
+        new_cache[r["name"]] = {
+            "hash": r["hash"], "size": r["size"], "mtime": r["mtime"], "settings": settings,
+        }
+        written = f", {r['derivatives']} derivative(s)" if r["derivatives"] else ""
+        if r["compressed"]:
+            change = (r["after"] - r["before"]) / r["before"] if r["before"] else 0
+            print(
+                f"✔ {r['name']}: {format_kb(r['before'])} → {format_kb(r['after'])} "
+                f"({change:+.0%}, {r['encoding']}{written}, {r['seconds']:.2f} s)"
+            )
+        elif written:
+            print(f"✔ {r['name']}: already optimized{written} ({r['seconds']:.2f} s)")
+        else:
+            print(f"· {r['name']}: already optimized ({r['seconds']:.2f} s)")
+        if r["derived"]:
+            derived[r["name"]] = r["derived"]
+
+    new_cache.update((name, cache[name]) for name in orphans if name in cache)
+    with stats.stage("manifest"):
+        (folder / CACHE_NAME).write_text(json.dumps(new_cache, indent=1, sort_keys=True), encoding="utf-8")
+        if formats:
+            names = {p.name for p in paths}
+            write_derived_manifest(folder, {k: v for k, v in derived.items() if k in names})
+    print_summary(results, skipped, folder, time.perf_counter() - started)
 
 
 if __name__ == "__main__":
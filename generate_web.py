@@ -3,20 +3,96 @@
 """
 Generate static index.html and story.html with all data embedded.
 After running, open index.html in the browser (file://) - no server needed.
-Usage: python3 generate_web.py
+Builds are incremental (.build_cache.json) and also write the manifest/ shards, level and
+category listings, the search index and sw.js; see each option's --help and the modules
+it names (build_facets.py, build_index.py, service_worker.py, watch.py, ...) for details.
+Usage: python3 generate_web.py [--force] [--jobs N] [--manifest-only] [--client-render [--compact-payload]]
+                               [--inline-assets] [--shared-glossary] [--minify] [--hashed-images] [--validate]
+                               [--service-worker]
+                               [--watch] [--serve [PORT]] [--precompress] [--brotli]
+                               [--stats FILE] [--profile FILE]
 """
+import argparse
+import hashlib
 import json
+import os
+import re
+import shutil
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from html import escape as escape_html
 from pathlib import Path
+from typing import Optional
+
+from asset_graph import build_graph, content_images, image_filename, story_images
+from build_stats import profiled, stats, write_report
+from image_meta import IMAGE_META_CACHE_PATH, image_meta_from_cache, load_image_meta_cache, update_image_meta
+from publish_images import MEDIA_MAP_PATH, publish_images
+from publish_images import describe as describe_media
+from minify import minify_css, minify_html, minify_js
+from validate_stories import summarize, validate_paths
 
 ROOT = Path(__file__).resolve().parent
 STORIES_DIR = ROOT / "stories"
 STORY_OUTPUT_DIR = ROOT / "story"
+MANIFEST_DIR = ROOT / "manifest"
+WEB_DIR = ROOT / "web"  # CSS/JS sources shared by the generated pages
+ASSETS_DIR = ROOT / "assets"  # content-hashed copies of web/ files, linked from the pages
+# Responsive variants written by compress_images.py --derivatives.
+DERIVED_MANIFEST_PATH = ROOT / "images" / "derived" / "manifest.json"
+# Cards per manifest shard; index.html embeds the first shard and fetches the rest on scroll.
+MANIFEST_SHARD_SIZE = 120
+BUILD_CACHE_PATH = ROOT / ".build_cache.json"
+VOCAB_DIR = ROOT / "vocab"  # shared glossary chunks written by build_vocab.py
+VOCAB_CACHE_PATH = ROOT / ".vocab_cache.json"  # build_vocab.py's ID table, read for --shared-glossary
+# With --shared-glossary, a page links the vocab/ chunks only when at least this share of its
+# glossary entries is used by another story too; otherwise the chunks would hold its entries
+# for it alone and cost extra requests without saving bytes, so it keeps its own glossary.
+VOCAB_MIN_SHARED = 0.5
 IMAGES_BASE = "../../images/"  # from story/<slug>/index.html to repo images/
+MEDIA_BASE = "../../media/"  # from story/<slug>/index.html to media/ (--hashed-images)
+ASSETS_BASE = "../../assets/"  # from story/<slug>/index.html to assets/
+VOCAB_BASE = "../../vocab/"  # from story/<slug>/index.html to vocab/
+# Rendered width of story images for srcset selection (body is 42rem with 1.5rem padding).
+STORY_IMAGE_SIZES = "(max-width: 42rem) calc(100vw - 3rem), 39rem"
+# Index cards use the smallest variant at least this wide (cards are ~280-400 CSS px, 2x DPR).
+CARD_THUMB_WIDTH = 640
+# Files in web/ that are published to assets/ (or inlined with --inline-assets).
+WEB_ASSETS = (
+    "theme.js", "index.css", "index.js", "search.js", "story.css", "story.js", "story-client.js", "story-columns.js",
+    "glossary.js", "offline.js",
+)
 
 # Absolute base URL for og:image (must be set for social previews to work). No trailing slash.
 # Example: "https://youruser.github.io/your-repo" or your raw CDN base; images at <base>/images/<filename>
+# (<base>/media/<hash>.png with --hashed-images)
 SITE_BASE_URL = "https://boldijar.github.io/cuentito/"
 
+# Bump when output changes in a way the templates and settings hashed by render_key() don't capture.
+GENERATOR_VERSION = "3"
+
+
+@dataclass(frozen=True)
+class PageOptions:
+    """Settings that change how story pages are rendered (part of the build cache key)."""
+    # Embed the story JSON and render it in the browser instead of prerendering static HTML.
+    client_render: bool = False
+    # Inline CSS/JS into every page (single-file pages for file://) instead of linking assets/.
+    inline_assets: bool = False
+    # Reference shared vocabulary chunks from vocab/ instead of rendering each page's glossary.
+    shared_glossary: bool = False
+    # Compact JSON and minified HTML/CSS/JS (minify.py) instead of readable output.
+    minify: bool = False
+    # With client_render: embed the story as compact_story() columns instead of its JSON.
+    compact_payload: bool = False
+    # Link images by content-addressed name in media/ (publish_images.py) instead of images/.
+    hashed_images: bool = False
+    # Register sw.js (service_worker.py) from every page, with an offline download button on stories.
+    service_worker: bool = False
+
 
 def slugify(sid: str) -> str:
     """Convert story id to URL slug: bad_bunny_dtmf -> bad-bunny-dtmf."""
@@ -28,80 +104,474 @@ def escape_embed(s: str) -> str:
     return s.replace("</script>", "<\\/script>").replace("</SCRIPT>", "<\\/SCRIPT>")
 
 
+def json_text(data, options: PageOptions) -> str:
+    """JSON for generated files and pages; without spaces after separators with options.minify."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":") if options.minify else None)
+
+
+# Template placeholders look like __PAGE_TITLE__.
+_SLOT_RE = re.compile(r"(__[A-Z][A-Z0-9_]*[A-Z0-9]__)")
+
+
+def compile_template(src: str) -> tuple:
+    """Split a template once into (text, slot, text, slot, ..., text); slots are placeholder names."""
+    return tuple(_SLOT_RE.split(src))
+
+
+def render_template(compiled: tuple, values: dict) -> str:
+    """Fill a compiled template in a single join. Values are inserted verbatim and never rescanned,
+    so a placeholder-like string inside a value (e.g. story JSON) is left alone."""
+    parts = list(compiled)
+    parts[1::2] = [values[name] for name in compiled[1::2]]
+    return "".join(parts)
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless it already holds exactly that. Returns True if written."""
+    data = text.encode("utf-8")
+    try:
+        old = path.read_bytes()
+        stats.read(len(old))
+        if old == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    stats.wrote(len(data))
+    return True
+
+
+def load_web_assets() -> dict:
+    """Read the shared CSS/JS sources from web/."""
+    return {name: (WEB_DIR / name).read_text(encoding="utf-8") for name in WEB_ASSETS}
+
+
+def hashed_asset_name(name: str, text: str) -> str:
+    """story.css -> story.<content hash>.css, so the file can be cached as immutable."""
+    stem, ext = name.rsplit(".", 1)
+    return f"{stem}.{sha256_hex(text.encode('utf-8'))[:10]}.{ext}"
+
+
+_WEB = load_web_assets()
+_ASSET_FILES = {name: hashed_asset_name(name, text) for name, text in _WEB.items()}
+# --minify versions of _WEB, _ASSET_FILES and the page templates, made on first use.
+_MINIFIED = {}
+
+
+def minified() -> dict:
+    if not _MINIFIED:
+        web = {name: minify_js(text) if name.endswith(".js") else minify_css(text) for name, text in _WEB.items()}
+        _MINIFIED.update(
+            web=web,
+            files={name: hashed_asset_name(name, text) for name, text in web.items()},
+            story=compile_template(minify_html(_STORY_PAGE_TEMPLATE)),
+            index=compile_template(minify_html(_INDEX_PAGE_TEMPLATE)),
+            listing=compile_template(minify_html(_LISTING_PAGE_TEMPLATE)),
+            embed=compile_template(minify_html(_CLIENT_EMBED_TEMPLATE)),
+        )
+    return _MINIFIED
+
+
+def web_assets(options: PageOptions) -> tuple[dict, dict]:
+    """({web/ name: text}, {web/ name: hashed assets/ name}) for these options."""
+    if options.minify:
+        m = minified()
+        return m["web"], m["files"]
+    return _WEB, _ASSET_FILES
+
+
+def style_html(name: str, base: str, options: PageOptions) -> str:
+    texts, files = web_assets(options)
+    if options.inline_assets:
+        return "<style>" + ("" if options.minify else "\n") + texts[name] + "</style>"
+    return f'<link rel="stylesheet" href="{base}{files[name]}">'
+
+
+def script_html(name: str, base: str, options: PageOptions) -> str:
+    texts, files = web_assets(options)
+    if options.inline_assets:
+        return "<script>" + ("" if options.minify else "\n") + escape_embed(texts[name]) + "</script>"
+    return f'<script src="{base}{files[name]}"></script>'
+
+
+def write_assets(options: PageOptions = PageOptions(), prune: bool = True) -> None:
+    """Publish web/ files to assets/ under their hashed names and, with prune, drop outdated
+    copies (only safe when every page linking them is re-rendered)."""
+    texts, files = web_assets(options)
+    for name, text in texts.items():
+        write_if_changed(ASSETS_DIR / files[name], text)
+    if prune:
+        prune_dir(ASSETS_DIR, set(files.values()))
+
+
+def prune_dir(folder: Path, keep: set) -> None:
+    """Delete the files in folder not named in keep; .gz/.br copies (precompress.py) go with their output."""
+    for p in folder.iterdir():
+        name = p.name[:-3] if p.name.endswith((".gz", ".br")) else p.name
+        if p.is_file() and name not in keep:
+            p.unlink()
+
+
+_derived = {"key": None, "data": {}}
+_IMAGE_MIME = {"avif": "image/avif", "webp": "image/webp"}
+
+
+def image_variants() -> dict:
+    """images/derived/manifest.json, reloaded whenever the file changes; {} if absent."""
+    try:
+        st = DERIVED_MANIFEST_PATH.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if _derived["key"] != key:
+            _derived.update(key=key, data=json.loads(DERIVED_MANIFEST_PATH.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        _derived.update(key=None, data={})
+    return _derived["data"]
+
+
+_image_meta = {"key": None, "data": {}}
+
+
+def image_metadata() -> dict:
+    """{filename: {width, height[, placeholder]}} from .image_meta_cache.json, reloaded
+    whenever the file changes; {} if absent."""
+    try:
+        st = IMAGE_META_CACHE_PATH.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if _image_meta["key"] != key:
+            _image_meta.update(key=key, data=image_meta_from_cache(load_image_meta_cache()))
+    except OSError:
+        _image_meta.update(key=None, data={})
+    return _image_meta["data"]
+
+
+_media = {"key": None, "data": {}}
+
+
+def media_map() -> dict:
+    """media/map.json ({path under images/: media/ name}), reloaded whenever the file changes; {} if absent."""
+    try:
+        st = MEDIA_MAP_PATH.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if _media["key"] != key:
+            _media.update(key=key, data=json.loads(MEDIA_MAP_PATH.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        _media.update(key=None, data={})
+    return _media["data"]
+
+
+def image_path(rel: str, options: PageOptions = PageOptions()) -> str:
+    """Where an image (path relative to images/) is published, relative to the image base:
+    itself, or its content-addressed name with options.hashed_images."""
+    return media_map().get(rel, rel) if options.hashed_images else rel
+
+
+def images_base(options: PageOptions = PageOptions()) -> str:
+    """Image base URL from a story page."""
+    return MEDIA_BASE if options.hashed_images else IMAGES_BASE
+
+
+def image_sources(filename: str, options: PageOptions = PageOptions()) -> list[dict]:
+    """<source> candidates for one image, best format first: [{type, srcset}] with srcset
+    URLs relative to the image base. Empty when the image has no derivatives."""
+    entry = image_variants().get(filename)
+    out = []
+    for fmt, mime in _IMAGE_MIME.items():
+        variants = [v for v in (entry or {}).get("variants", ()) if v["format"] == fmt]
+        if variants:
+            out.append({
+                "type": mime,
+                "srcset": ", ".join(f"{image_path('derived/' + v['file'], options)} {v['width']}w" for v in variants),
+            })
+    return out
+
+
+def card_thumb_sources(filename: str, options: PageOptions = PageOptions()) -> list[dict]:
+    """[{type, src}] of the variant per format that backs an index card, best format first."""
+    entry = image_variants().get(filename)
+    out = []
+    for fmt, mime in _IMAGE_MIME.items():
+        variants = sorted(
+            (v for v in (entry or {}).get("variants", ()) if v["format"] == fmt), key=lambda v: v["width"]
+        )
+        if variants:
+            pick = next((v for v in variants if v["width"] >= CARD_THUMB_WIDTH), variants[-1])
+            out.append({"type": mime, "src": image_path(f"derived/{pick['file']}", options)})
+    return out
+
+
+def images_digest(names) -> str:
+    """Hash of the derivative entries, metadata and media/ names of the given images, to
+    notice re-generated variants, changed sizes or placeholders and republished content."""
+    variants = image_variants()
+    meta = image_metadata()
+    media = media_map()
+    return sha256_hex(
+        json.dumps([[variants.get(n), meta.get(n), media.get(n)] for n in names], sort_keys=True).encode("utf-8")
+    )
+
+
+_vocab = {"key": None, "data": {}}
+
+
+def _vocab_text(s: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", s).split())
+
+
+def vocab_entry_key(word: str, entry) -> str:
+    """Identity of a glossary entry: (word, translation, explanation) triples that only differ in
+    whitespace, Unicode normalization or the word's case share one ID."""
+    entry = entry if isinstance(entry, dict) else {}
+    triple = [_vocab_text(word).lower(), _vocab_text(entry.get("translation") or ""), _vocab_text(entry.get("explanation") or "")]
+    return sha256_hex(json.dumps(triple, ensure_ascii=False).encode("utf-8"))[:16]
+
+
+def vocab_table() -> dict:
+    """.vocab_cache.json ({ids, chunks, chunkSize, ...}), reloaded whenever the file changes; {} if absent."""
+    try:
+        st = VOCAB_CACHE_PATH.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if _vocab["key"] != key:
+            _vocab.update(key=key, data=json.loads(VOCAB_CACHE_PATH.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        _vocab.update(key=None, data={})
+    return _vocab["data"]
+
+
+def glossary_refs(glossary) -> Optional[list[int]]:
+    """Vocabulary IDs of a story's glossary entries in order, or None if build_vocab.py has
+    not assigned them all (the page then keeps its own glossary)."""
+    if not glossary or not isinstance(glossary, dict):
+        return None
+    ids = vocab_table().get("ids") or {}
+    refs = [ids.get(vocab_entry_key(word, entry)) for word, entry in glossary.items()]
+    return None if None in refs else refs
+
+
+def vocab_pays(refs) -> bool:
+    """Whether a page with these vocabulary IDs should link the shared chunks (see VOCAB_MIN_SHARED)."""
+    if not refs:
+        return False
+    uses = vocab_table().get("uses") or []
+    shared = sum(1 for r in refs if r < len(uses) and uses[r] > 1)
+    return shared >= VOCAB_MIN_SHARED * len(refs)
+
+
+def shared_glossary_html(glossary: dict, refs: list[int]) -> str:
+    """The glossary list glossary.js fills from the vocab chunks. Words whose casing differs
+    from the shared entry's (which keeps the first story's) are carried in data-words."""
+    entries = vocab_table().get("entries") or []
+    words = {
+        str(r): word for r, word in zip(refs, glossary)
+        if r < len(entries) and entries[r][0] != word
+    }
+    attrs = f' data-words="{escape_html_attr(json.dumps(words, ensure_ascii=False))}"' if words else ""
+    return f'<h2>Glossary</h2><dl data-vocab="{" ".join(map(str, refs))}"{attrs}></dl>'
+
+
+def vocab_files(refs) -> list[str]:
+    """Chunk files (vocab/<n>.<hash>.js) holding the given vocabulary IDs, in chunk order."""
+    table = vocab_table()
+    size = table.get("chunkSize") or 1
+    return [table["chunks"][n] for n in sorted({r // size for r in refs or ()})]
+
+
+def vocab_current(files) -> bool:
+    """The vocab chunks a page references are still the published ones."""
+    chunks = vocab_table().get("chunks") or []
+    for f in files or ():
+        n = int(f.split(".", 1)[0])
+        if n >= len(chunks) or chunks[n] != f:
+            return False
+    return True
+
+
+def story_paths() -> list[Path]:
+    return [p for p in sorted(STORIES_DIR.glob("*.json")) if p.name != "manifest.json"]
+
+
+def parse_story(raw: bytes, name: str) -> Optional[dict]:
+    """Parse story JSON bytes; prints and returns None for unreadable or non-object stories."""
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except Exception as e:
+        print(f"Skip {name}: {e}")
+        return None
+    if not isinstance(data, dict):
+        return None
+    return data
+
+
 def load_stories():
     stories = {}
-    for path in sorted(STORIES_DIR.glob("*.json")):
-        if path.name == "manifest.json":
-            continue
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except Exception as e:
-            print(f"Skip {path.name}: {e}")
-            continue
-        if not isinstance(data, dict):
-            continue
-        stories[path.stem] = data
+    for path in story_paths():
+        raw = path.read_bytes()
+        stats.read(len(raw))
+        data = parse_story(raw, path.name)
+        if data is not None:
+            stories[path.stem] = data
     return stories
 
 
-def build_manifest(stories):
-    out = []
-    for sid, data in stories.items():
-        thumb = ""
-        if data.get("thumbnail") and isinstance(data["thumbnail"], dict):
-            thumb = (data["thumbnail"].get("filename") or "").strip()
-        category = ""
-        if data.get("tags") and len(data["tags"]) > 0:
-            category = (data["tags"][0].get("name") or "").strip()
-        out.append({
-            "id": sid,
-            "slug": slugify(sid),
-            "title": (data.get("title") or "").strip(),
-            "titleTranslation": (data.get("titleTranslation") or "").strip(),
-            "level": (data.get("level") or "").strip(),
-            "thumbnail": thumb,
-            "category": category,
-        })
-    return out
+_WS_RE = re.compile(r"[ \t\n\r]*")
+# Top-level story fields manifest_entry() reads.
+HEADER_KEYS = frozenset(("title", "titleTranslation", "level", "thumbnail", "tags"))
+
+
+def read_story_header(text: str) -> dict:
+    """Decode only the HEADER_KEYS fields of a story's top-level object.
+
+    Stops as soon as all of them have been seen, so the large content and glossary that
+    follow them in our stories are never parsed. Raises ValueError on malformed JSON.
+    """
+    decode = json.JSONDecoder().raw_decode
+    ws = _WS_RE.match
+    i = ws(text).end()
+    if not text.startswith("{", i):
+        raise ValueError("story is not a JSON object")
+    i = ws(text, i + 1).end()
+    header = {}
+    if text.startswith("}", i):
+        return header
+    while True:
+        key, i = decode(text, i)
+        if not isinstance(key, str):
+            raise ValueError(f"expected a key at char {i}")
+        i = ws(text, i).end()
+        if not text.startswith(":", i):
+            raise ValueError(f"expected ':' at char {i}")
+        value, i = decode(text, ws(text, i + 1).end())
+        if key in HEADER_KEYS:
+            header[key] = value
+            if len(header) == len(HEADER_KEYS):
+                return header
+        i = ws(text, i).end()
+        if text.startswith(",", i):
+            i = ws(text, i + 1).end()
+        elif text.startswith("}", i):
+            return header
+        else:
+            raise ValueError(f"expected ',' or '}}' at char {i}")
+
+
+def manifest_entry(sid: str, data: dict, options: PageOptions = PageOptions()) -> dict:
+    """The index card fields for one story (thumbnail paths are relative to the index page's IMAGES_BASE)."""
+    thumb = ""
+    if data.get("thumbnail") and isinstance(data["thumbnail"], dict):
+        thumb = image_filename(data["thumbnail"].get("filename"))
+    category = ""
+    if data.get("tags") and len(data["tags"]) > 0:
+        category = (data["tags"][0].get("name") or "").strip()
+    entry = {
+        "id": sid,
+        "slug": slugify(sid),
+        "title": (data.get("title") or "").strip(),
+        "titleTranslation": (data.get("titleTranslation") or "").strip(),
+        "level": (data.get("level") or "").strip(),
+        "thumbnail": image_path(thumb, options) if thumb else "",
+        "category": category,
+    }
+    sources = card_thumb_sources(thumb, options) if thumb else []
+    if sources:
+        entry["thumbnailSources"] = sources
+    placeholder = image_metadata().get(thumb, {}).get("placeholder") if thumb else None
+    if placeholder:
+        entry["thumbnailPlaceholder"] = placeholder
+    return entry
+
 
+def build_manifest(stories, options: PageOptions = PageOptions()):
+    return [manifest_entry(sid, data, options) for sid, data in stories.items()]
 
-def write_index(manifest_js: str):
-    html = '''<!DOCTYPE html>
+
+def write_manifest_shards(
+    manifest: list, options: PageOptions = PageOptions(), folder: Optional[Path] = None,
+) -> dict:
+    """Write manifest/NNNN.json shards (plus .js twins for file://) and manifest/index.json
+    (folder defaults to MANIFEST_DIR).
+
+    Unchanged shards are not rewritten and shards beyond the new count are removed.
+    Returns the root index: total count, shard size and each shard's name and content hash.
+    build_facets.py writes each listing page's shards the same way, into its own folder.
+    """
+    folder = folder or MANIFEST_DIR
+    shards = []
+    keep = {"index.json", "index.html"}
+    for n, start in enumerate(range(0, len(manifest), MANIFEST_SHARD_SIZE)):
+        shard = write_manifest_shard(n, manifest[start:start + MANIFEST_SHARD_SIZE], options, folder)
+        keep.update((shard["file"] + ".json", shard["file"] + ".js"))
+        shards.append(shard)
+    root = {"total": len(manifest), "shardSize": MANIFEST_SHARD_SIZE, "shards": shards}
+    write_if_changed(folder / "index.json", json.dumps(root))
+    prune_dir(folder, keep)
+    return root
+
+
+def write_manifest_shard(
+    n: int, entries: list, options: PageOptions = PageOptions(), folder: Optional[Path] = None,
+) -> dict:
+    """Write manifest shard n (.json and .js twin) to folder (default MANIFEST_DIR) if changed.
+    Returns its root index entry."""
+    folder = folder or MANIFEST_DIR
+    name = f"{n:04d}"
+    chunk_json = json_text(entries, options)
+    write_if_changed(folder / f"{name}.json", chunk_json)
+    write_if_changed(folder / f"{name}.js", f"__manifestShard({n}, {chunk_json});\n")
+    return {"file": name, "hash": sha256_hex(chunk_json.encode("utf-8"))[:12]}
+
+
+def write_index(root: dict, first_shard: list, options: PageOptions = PageOptions(), nav: str = "") -> bool:
+    """Write index.html with the manifest root index and first shard embedded (nav: the
+    level and category links, see build_facets.py). Returns True if the file changed."""
+    return write_if_changed(ROOT / "index.html", index_page_html(root, first_shard, options, nav))
+
+
+def index_page_html(root: dict, first_shard: list, options: PageOptions = PageOptions(), nav: str = "") -> str:
+    return render_template(minified()["index"] if options.minify else _INDEX_PAGE, {
+        "__STYLES__": style_html("index.css", "assets/", options),
+        "__THEME_SCRIPT__": script_html("theme.js", "assets/", options),
+        "__INDEX_SCRIPT__": script_html("index.js", "assets/", options),
+        "__SEARCH_SCRIPT__": script_html("search.js", "assets/", options),
+        "__OFFLINE_SCRIPT__": script_html("offline.js", "assets/", options) if options.service_worker else "",
+        "__FACET_NAV__": nav,
+        "__INDEX_IMAGES_BASE__": "media/" if options.hashed_images else "images/",
+        "__MANIFEST_INDEX_JSON__": escape_embed(json_text(root, options)),
+        "__MANIFEST_FIRST_SHARD_JSON__": escape_embed(json_text(first_shard, options)),
+    })
+
+
+def listing_page_html(heading: str, summary: str, nav: str, root: dict, first_shard: list,
+                      options: PageOptions = PageOptions()) -> str:
+    """A level or category listing page (<facet>/<value>/index.html, see build_facets.py): the
+    index grid over that facet's manifest shards, which sit next to the page."""
+    return render_template(minified()["listing"] if options.minify else _LISTING_PAGE, {
+        "__PAGE_TITLE__": escape_html(f"{heading} — Spanish Stories"),
+        "__META_DESCRIPTION__": escape_html(summary),
+        "__HEADING_HTML__": escape_html(heading),
+        "__SUMMARY_HTML__": escape_html(summary),
+        "__FACET_NAV__": nav,
+        "__STYLES__": style_html("index.css", ASSETS_BASE, options),
+        "__THEME_SCRIPT__": script_html("theme.js", ASSETS_BASE, options),
+        "__INDEX_SCRIPT__": script_html("index.js", ASSETS_BASE, options),
+        "__OFFLINE_SCRIPT__": script_html("offline.js", ASSETS_BASE, options) if options.service_worker else "",
+        "__LISTING_IMAGES_BASE__": images_base(options),
+        "__MANIFEST_INDEX_JSON__": escape_embed(json_text(root, options)),
+        "__MANIFEST_FIRST_SHARD_JSON__": escape_embed(json_text(first_shard, options)),
+    })
+
+
+_INDEX_PAGE_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>Spanish Stories — Learn Spanish through short stories and songs</title>
   <meta name="description" content="Learn Spanish through short stories and popular songs. Read or listen at your level (A1–C2). Tap a sentence to see the translation. Use the glossary for vocabulary and slang.">
-  <style>
-    * { box-sizing: border-box; }
-    body { font-family: system-ui, sans-serif; margin: 0; padding: 1.5rem; padding-top: 3rem; background: #f5f5f5; color: #1a1a1a; }
-    body.dark { background: #1a1a1a; color: #e0e0e0; }
-    .page-header { display: flex; align-items: center; justify-content: space-between; margin-bottom: 1.5rem; }
-    .page-header h1 { margin: 0; font-size: 1.5rem; }
-    .dark-toggle { position: fixed; top: 1rem; right: 1rem; width: 2.5rem; height: 2.5rem; padding: 0; border: none; border-radius: 50%; background: #e0e0e0; color: #333; cursor: pointer; display: flex; align-items: center; justify-content: center; z-index: 10; }
-    .dark-toggle:hover { background: #ccc; }
-    body.dark .dark-toggle { background: #333; color: #e0e0e0; }
-    body.dark .dark-toggle:hover { background: #555; }
-    .grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(280px, 1fr)); gap: 1.5rem; max-width: 1200px; margin: 0 auto; }
-    .card { display: block; text-decoration: none; color: inherit; background: #fff; border-radius: 12px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.06); transition: transform 0.2s, box-shadow 0.2s; }
-    body.dark .card { background: #2d2d2d; }
-    .card:hover { transform: translateY(-2px); box-shadow: 0 4px 12px rgba(0,0,0,0.1); }
-    body.dark .card:hover { box-shadow: 0 4px 12px rgba(0,0,0,0.3); }
-    .card-bg { position: relative; height: 140px; background-size: cover; background-position: center; background-color: #fff; }
-    body.dark .card-bg { background-color: #1a1a1a; }
-    .card-bg .level { position: absolute; top: 0.5rem; right: 0.5rem; background: rgba(0,0,0,0.7); color: #fff; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.8rem; font-weight: 600; }
-    body.dark .card-bg .level { background: rgba(255,255,255,0.25); color: #1a1a1a; }
-    .card-body { padding: 1rem; }
-    .card-title { margin: 0; font-size: 1.05rem; line-height: 1.35; }
-    .card-meta { margin-top: 0.25rem; font-size: 0.85rem; color: #666; }
-    body.dark .card-meta { color: #aaa; }
-    .error { color: #c00; padding: 1rem; }
-    .hero { margin-bottom: 2rem; max-width: 1200px; margin-left: auto; margin-right: auto; }
-    .hero h1 { margin: 0; font-size: 2.25rem; font-weight: 800; line-height: 1.2; letter-spacing: -0.02em; }
-    .hero p { margin: 0.75rem 0 0; font-size: 1.1rem; color: #555; line-height: 1.5; max-width: 42rem; }
-    body.dark .hero p { color: #aaa; }
-  </style>
+  __STYLES__
 </head>
 <body>
   <button type="button" class="dark-toggle" id="darkToggle" title="Toggle dark mode" aria-label="Toggle dark mode">
@@ -111,90 +581,307 @@ def write_index(manifest_js: str):
   <div class="hero">
     <h1>Learn Spanish through short stories and popular songs</h1>
     <p>Read or listen at your level (A1–C2). Tap a sentence to see the translation. Use the glossary for vocabulary and slang.</p>
+    <input type="search" id="search" class="search" placeholder="Search stories, sentences and glossary…" aria-label="Search stories" autocomplete="off">
   </div>
+  __FACET_NAV__
+  <div id="searchResults" class="search-results" hidden></div>
   <div id="app"></div>
-  <script>var EMBEDDED_MANIFEST = ''' + manifest_js + ''';</script>
-  <script>
-    (function () {
-      var app = document.getElementById('app');
-      var darkToggle = document.getElementById('darkToggle');
-      var iconSun = document.getElementById('iconSun');
-      var iconMoon = document.getElementById('iconMoon');
-      try {
-        if (localStorage.getItem('darkMode') === '1') {
-          document.body.classList.add('dark');
-          iconSun.style.display = 'none';
-          iconMoon.style.display = 'block';
-        } else { iconMoon.style.display = 'none'; }
-      } catch (e) {}
-      darkToggle.addEventListener('click', function () {
-        document.body.classList.toggle('dark');
-        var isDark = document.body.classList.contains('dark');
-        iconSun.style.display = isDark ? 'none' : 'block';
-        iconMoon.style.display = isDark ? 'block' : 'none';
-        try { localStorage.setItem('darkMode', isDark ? '1' : '0'); } catch (e) {}
-      });
-      function escapeHtml(s) {
-        if (s == null) return '';
-        var div = document.createElement('div');
-        div.textContent = s;
-        return div.innerHTML;
-      }
-      var list = EMBEDDED_MANIFEST;
-      if (!list || !list.length) {
-        app.innerHTML = '<p class="error">No stories found.</p>';
-        return;
-      }
-      var html = '<div class="grid">';
-      list.forEach(function (item) {
-        var id = item.id || '';
-        var slug = item.slug || id;
-        var title = item.title || id;
-        var titleTranslation = item.titleTranslation || '';
-        var level = item.level || '';
-        var thumb = (item.thumbnail && item.thumbnail.trim()) ? ('images/' + item.thumbnail.trim()) : '';
-        var bgStyle = thumb ? (' style="background-image: url(\\'' + thumb + '\\')"') : '';
-        html += '<a class="card" href="story/' + encodeURIComponent(slug) + '/">';
-        html += '<div class="card-bg"' + bgStyle + '><span class="level">' + escapeHtml(level) + '</span></div>';
-        html += '<div class="card-body"><h2 class="card-title">' + escapeHtml(title) + '</h2>';
-        if (titleTranslation) html += '<p class="card-meta">' + escapeHtml(titleTranslation) + '</p>';
-        html += '</div></a>';
-      });
-      app.innerHTML = html + '</div>';
-    })();
-  </script>
+  <script>var SITE_ROOT = ""; var IMAGES_BASE = "__INDEX_IMAGES_BASE__"; var MANIFEST_BASE = "manifest/"; var MANIFEST_INDEX = __MANIFEST_INDEX_JSON__; var MANIFEST_FIRST_SHARD = __MANIFEST_FIRST_SHARD_JSON__;</script>
+  __THEME_SCRIPT__
+  __INDEX_SCRIPT__
+  __SEARCH_SCRIPT__
+  __OFFLINE_SCRIPT__
 </body>
 </html>
 '''
-    (ROOT / "index.html").write_text(html, encoding="utf-8")
+_INDEX_PAGE = compile_template(_INDEX_PAGE_TEMPLATE)
+
+_LISTING_PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>__PAGE_TITLE__</title>
+  <meta name="description" content="__META_DESCRIPTION__">
+  __STYLES__
+</head>
+<body>
+  <button type="button" class="dark-toggle" id="darkToggle" title="Toggle dark mode" aria-label="Toggle dark mode">
+    <svg id="iconSun" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="4"/><path d="M12 2v2M12 20v2M4.93 4.93l1.41 1.41M17.66 17.66l1.41 1.41M2 12h2M20 12h2M6.34 17.66l-1.41 1.41M19.07 4.93l-1.41 1.41"/></svg>
+    <svg id="iconMoon" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" style="display:none"><path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/></svg>
+  </button>
+  <div class="hero">
+    <p class="all-stories"><a href="../../index.html">← All stories</a></p>
+    <h1>__HEADING_HTML__</h1>
+    <p>__SUMMARY_HTML__</p>
+  </div>
+  __FACET_NAV__
+  <div id="app"></div>
+  <script>var SITE_ROOT = "../../"; var IMAGES_BASE = "__LISTING_IMAGES_BASE__"; var MANIFEST_BASE = ""; var MANIFEST_INDEX = __MANIFEST_INDEX_JSON__; var MANIFEST_FIRST_SHARD = __MANIFEST_FIRST_SHARD_JSON__;</script>
+  __THEME_SCRIPT__
+  __INDEX_SCRIPT__
+  __OFFLINE_SCRIPT__
+</body>
+</html>
+'''
+_LISTING_PAGE = compile_template(_LISTING_PAGE_TEMPLATE)
+
+
+def render_sentence_text(text: str, highlights) -> str:
+    """Sentence text as HTML with highlight spans, cut by startIndex/endIndex in order."""
+    parts = []
+    last = 0
+    for h in sorted(highlights or [], key=lambda h: h.get("startIndex", 0)):
+        start, end = h.get("startIndex", 0), h.get("endIndex", 0)
+        if start > last:
+            parts.append(escape_html(text[last:start], quote=False))
+        parts.append('<span class="hl">' + escape_html(text[start:end], quote=False) + "</span>")
+        last = end
+    if last < len(text):
+        parts.append(escape_html(text[last:], quote=False))
+    return "".join(parts)
+
+
+def render_content_html(story: dict, options: PageOptions = PageOptions()) -> str:
+    """Prerender the story's sentence blocks and images, matching what the client script built."""
+    out = []
+    for i, item in enumerate(story.get("content") or []):
+        kind = item.get("type")
+        if kind == "sentence":
+            block = [
+                f'<div class="sentence-block" data-sentence-index="{i}">',
+                '<span class="text">' + render_sentence_text(item.get("text") or "", item.get("highlights")) + "</span>",
+                '<div class="translation">' + escape_html(item.get("translation") or "", quote=False) + "</div>",
+            ]
+            bullets = item.get("detailedTranslation") or []
+            if bullets:
+                block.append('<ul class="detailed-translation">')
+                block.extend("<li>" + escape_html(b, quote=False) + "</li>" for b in bullets)
+                block.append("</ul>")
+            block.append("</div>")
+            out.append("".join(block))
+        elif kind == "image":
+            filename = image_filename(item.get("filename"))
+            out.append(render_image_html(filename, item.get("generation_prompt") or filename, options))
+    return "\n".join(out)
+
+
+def render_image_html(filename: str, alt: str, options: PageOptions = PageOptions()) -> str:
+    """A story image: the PNG as <img>, wrapped in <picture> with srcset/sizes <source>s
+    for its derivatives when compress_images.py --derivatives has made them. Its intrinsic
+    size and placeholder (image_meta.py) reserve its space and show until it loads."""
+    meta = image_metadata().get(filename, {})
+    attrs = f' width="{meta["width"]}" height="{meta["height"]}"' if meta.get("width") else ""
+    if meta.get("placeholder"):
+        attrs += f' style="background-image:url({meta["placeholder"]})"'
+    base = images_base(options)
+    img = (
+        f'<img alt="{escape_html_attr(alt)}" loading="lazy" src="{escape_html_attr(base + image_path(filename, options))}"{attrs}'
+        " onerror=\"this.classList.add('hide')\">"
+    )
+    sources = image_sources(filename, options)
+    if not sources:
+        return img
+    tags = "".join(
+        f'<source type="{s["type"]}" srcset="{escape_html_attr(prefix_srcset(base, s["srcset"]))}"'
+        f' sizes="{STORY_IMAGE_SIZES}">'
+        for s in sources
+    )
+    return "<picture>" + tags + img + "</picture>"
+
+
+def prefix_srcset(base: str, srcset: str) -> str:
+    return ", ".join(base + candidate for candidate in srcset.split(", "))
+
+
+def render_glossary_html(glossary) -> str:
+    if not glossary or not isinstance(glossary, dict):
+        return ""
+    items = "".join(
+        "<dt>" + escape_html(key, quote=False) + " — " + escape_html(e.get("translation") or "", quote=False)
+        + "</dt><dd>" + escape_html(e.get("explanation") or "", quote=False) + "</dd>"
+        for key, e in glossary.items()
+    )
+    return "<h2>Glossary</h2><dl>" + items + "</dl>"
 
 
-def story_page_html(story: dict, slug: str) -> str:
-    """Build one story's static HTML with SEO in head. Uses IMAGES_BASE for assets."""
+def render_tags_html(tags) -> str:
+    spans = "".join(
+        '<span class="tag"><strong>' + escape_html(t.get("name") or "", quote=False) + "</strong> "
+        + escape_html(t.get("description") or "", quote=False) + "</span>"
+        for t in tags or []
+    )
+    return spans or "—"
+
+
+def story_page_html(story: dict, slug: str, options: PageOptions = PageOptions()) -> str:
+    """Build one story's static HTML with SEO in head. Uses images_base() for images.
+    The story content is prerendered unless options.client_render is set."""
     title = (story.get("title") or "").strip()
     level = (story.get("level") or "").strip()
     thumb = story.get("thumbnail") or {}
-    thumb_filename = (thumb.get("filename") or "").strip() if isinstance(thumb, dict) else ""
+    thumb_filename = image_filename(thumb.get("filename")) if isinstance(thumb, dict) else ""
     meta_desc = f"Learn Spanish with this {level} story: {title}. Read the text, tap sentences for translation, and use the glossary for vocabulary."
+    refs = glossary_refs(story.get("glossary")) if options.shared_glossary else None
+    if not vocab_pays(refs):
+        refs = None
+    if refs is not None:
+        glossary_html = shared_glossary_html(story["glossary"], refs)
+        glossary_scripts = [f'<script src="{VOCAB_BASE}{f}"></script>' for f in vocab_files(refs)]
+        glossary_scripts.append(script_html("glossary.js", ASSETS_BASE, options))
+    else:
+        glossary_html = render_glossary_html(story.get("glossary"))
+        glossary_scripts = []
+    thumb_path = image_path(thumb_filename, options)
     if thumb_filename and SITE_BASE_URL:
-        og_image = f"{SITE_BASE_URL.rstrip('/')}/images/{thumb_filename}"
+        og_image = f"{SITE_BASE_URL.rstrip('/')}/{'media' if options.hashed_images else 'images'}/{thumb_path}"
     else:
-        og_image = (IMAGES_BASE + thumb_filename) if thumb_filename else ""
+        og_image = (images_base(options) + thumb_path) if thumb_filename else ""
 
-    html = _STORY_PAGE_TEMPLATE
-    repl = {
+    values = {
         "__PAGE_TITLE__": escape_html_attr(title + " — Spanish Stories"),
         "__META_DESCRIPTION__": escape_html_attr(meta_desc),
         "__OG_TITLE__": escape_html_attr(title + " — Spanish Stories"),
         "__OG_DESCRIPTION__": escape_html_attr(meta_desc),
         "__OG_IMAGE__": escape_html_attr(og_image),
         "__BACK_HREF__": "../../index.html",
-        "__IMAGES_BASE__": IMAGES_BASE,
-        "__EMBEDDED_STORY_JSON__": escape_embed(json.dumps(story, ensure_ascii=False)),
+        "__STYLES__": style_html("story.css", ASSETS_BASE, options),
+        "__THEME_SCRIPT__": script_html("theme.js", ASSETS_BASE, options),
+    }
+    script_sep = "" if options.minify else "\n  "
+    offline_scripts = [script_html("offline.js", ASSETS_BASE, options)] if options.service_worker else []
+    if options.client_render:
+        values.update({
+            "__TITLE_HTML__": "",
+            "__META_HTML__": "",
+            "__TAGS_HTML__": "",
+            "__CONTENT_HTML__": "",
+            "__GLOSSARY_HTML__": glossary_html if refs is not None else "",
+            "__PAGE_SCRIPT__": script_sep.join((
+                render_template(minified()["embed"] if options.minify else _CLIENT_EMBED, {
+                    "__IMAGES_BASE__": images_base(options),
+                    "__EMBEDDED_STORY_JSON__": escape_embed(json_text(embedded_story(story, refs is None, options), options)),
+                    "__IMAGE_SOURCES_JSON__": escape_embed(json_text(
+                        {name: sources for name in content_images(story) if (sources := image_sources(name, options))},
+                        options,
+                    )),
+                    "__IMAGE_FILES_JSON__": escape_embed(json_text(
+                        {name: image_path(name, options) for name in content_images(story)
+                         if image_path(name, options) != name},
+                        options,
+                    )),
+                    "__IMAGE_SIZES__": STORY_IMAGE_SIZES,
+                    "__IMAGE_META_JSON__": escape_embed(json_text(
+                        {name: image_metadata()[name] for name in content_images(story) if name in image_metadata()},
+                        options,
+                    )),
+                }),
+                *glossary_scripts,
+                *([script_html("story-columns.js", ASSETS_BASE, options)] if options.compact_payload else []),
+                script_html("story-client.js", ASSETS_BASE, options),
+                script_html("story.js", ASSETS_BASE, options),
+                *offline_scripts,
+            )),
+        })
+    else:
+        meta = f"{story.get('level') or ''} · {story.get('language') or 'es'}"
+        if story.get("titleTranslation"):
+            meta += " — " + story["titleTranslation"]
+        values.update({
+            "__TITLE_HTML__": escape_html(story.get("title") or "", quote=False),
+            "__META_HTML__": escape_html(meta, quote=False),
+            "__TAGS_HTML__": render_tags_html(story.get("tags")),
+            "__CONTENT_HTML__": render_content_html(story, options),
+            "__GLOSSARY_HTML__": glossary_html,
+            "__PAGE_SCRIPT__": script_sep.join((
+                *glossary_scripts, script_html("story.js", ASSETS_BASE, options), *offline_scripts,
+            )),
+        })
+    return render_template(minified()["story"] if options.minify else _STORY_PAGE, values)
+
+
+def embedded_story(story: dict, with_glossary: bool, options: PageOptions) -> dict:
+    """The story as embedded for --client-render: its JSON, or compact_story() columns.
+    Image blocks carry their image_filename(), the name the image maps are keyed by."""
+    if not with_glossary:
+        story = {k: v for k, v in story.items() if k != "glossary"}
+    if any(
+        isinstance(item, dict) and item.get("type") == "image" and item.get("filename") != image_filename(item.get("filename"))
+        for item in story.get("content") or []
+    ):
+        story = dict(story, content=[
+            dict(item, filename=image_filename(item.get("filename")))
+            if isinstance(item, dict) and item.get("type") == "image" else item
+            for item in story["content"]
+        ])
+    return compact_story(story) if options.compact_payload else story
+
+
+def compact_story(story: dict) -> dict:
+    """Columnar form of a story for --compact-payload, decoded by web/story-columns.js.
+    Every string is stored once in "strings" and referenced by index (-1 for missing);
+    content items become parallel arrays, one entry per item ("kinds": s = sentence,
+    i = image, - = other), with bullets and highlights flattened and counted per item.
+    Highlight text is dropped: it is the sentence text between startIndex and endIndex."""
+    strings, index = [], {}
+
+    def ref(s) -> int:
+        if not isinstance(s, str):
+            return -1
+        if s not in index:
+            index[s] = len(strings)
+            strings.append(s)
+        return index[s]
+
+    kinds, text, translation = [], [], []
+    bullet_counts, bullets = [], []
+    highlight_counts, starts, ends, keys = [], [], [], []
+    for item in story.get("content") or []:
+        kind = item.get("type")
+        lines = (item.get("detailedTranslation") or []) if kind == "sentence" else []
+        spans = (item.get("highlights") or []) if kind == "sentence" else []
+        if kind == "sentence":
+            kinds.append("s")
+            text.append(ref(item.get("text")))
+            translation.append(ref(item.get("translation")))
+        elif kind == "image":
+            kinds.append("i")
+            text.append(ref(item.get("filename")))
+            translation.append(ref(item.get("generation_prompt")))
+        else:
+            kinds.append("-")
+            text.append(-1)
+            translation.append(-1)
+        bullet_counts.append(len(lines))
+        bullets.extend(ref(line) for line in lines)
+        highlight_counts.append(len(spans))
+        for h in spans:
+            starts.append(h.get("startIndex", 0))
+            ends.append(h.get("endIndex", 0))
+            keys.append(ref(h.get("glossaryKey")))
+    out = {
+        "columns": 1,
+        "meta": {k: v for k, v in story.items() if k not in ("content", "glossary")},
+        "strings": strings,
+        "kinds": "".join(kinds),
+        "text": text,
+        "translation": translation,
+        "bulletCounts": bullet_counts,
+        "bullets": bullets,
+        "highlightCounts": highlight_counts,
+        "highlightStarts": starts,
+        "highlightEnds": ends,
+        "highlightKeys": keys,
     }
-    for k, v in repl.items():
-        html = html.replace(k, v)
-    return html
+    glossary = story.get("glossary")
+    if isinstance(glossary, dict):
+        entries = [(k, e if isinstance(e, dict) else {}) for k, e in glossary.items()]
+        out["glossary"] = [
+            [ref(k) for k, _ in entries],
+            [ref(e.get("translation")) for _, e in entries],
+            [ref(e.get("explanation")) for _, e in entries],
+        ]
+    return out
 
 
 def escape_html_attr(s: str) -> str:
@@ -215,61 +902,7 @@ _STORY_PAGE_TEMPLATE = '''<!DOCTYPE html>
   <meta property="og:title" content="__OG_TITLE__">
   <meta property="og:description" content="__OG_DESCRIPTION__">
   <meta property="og:image" content="__OG_IMAGE__">
-  <style>
-    * { box-sizing: border-box; }
-    body { font-family: system-ui, sans-serif; max-width: 42rem; margin: 0 auto; padding: 1rem 1.5rem; padding-top: 3rem; line-height: 1.6; color: #1a1a1a; }
-    .dark-toggle { position: fixed; top: 1rem; right: 1rem; width: 2.5rem; height: 2.5rem; padding: 0; border: none; border-radius: 50%; background: #e0e0e0; color: #333; cursor: pointer; display: flex; align-items: center; justify-content: center; z-index: 10; }
-    .dark-toggle:hover { background: #ccc; }
-    body.dark .dark-toggle { background: #333; color: #e0e0e0; }
-    body.dark .dark-toggle:hover { background: #555; }
-    header { display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap; gap: 1rem; margin-bottom: 1.5rem; padding-bottom: 1rem; border-bottom: 1px solid #e0e0e0; }
-    h1 { margin: 0; font-size: 1.5rem; }
-    .meta { font-size: 0.9rem; color: #555; }
-    .tags { display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.5rem; }
-    .tag { background: #f0f0f0; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.85rem; }
-    .tag strong { display: block; }
-    .switch-row { display: flex; align-items: center; gap: 0.5rem; }
-    .switch-row label { cursor: pointer; user-select: none; }
-    .content { margin: 1rem 0; }
-    .sentence-block { margin-bottom: 0.5rem; }
-    .sentence-block.show-translation { margin-bottom: 1rem; }
-    .sentence-block.show-translation .translation { display: block; }
-    .sentence-block .translation { display: none; margin-top: 0.25rem; padding-left: 1rem; font-size: 0.95rem; color: #555; border-left: 3px solid #ccc; }
-    .sentence-block .detailed-translation { display: none; margin-top: 0.35rem; padding-left: 1.5rem; font-size: 0.85rem; color: #555; list-style: disc; }
-    .sentence-block.show-translation.show-detailed .detailed-translation { display: block; }
-    .sentence-block .detailed-translation li { margin: 0.2rem 0; }
-    body.dark .sentence-block .detailed-translation { color: #aaa; }
-    .sentence-block .text { cursor: pointer; }
-    .sentence-block .translation { cursor: pointer; }
-    .sentence-block .detailed-translation { cursor: pointer; }
-    .sentence-block .text .hl { background: #fff3cd; padding: 0 2px; border-radius: 2px; }
-    .content img { max-width: 100%; height: auto; display: block; margin: 1rem 0; border-radius: 8px; }
-    .content img.hide { display: none !important; }
-    .glossary { margin-top: 2rem; padding-top: 1.5rem; border-top: 1px solid #e0e0e0; }
-    .glossary h2 { font-size: 1.1rem; margin-bottom: 0.75rem; }
-    .glossary dl { margin: 0; }
-    .glossary dt { font-weight: 600; margin-top: 0.75rem; }
-    .glossary dt:first-child { margin-top: 0; }
-    .glossary dd { margin: 0.25rem 0 0 0; color: #444; font-size: 0.95rem; }
-    body.dark { background: #1a1a1a; color: #e0e0e0; }
-    body.dark header { border-bottom-color: #404040; }
-    body.dark .meta { color: #aaa; }
-    body.dark .tag { background: #2d2d2d; color: #ccc; }
-    body.dark .sentence-block .translation { color: #aaa; border-left-color: #555; }
-    body.dark .sentence-block .text .hl { background: #4a3f1a; color: #f0e6c8; }
-    body.dark .glossary { border-top-color: #404040; }
-    body.dark .glossary h2, body.dark .glossary dt { color: #e8e8e8; }
-    body.dark .glossary dd { color: #aaa; }
-    body.dark .content img:not(.hide) { filter: invert(1); }
-    .back-header { margin-bottom: 1.5rem; padding-bottom: 1rem; border-bottom: 1px solid #e8e8e8; }
-    body.dark .back-header { border-bottom-color: #404040; }
-    .back-header a { display: inline-flex; align-items: center; gap: 0.35rem; color: #555; text-decoration: none; font-size: 0.95rem; font-weight: 500; }
-    .back-header a:hover { color: #1a1a1a; }
-    body.dark .back-header a { color: #aaa; }
-    body.dark .back-header a:hover { color: #e0e0e0; }
-    .back-header a svg { flex-shrink: 0; }
-    .error { color: #c00; padding: 2rem; }
-  </style>
+  __STYLES__
 </head>
 <body>
   <button type="button" class="dark-toggle" id="darkToggle" title="Toggle dark mode" aria-label="Toggle dark mode">
@@ -278,7 +911,7 @@ _STORY_PAGE_TEMPLATE = '''<!DOCTYPE html>
   </button>
   <div class="back-header"><a href="__BACK_HREF__"><svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M19 12H5M12 19l-7-7 7-7"/></svg> Back</a></div>
   <header>
-    <div><h1 id="title"></h1><p class="meta" id="meta"></p><div class="tags" id="tags"></div></div>
+    <div><h1 id="title">__TITLE_HTML__</h1><p class="meta" id="meta">__META_HTML__</p><div class="tags" id="tags">__TAGS_HTML__</div></div>
     <div class="switch-row">
       <input type="checkbox" id="showTranslations" />
       <label for="showTranslations">Show translations under sentences</label>
@@ -286,184 +919,474 @@ _STORY_PAGE_TEMPLATE = '''<!DOCTYPE html>
       <label for="showDetailedTranslation">Detailed translation</label>
     </div>
   </header>
-  <main class="content" id="content"></main>
-  <footer class="glossary" id="glossary"></footer>
-  <script>var EMBEDDED_STORY = __EMBEDDED_STORY_JSON__; var IMAGES_BASE = "__IMAGES_BASE__";</script>
-  <script>
-    (function () {
-      function escapeHtml(s) {
-        if (s == null) return '';
-        var div = document.createElement('div');
-        div.textContent = s;
-        return div.innerHTML;
-      }
-      var story = EMBEDDED_STORY;
-      document.getElementById('title').textContent = story.title;
-      document.getElementById('meta').textContent = story.level + ' · ' + (story.language || 'es') + (story.titleTranslation ? ' — ' + story.titleTranslation : '');
-      var tagsHtml = '';
-      if (story.tags && story.tags.length) {
-        story.tags.forEach(function (t) {
-          tagsHtml += '<span class="tag"><strong>' + escapeHtml(t.name) + '</strong> ' + escapeHtml(t.description) + '</span>';
-        });
-      }
-      document.getElementById('tags').innerHTML = tagsHtml || '—';
-      var content = document.getElementById('content');
-      var showTranslations = document.getElementById('showTranslations');
-      var showDetailedTranslation = document.getElementById('showDetailedTranslation');
-      var expandedSentences = new Set();
-      var collapsedSentences = new Set();
-      function renderContent() {
-        var showAll = showTranslations.checked;
-        var showDetailed = showDetailedTranslation.checked;
-        content.innerHTML = '';
-        story.content.forEach(function (item, i) {
-          if (item.type === 'sentence') {
-            var isVisible = showAll ? !collapsedSentences.has(i) : expandedSentences.has(i);
-            var block = document.createElement('div');
-            block.className = 'sentence-block' + (isVisible ? ' show-translation' : '') + (isVisible && showDetailed ? ' show-detailed' : '');
-            block.dataset.sentenceIndex = i;
-            var text = item.text;
-            if (item.highlights && item.highlights.length) {
-              var parts = [];
-              var last = 0;
-              item.highlights.slice().sort(function (a, b) { return a.startIndex - b.startIndex; }).forEach(function (h) {
-                if (h.startIndex > last) parts.push({ type: 'plain', s: text.slice(last, h.startIndex) });
-                parts.push({ type: 'hl', s: text.slice(h.startIndex, h.endIndex) });
-                last = h.endIndex;
-              });
-              if (last < text.length) parts.push({ type: 'plain', s: text.slice(last) });
-              var span = document.createElement('span');
-              span.className = 'text';
-              parts.forEach(function (p) {
-                if (p.type === 'hl') {
-                  var hl = document.createElement('span');
-                  hl.className = 'hl';
-                  hl.textContent = p.s;
-                  span.appendChild(hl);
-                } else { span.appendChild(document.createTextNode(p.s)); }
-              });
-              block.appendChild(span);
-            } else {
-              var span = document.createElement('span');
-              span.className = 'text';
-              span.textContent = text;
-              block.appendChild(span);
-            }
-            var trans = document.createElement('div');
-            trans.className = 'translation';
-            trans.textContent = item.translation || '';
-            block.appendChild(trans);
-            if (item.detailedTranslation && item.detailedTranslation.length) {
-              var ul = document.createElement('ul');
-              ul.className = 'detailed-translation';
-              item.detailedTranslation.forEach(function (bullet) {
-                var li = document.createElement('li');
-                li.textContent = bullet;
-                ul.appendChild(li);
-              });
-              block.appendChild(ul);
-            }
-            content.appendChild(block);
-          } else if (item.type === 'image') {
-            var img = document.createElement('img');
-            img.alt = item.generation_prompt || item.filename;
-            img.loading = 'lazy';
-            img.onerror = function () { this.classList.add('hide'); };
-            img.src = IMAGES_BASE + item.filename;
-            content.appendChild(img);
-          }
-        });
-      }
-      function hideSentence(i) {
-        expandedSentences.delete(i);
-        if (showTranslations.checked) collapsedSentences.add(i);
-      }
-      function isSentenceVisible(i) {
-        var showAll = showTranslations.checked;
-        return showAll ? !collapsedSentences.has(i) : expandedSentences.has(i);
-      }
-      content.addEventListener('click', function (e) {
-        var block = e.target.closest('.sentence-block');
-        if (!block || block.dataset.sentenceIndex === undefined) return;
-        var i = parseInt(block.dataset.sentenceIndex, 10);
-        if (e.target.closest('.translation') || e.target.closest('.detailed-translation')) {
-          hideSentence(i);
-          renderContent();
-        } else if (e.target.closest('.text')) {
-          if (isSentenceVisible(i)) {
-            hideSentence(i);
-          } else {
-            expandedSentences.add(i);
-            collapsedSentences.delete(i);
-          }
-          renderContent();
-        }
-      });
-      showTranslations.addEventListener('change', function () {
-        if (showTranslations.checked) {
-          collapsedSentences.clear();
-        } else {
-          expandedSentences.clear();
-          collapsedSentences.clear();
-        }
-        renderContent();
-      });
-      showDetailedTranslation.addEventListener('change', renderContent);
-      renderContent();
-      var darkToggle = document.getElementById('darkToggle');
-      var iconSun = document.getElementById('iconSun');
-      var iconMoon = document.getElementById('iconMoon');
-      try {
-        if (localStorage.getItem('darkMode') === '1') {
-          document.body.classList.add('dark');
-          iconSun.style.display = 'none';
-          iconMoon.style.display = 'block';
-        } else { iconMoon.style.display = 'none'; }
-      } catch (e) {}
-      darkToggle.addEventListener('click', function () {
-        document.body.classList.toggle('dark');
-        var isDark = document.body.classList.contains('dark');
-        iconSun.style.display = isDark ? 'none' : 'block';
-        iconMoon.style.display = isDark ? 'block' : 'none';
-        try { localStorage.setItem('darkMode', isDark ? '1' : '0'); } catch (e) {}
-      });
-      if (story.glossary && Object.keys(story.glossary).length) {
-        var gEl = document.getElementById('glossary');
-        var gHtml = '<h2>Glossary</h2><dl>';
-        Object.keys(story.glossary).forEach(function (key) {
-          var e = story.glossary[key];
-          gHtml += '<dt>' + escapeHtml(key) + ' — ' + escapeHtml(e.translation) + '</dt><dd>' + escapeHtml(e.explanation) + '</dd>';
-        });
-        gEl.innerHTML = gHtml + '</dl>';
-      }
-    })();
-  </script>
+  <main class="content" id="content">__CONTENT_HTML__</main>
+  <footer class="glossary" id="glossary">__GLOSSARY_HTML__</footer>
+  __THEME_SCRIPT__
+  __PAGE_SCRIPT__
 </body>
 </html>
 '''
+_STORY_PAGE = compile_template(_STORY_PAGE_TEMPLATE)
 
+# --client-render embeds the whole story as JSON; web/story-client.js builds its DOM once.
+_CLIENT_EMBED_TEMPLATE = (
+    '<script>var EMBEDDED_STORY = __EMBEDDED_STORY_JSON__; var IMAGES_BASE = "__IMAGES_BASE__";'
+    ' var IMAGE_SOURCES = __IMAGE_SOURCES_JSON__; var IMAGE_SIZES = "__IMAGE_SIZES__";'
+    ' var IMAGE_META = __IMAGE_META_JSON__; var IMAGE_FILES = __IMAGE_FILES_JSON__;</script>'
+)
+_CLIENT_EMBED = compile_template(_CLIENT_EMBED_TEMPLATE)
 
-def write_story_pages(stories: dict) -> None:
+
+def write_story_pages(stories: dict, options: PageOptions = PageOptions()) -> None:
     """Write one index.html per story under story/<slug>/ with full SEO in head."""
     for sid, data in stories.items():
         slug = slugify(sid)
-        out_dir = STORY_OUTPUT_DIR / slug
-        out_dir.mkdir(parents=True, exist_ok=True)
-        html = story_page_html(data, slug)
-        (out_dir / "index.html").write_text(html, encoding="utf-8")
+        write_if_changed(STORY_OUTPUT_DIR / slug / "index.html", story_page_html(data, slug, options))
+
+
+def render_key(options: PageOptions = PageOptions()) -> str:
+    """Hash of everything besides the story JSON that affects the generated pages."""
+    parts = [
+        GENERATOR_VERSION, repr(options), _STORY_PAGE_TEMPLATE, _INDEX_PAGE_TEMPLATE, _LISTING_PAGE_TEMPLATE,
+        "".join(_CLIENT_EMBED),
+        IMAGES_BASE, MEDIA_BASE, ASSETS_BASE, SITE_BASE_URL, *_WEB.values(),
+    ]
+    return sha256_hex("\0".join(parts).encode("utf-8"))
+
+
+def empty_build_cache(key: str) -> dict:
+    return {"key": key, "manifest": "", "stories": {}}
+
+
+def load_build_cache(key: str) -> dict:
+    """Read .build_cache.json; a missing, unreadable or stale (other render key) cache is empty."""
+    try:
+        cache = json.loads(BUILD_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty_build_cache(key)
+    if not isinstance(cache, dict) or cache.get("key") != key or not isinstance(cache.get("stories"), dict):
+        return empty_build_cache(key)
+    return cache
+
+
+def save_build_cache(cache: dict) -> None:
+    write_if_changed(BUILD_CACHE_PATH, json.dumps(cache, ensure_ascii=False, indent=1))
+
+
+def build_story(path: Path, cached: Optional[dict], options: PageOptions = PageOptions()) -> tuple[Optional[dict], bool]:
+    """Render story/<slug>/index.html for one story unless its content hash matches the
+    cached record. Returns (cache record or None if the story is unreadable, rendered)."""
+    st = path.stat()
+    raw = path.read_bytes()
+    stats.read(len(raw))
+    digest = sha256_hex(raw)
+    sid = path.stem
+    slug = slugify(sid)
+    out = STORY_OUTPUT_DIR / slug / "index.html"
+    rendered = False
+    if cached and cached.get("hash") == digest and deps_match(cached) and out.is_file():
+        record = dict(cached)
+    else:
+        with stats.stage("stories.parse"):
+            data = parse_story(raw, path.name)
+        if data is None:
+            return None, False
+        with stats.stage("stories.render"):
+            html = story_page_html(data, slug, options)
+        with stats.stage("stories.write"):
+            write_if_changed(out, html)
+        images = story_images(data)
+        refs = glossary_refs(data.get("glossary")) if options.shared_glossary else None
+        record = {
+            "hash": digest,
+            "slug": slug,
+            "manifest": manifest_entry(sid, data, options),
+            "images": images,
+            "glossary": refs,
+            "vocab": vocab_files(refs) if vocab_pays(refs) else [],
+            "deps": images_digest(images),
+        }
+        rendered = True
+    record["size"] = st.st_size
+    record["mtime"] = st.st_mtime_ns
+    return record, rendered
+
+
+def stat_matches(path: Path, cached: Optional[dict]) -> bool:
+    """Cheap check (stat only) that a story file is unchanged since its record was made."""
+    if not cached:
+        return False
+    st = path.stat()
+    return cached.get("size") == st.st_size and cached.get("mtime") == st.st_mtime_ns
+
+
+def deps_match(cached: dict) -> bool:
+    """The story's image derivatives and vocab chunks are the ones its page was rendered with,
+    and whether it links the shared chunks at all (vocab_pays) has not changed."""
+    return (
+        cached.get("deps") == images_digest(cached.get("images") or [])
+        and vocab_current(cached.get("vocab"))
+        and bool(cached.get("vocab")) == vocab_pays(cached.get("glossary"))
+    )
+
+
+def is_fresh(path: Path, cached: Optional[dict]) -> bool:
+    """Story and its image derivatives unchanged since it was last built, and its page is still there."""
+    return (
+        stat_matches(path, cached)
+        and deps_match(cached)
+        and (STORY_OUTPUT_DIR / cached["slug"] / "index.html").is_file()
+    )
+
+
+def _build_batch(batch: list, options: PageOptions = PageOptions()) -> list:
+    """Build a batch of (path, cached record) pairs into (story id, record, rendered, seconds)."""
+    out = []
+    for path, cached in batch:
+        start = time.perf_counter()
+        record, rendered = build_story(path, cached, options)
+        out.append((path.stem, record, rendered, time.perf_counter() - start))
+    return out
+
+
+def _build_batch_worker(batch: list, options: PageOptions = PageOptions()) -> tuple:
+    """Worker entry point: _build_batch() plus the build stats it added, for the parent to merge.
+    Only the small cache records travel back to the parent, never the parsed stories."""
+    before = stats.snapshot()
+    out = _build_batch(batch, options)
+    return out, stats.since(before)
+
+
+def build_stale(stale: list, jobs: int = 1, options: PageOptions = PageOptions()) -> list:
+    """Build (path, cached record) pairs serially or across a process pool of jobs workers.
+    Results come back in input order, so the output is identical to a serial build."""
+    if jobs <= 1 or len(stale) < 2:
+        return _build_batch(stale, options)
+    # A few batches per worker balances uneven story sizes without per-story IPC overhead.
+    size = max(1, -(-len(stale) // (jobs * 4)))
+    batches = [stale[i:i + size] for i in range(0, len(stale), size)]
+    out = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for result, delta in pool.map(_build_batch_worker, batches, [options] * len(batches)):
+            out.extend(result)
+            stats.merge(delta)
+    return out
+
+
+def remove_orphans(keep: set) -> list[str]:
+    """Delete generated story/<slug>/ directories whose slug is not in keep."""
+    removed = []
+    if not STORY_OUTPUT_DIR.is_dir():
+        return removed
+    for d in sorted(STORY_OUTPUT_DIR.iterdir()):
+        if d.is_dir() and d.name not in keep and (d / "index.html").is_file():
+            shutil.rmtree(d)
+            removed.append(d.name)
+    return removed
+
+
+def build(force: bool = False, jobs: int = 1, options: PageOptions = PageOptions()) -> dict:
+    """Incrementally regenerate story pages and index.html from stories/.
+
+    Stories whose file is unchanged since the last build are not parsed or rewritten;
+    index.html is rewritten only when the manifest changes. With jobs > 1 the stale
+    stories are loaded, rendered and written by a process pool. Returns counts for reporting.
+    """
+    if options.shared_glossary:
+        from build_vocab import build_vocabulary  # imports this module, so not at the top
+
+        with stats.stage("vocab"):
+            build_vocabulary(force=force)
+    with stats.stage("image_meta"):
+        update_image_meta(force=force)
+    key = render_key(options)
+    with stats.stage("cache"):
+        cache = empty_build_cache(key) if force else load_build_cache(key)
+    if not options.inline_assets:
+        with stats.stage("assets"):
+            write_assets(options)
+    with stats.stage("scan"):
+        paths = story_paths()
+        old = cache["stories"]
+        records = {}
+        stale = []
+        for path in paths:
+            cached = old.get(path.stem)
+            if is_fresh(path, cached):
+                records[path.stem] = cached
+                stats.item(path.stem, cached["size"], 0.0)
+            else:
+                stale.append((path, cached))
+    rendered = 0
+    with stats.stage("stories"):
+        for sid, record, did_render, seconds in build_stale(stale, jobs, options):
+            if record is not None:
+                records[sid] = record
+                stats.item(sid, record["size"], seconds)
+            rendered += did_render
+    # Manifest order follows the sorted story paths, as in a serial build.
+    order = {p.stem: i for i, p in enumerate(paths)}
+    records = dict(sorted(records.items(), key=lambda kv: order[kv[0]]))
+
+    # Keep pages of stories that exist but failed to parse; only deleted stories lose theirs.
+    with stats.stage("orphans"):
+        removed = remove_orphans({slugify(p.stem) for p in paths})
+
+    from build_facets import update_facets  # imports this module, so not at the top
+
+    manifest = [r["manifest"] for r in records.values()]
+    with stats.stage("index"):
+        index_written = update_index(manifest, cache, options)
+    with stats.stage("facets"):
+        facets = update_facets(manifest, cache, options)
+    cache["stories"] = records
+    with stats.stage("cache"):
+        save_build_cache(cache)
+    return {
+        "stories": len(records), "rendered": rendered, "removed": len(removed), "index": index_written,
+        "facets": facets,
+    }
+
 
+def update_index(manifest: list, cache: dict, options: PageOptions = PageOptions()) -> bool:
+    """Write the manifest shards and index.html if the manifest differs from the one recorded
+    in cache. Returns True if index.html was written."""
+    from build_facets import index_nav_html  # imports this module, so not at the top
 
-def main():
-    stories = load_stories()
-    if not stories:
+    if not manifest:
+        cache["manifest"] = ""
+        return False
+    digest = manifest_hash(manifest)
+    written = False
+    if (digest != cache.get("manifest") or not (ROOT / "index.html").is_file()
+            or not (MANIFEST_DIR / "index.json").is_file()):
+        root = write_manifest_shards(manifest, options)
+        written = write_index(root, manifest[:MANIFEST_SHARD_SIZE], options, index_nav_html(manifest))
+    cache["manifest"] = digest
+    return written
+
+
+def manifest_hash(manifest: list) -> str:
+    """Digest of the manifest and its sharding, recorded in the build cache."""
+    return sha256_hex(json.dumps([MANIFEST_SHARD_SIZE, manifest], ensure_ascii=False).encode("utf-8"))
+
+
+def build_manifest_only(force: bool = False, jobs: int = 1, options: PageOptions = PageOptions()) -> dict:
+    """Regenerate index.html without rendering story pages or fully parsing stories.
+
+    Manifest entries come from the build cache when a story's stat or content hash matches
+    its record, otherwise from read_story_header(). Only one story's text is held at a time.
+    Story records are left alone: their pages have not been re-rendered. Without records
+    for these options (first build, other options or changed web/ files) this is a full
+    build(), since the story pages are out of date too.
+    """
+    key = render_key(options)
+    with stats.stage("cache"):
+        cache = load_build_cache(key)
+    if not cache["stories"]:
+        print("No build cache for these options: rendering the story pages too.")
+        return build(force=force, jobs=jobs, options=options)
+    if force:
+        cache.update(manifest="", facets={})
+    with stats.stage("image_meta"):
+        update_image_meta(force=force)
+    if not options.inline_assets:
+        with stats.stage("assets"):
+            write_assets(options, prune=False)  # story pages not re-rendered here still link the old files
+    from build_facets import update_facets  # imports this module, so not at the top
+
+    with stats.stage("headers"):
+        manifest = read_manifest_entries({} if force else cache["stories"], options)
+    with stats.stage("index"):
+        index_written = update_index(manifest, cache, options)
+    with stats.stage("facets"):
+        facets = update_facets(manifest, cache, options)
+    with stats.stage("cache"):
+        save_build_cache(cache)
+    return {"stories": len(manifest), "rendered": 0, "removed": 0, "index": index_written, "facets": facets}
+
+
+def read_manifest_entries(old: dict, options: PageOptions = PageOptions()) -> list:
+    """Manifest entries for build_manifest_only(), from cache records or story headers."""
+    manifest = []
+    for path in story_paths():
+        cached = old.get(path.stem)
+        if stat_matches(path, cached) and deps_match(cached):
+            manifest.append(cached["manifest"])
+            continue
+        raw = path.read_bytes()
+        stats.read(len(raw))
+        if cached and cached.get("hash") == sha256_hex(raw) and deps_match(cached):
+            manifest.append(cached["manifest"])
+            continue
+        try:
+            header = read_story_header(raw.decode("utf-8"))
+        except ValueError as e:  # includes UnicodeDecodeError
+            print(f"Skip {path.name}: {e}")
+            continue
+        manifest.append(manifest_entry(path.stem, header, options))
+    return manifest
+
+
+def update_service_worker(options: PageOptions) -> Optional[dict]:
+    """Write sw.js for the cached build records; without options.service_worker, retire a
+    previously published one so browsers that installed it drop it."""
+    from service_worker import describe, retire_service_worker, write_service_worker  # imports this module, so not at the top
+
+    if not options.service_worker:
+        if retire_service_worker():
+            print("Service worker retired: sw.js now unregisters itself (delete it once visitors have updated).")
+        return None
+
+    with stats.stage("service_worker"):
+        result = write_service_worker(load_build_cache(render_key(options))["stories"], options)
+    print(describe(result))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate index.html and story/<slug>/index.html from stories/*.json.")
+    parser.add_argument("--force", action="store_true", help="ignore the build cache and re-render every story")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N",
+        help="render stories with N worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--manifest-only", action="store_true",
+        help="only regenerate index.html, reading story headers instead of whole stories",
+    )
+    parser.add_argument(
+        "--client-render", action="store_true",
+        help="embed story JSON and render pages in the browser instead of prerendering HTML",
+    )
+    parser.add_argument(
+        "--compact-payload", action="store_true",
+        help="with --client-render: embed stories as parallel arrays over a string table instead of JSON",
+    )
+    parser.add_argument(
+        "--inline-assets", action="store_true",
+        help="inline CSS/JS into every page instead of linking content-hashed files in assets/",
+    )
+    parser.add_argument(
+        "--hashed-images", action="store_true",
+        help="publish images as content-addressed files in media/ (see publish_images.py) and link those",
+    )
+    parser.add_argument(
+        "--service-worker", action="store_true",
+        help="write sw.js (see service_worker.py) and register it from the pages for caching and offline reading",
+    )
+    parser.add_argument(
+        "--validate", action="store_true",
+        help="check every story with validate_stories.py first and stop if any has errors",
+    )
+    parser.add_argument(
+        "--minify", action="store_true",
+        help="compact JSON and minified HTML/CSS/JS (check with python3 minify.py --check)",
+    )
+    parser.add_argument(
+        "--shared-glossary", action="store_true",
+        help="reference shared vocabulary chunks from vocab/ (see build_vocab.py) instead of per-page glossaries",
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="keep running and rebuild only what changes in stories/, images/ and web/ (see watch.py)",
+    )
+    parser.add_argument(
+        "--serve", nargs="?", type=int, const=8000, metavar="PORT",
+        help="with --watch: serve the site on localhost (default port 8000) and live-reload open pages",
+    )
+    parser.add_argument(
+        "--precompress", action="store_true",
+        help="write .gz copies of the generated HTML/JSON/JS/CSS for static hosts (see precompress.py)",
+    )
+    parser.add_argument("--brotli", action="store_true", help="with --precompress: also write .br copies")
+    parser.add_argument(
+        "--stats", metavar="FILE",
+        help="write build statistics (stage times, bytes, largest/slowest stories, peak RSS) as JSON; - for stdout",
+    )
+    parser.add_argument("--profile", metavar="FILE", help="write a cProfile dump of the run (python3 -m pstats FILE)")
+    args = parser.parse_args(argv)
+    if args.compact_payload and not args.client_render:
+        parser.error("--compact-payload needs --client-render")
+    if args.brotli:
+        import precompress  # imports this module, so not at the top
+
+        if precompress.brotli is None:
+            parser.error("--brotli needs the brotli package (pip install brotli)")
+        args.precompress = True
+
+    with profiled(args.profile):
+        result = run(args)
+    if args.stats:
+        write_report(args.stats, stats.report(argv=sys.argv[1:] if argv is None else list(argv), result=result))
+
+
+def run(args) -> Optional[dict]:
+    """Carry out the parsed command line. Returns the build counts (None for --watch)."""
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.validate:
+        paths = story_paths()
+        with stats.stage("validate"):
+            report = summarize(paths, validate_paths(paths, jobs))
+        for p in report["problems"]:
+            if p["severity"] == "error":
+                print(f"{p['file']}:{p['path'] or '/'}: [{p['code']}] {p['message']}")
+        if report["errors"]:
+            print(f"Validation failed: {report['errors']} error(s) in {report['invalid']} story(ies); nothing built.")
+            sys.exit(1)
+    options = PageOptions(
+        client_render=args.client_render, inline_assets=args.inline_assets, shared_glossary=args.shared_glossary,
+        minify=args.minify, compact_payload=args.compact_payload, hashed_images=args.hashed_images,
+        service_worker=args.service_worker,
+    )
+    if options.hashed_images:
+        with stats.stage("media"):
+            print(describe_media(publish_images(force=args.force)))
+    if args.watch or args.serve is not None:
+        from watch import watch  # imports this module, so not at the top
+
+        watch(options, jobs=jobs, port=args.serve, force=args.force)
+        return None
+    from build_facets import describe as describe_facets  # imports this module, so not at the top
+
+    if args.manifest_only:
+        result = build_manifest_only(force=args.force, jobs=jobs, options=options)
+    else:
+        result = build(force=args.force, jobs=jobs, options=options)
+    if not result["stories"]:
         print("No story JSONs found in stories/")
-        return
-    manifest = build_manifest(stories)
-    manifest_js = escape_embed(json.dumps(manifest, ensure_ascii=False))
-    write_index(manifest_js)
-    write_story_pages(stories)
-    print("Generated index.html and story/<slug>/index.html for", len(stories), "stories.")
+        return result
+    if args.manifest_only:
+        print(f"Generated index.html for {result['stories']} stories "
+              f"({'updated' if result['index'] else 'unchanged'}, {result['rendered']} story page(s) rendered).")
+        print(describe_facets(result["facets"]))
+        update_service_worker(options)
+        return result
+    from build_index import build_search_index  # imports this module, so not at the top
+
+    with stats.stage("search"):
+        search = build_search_index(force=args.force)
+    print("Generated index.html and story/<slug>/index.html for", result["stories"], "stories.")
+    print(
+        f"Rendered {result['rendered']}, removed {result['removed']} orphaned page(s), "
+        f"index.html {'updated' if result['index'] else 'unchanged'}."
+    )
+    print(describe_facets(result["facets"]))
+    print(f"Search index: {search['terms']} terms in {search['shards']} shards ({search['rebuilt']} rebuilt).")
+    result["service_worker"] = update_service_worker(options)
+    if args.precompress:
+        from precompress import describe, precompress  # imports this module, so not at the top
+
+        with stats.stage("precompress"):
+            result["precompress"] = precompress(brotli_copies=args.brotli, jobs=jobs, force=args.force)
+        print("\n".join(describe(result["precompress"])))
+    with stats.stage("images"):
+        graph = build_graph()
+    missing, orphaned = {fn for _, fn, _ in graph.missing()}, graph.orphaned()
+    if missing or orphaned:
+        print(f"Images: {len(missing)} missing, {len(orphaned)} orphaned (see list_missing_images.py --orphans).")
     print("Open index.html in your browser (file://) — no server needed.")
+    return result
 
 
 if __name__ == "__main__":
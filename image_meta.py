@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Intrinsic size and a tiny inline placeholder for every image in images/, for
+generate_web.py: story pages give each <img> its width and height so the layout does not
+jump as images load, and pages and index cards show the placeholder (a PLACEHOLDER_WIDTH px
+PNG data URI of a few hundred bytes, which the browser upscales smoothly) until the image
+arrives.
+Sizes are read from the file header only (PNG IHDR, JPEG SOF, WebP VP8/VP8L/VP8X; other
+formats through Pillow, which also opens lazily). Placeholders need Pillow; without it
+images get sizes only, and placeholders are made on the first run that has it.
+.image_meta_cache.json maps each file's size and mtime to its content hash, and each
+content hash to its metadata, so only new or changed files are read and a renamed or
+copied image is not decoded again. Run by generate_web.py before each build.
+Usage: python3 image_meta.py [--json] [--force]
+"""
+import argparse
+import base64
+import hashlib
+import io
+import json
+import struct
+from pathlib import Path
+from typing import Optional
+
+from asset_graph import IMAGES_DIR, ROOT, scan_images
+
+try:  # optional: only needed for placeholders
+    from PIL import Image, ImageChops
+except ImportError:
+    Image = None
+
+IMAGE_META_CACHE_PATH = ROOT / ".image_meta_cache.json"
+# Bump when the cached metadata or placeholder format changes.
+IMAGE_META_VERSION = "1"
+PLACEHOLDER_WIDTH = 16
+BG_COLOR = (255, 255, 255)
+# Placeholders whose channels differ by at most this much are stored as gray (smaller).
+GRAY_TOLERANCE = 8
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def jpeg_size(f) -> Optional[tuple[int, int]]:
+    """(width, height) from the first JPEG start-of-frame segment; f is positioned after SOI."""
+    while True:
+        b = f.read(1)
+        while b and b != b"\xff":
+            b = f.read(1)
+        while b == b"\xff":
+            b = f.read(1)
+        if not b:
+            return None
+        marker = b[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # standalone markers
+            continue
+        if marker in (0xD9, 0xDA):  # end of image, start of scan: no frame header before
+            return None
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        length = struct.unpack(">H", segment)[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return width, height
+        f.seek(length - 2, 1)
+
+
+def webp_size(head: bytes) -> Optional[tuple[int, int]]:
+    """(width, height) from the first chunk of a RIFF/WEBP header (30 bytes are enough)."""
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and head[20:21] == b"\x2f":
+        bits = struct.unpack("<I", head[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+    return None
+
+
+def header_size(path: Path) -> Optional[tuple[int, int]]:
+    """(width, height) read from the image header, or None if it cannot be read."""
+    with path.open("rb") as f:
+        head = f.read(32)
+        if head.startswith(_PNG_SIGNATURE) and head[12:16] == b"IHDR":
+            return struct.unpack(">II", head[16:24])
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return webp_size(head)
+        if head[:2] == b"\xff\xd8":
+            f.seek(2)
+            return jpeg_size(f)
+    if Image is not None:
+        try:
+            with Image.open(path) as img:  # reads the header only
+                return img.size
+        except OSError:
+            pass
+    return None
+
+
+def make_placeholder(path: Path) -> str:
+    """A PLACEHOLDER_WIDTH px wide PNG of the image (transparency on BG_COLOR) as a data URI."""
+    with Image.open(path) as img:
+        if img.mode in ("RGBA", "LA", "P") or "transparency" in img.info:
+            rgba = img.convert("RGBA")
+            flat = Image.new("RGB", img.size, BG_COLOR)
+            flat.paste(rgba, mask=rgba.split()[-1])
+        else:
+            flat = img.convert("RGB")
+    w, h = flat.size
+    small = flat.resize((PLACEHOLDER_WIDTH, max(1, round(h * PLACEHOLDER_WIDTH / w))), Image.BOX)
+    # Largest per-pixel channel spread (max - min of R, G, B); small means the image is gray.
+    r, g, b = small.split()
+    high = ImageChops.lighter(ImageChops.lighter(r, g), b)
+    low = ImageChops.darker(ImageChops.darker(r, g), b)
+    spread = ImageChops.subtract(high, low).getextrema()[1]
+    if spread <= GRAY_TOLERANCE:
+        small = small.convert("L")
+    buf = io.BytesIO()
+    small.save(buf, format="PNG", optimize=True)
+    return "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def load_image_meta_cache() -> dict:
+    try:
+        cache = json.loads(IMAGE_META_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("version") != IMAGE_META_VERSION:
+        return {"version": IMAGE_META_VERSION, "files": {}, "meta": {}}
+    return cache
+
+
+def image_meta_from_cache(cache: dict) -> dict:
+    """{name: {width, height[, placeholder]}} for every image the cache lists."""
+    meta = cache["meta"]
+    return {name: meta[f["hash"]] for name, f in cache["files"].items() if f["hash"] in meta}
+
+
+def load_image_meta() -> dict:
+    """{name: {width, height[, placeholder]}} as of the last update_image_meta() run."""
+    return image_meta_from_cache(load_image_meta_cache())
+
+
+def update_image_meta(folder: Path = IMAGES_DIR, force: bool = False) -> dict:
+    """Bring .image_meta_cache.json up to date with folder, reading only new or changed files.
+    Returns {name: {width, height[, placeholder]}}."""
+    cache = {"version": IMAGE_META_VERSION, "files": {}, "meta": {}} if force else load_image_meta_cache()
+    old_files, old_meta = cache["files"], cache["meta"]
+    files, meta = {}, {}
+    for name, (size, mtime) in sorted(scan_images(folder).items()):
+        path = folder / name
+        record = old_files.get(name)
+        if not (record and record["size"] == size and record["mtime"] == mtime):
+            record = {"size": size, "mtime": mtime, "hash": hashlib.sha256(path.read_bytes()).hexdigest()}
+        entry = meta.get(record["hash"]) or old_meta.get(record["hash"])
+        if entry is None:
+            dims = header_size(path)
+            entry = {"width": dims[0], "height": dims[1]} if dims else {}
+        if Image is not None and "placeholder" not in entry and entry.get("width"):
+            try:
+                entry = dict(entry, placeholder=make_placeholder(path))
+            except (OSError, ValueError):
+                pass
+        files[name] = record
+        meta[record["hash"]] = entry
+    if files != old_files or meta != old_meta:
+        cache.update(files=files, meta=meta)
+        tmp = IMAGE_META_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(IMAGE_META_CACHE_PATH)
+    return image_meta_from_cache(cache)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cache image sizes and inline placeholders for generate_web.py.")
+    parser.add_argument("--json", action="store_true", help="print the metadata as JSON")
+    parser.add_argument("--force", action="store_true", help="ignore the cache and read every image again")
+    args = parser.parse_args(argv)
+    meta = update_image_meta(force=args.force)
+    if args.json:
+        print(json.dumps(meta, indent=1, sort_keys=True))
+        return
+    sized = sum(1 for m in meta.values() if m.get("width"))
+    placeholders = [len(m["placeholder"]) for m in meta.values() if m.get("placeholder")]
+    print(f"{len(meta)} images: {sized} sized, {len(placeholders)} with placeholders", end="")
+    print(f" ({sum(placeholders) / len(placeholders):,.0f} bytes on average)." if placeholders else ".")
+    if Image is None:
+        print("Pillow is not installed: no placeholders.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+__manifestShard(0, [{"id": "elefantes_mari_coco", "slug": "elefantes-mari-coco", "title": "Mari, Coco y la bolsa de gusanitos", "titleTranslation": "Mari, Coco and the bag of cheese puffs", "level": "A1", "thumbnail": "elefantes_mari_coco_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAKCAAAAACY1YFAAAAAj0lEQVR42gXB2Q6CMBAF0DulWBIwJC4Rn/z/L9MYjFBZusxMPYdUSpkMZ4tLEqKW4nez8+JEVPomtg9SsI86VJ5/9DLDYBfvwHmEmtvanw+WJEkddj5tNrrUdLDk2DuvoYuZXOxgkMU929rSO+88J5jC6TOOhxBVtqQJtE/rXYEwXUsx5WhIUaLLigZSAcAfVXFZToRFj4AAAAAASUVORK5CYII="}]);
@@ -0,0 +1 @@
+__manifestShard(0, [{"id": "apres_ski_pastel", "slug": "apres-ski-pastel", "title": "El après-ski y el pastelito", "titleTranslation": "The après-ski and the little pastry", "level": "A2", "thumbnail": "apres_ski_pastel_thumbnail_snow_mountains.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAoklEQVR42lXOSw6CMBAA0BlaCFhFoybGT4hx5f1vYkyMG4lLNiqFQmmnLW7c+E7wcIR/HGBUjJJM+wlZzzNslNPLRgzz2LBAbhVBxdHFrRvkULuaPBdQhliD8guJ7azruboWr2c47np5MhV77LEte71dKzLpYJytcjTeMUnscjh/xP2NBY7dbSMSbKPUBptOMxwBbCAOgJGNPOX4mwZEcAwBvh98VrUnGe79AAAAAElFTkSuQmCC"}]);
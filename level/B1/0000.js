@@ -0,0 +1 @@
+__manifestShard(0, [{"id": "bali_scooter", "slug": "bali-scooter", "title": "El surfista y la scooter en Bali", "titleTranslation": "The surfer and the scooter in Bali", "level": "B1", "thumbnail": "bali_scooter_thumbnail_surfer_beach.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAqklEQVR42mP8t36bmb84Axwwvdt6+DSM8/sXAwPLPS1HLiEGBoa/n9h+M///y8mstz1a7+80dY6/7BzsTAwVwiw8NTos3/48/flT5A/zvw9uL5jucv94eCv9xRf2//+Y2O6+/sC47LGIBsNafeXvos/5T0kKyjDePijP/O8FzydeIdkfXPwCDIx/nn//fEtEUuEHGwfrHxYGBsbfr39L/+BihDuM8T8DKgAAhLk/jN5yTd8AAAAASUVORK5CYII="}]);
@@ -0,0 +1 @@
+__manifestShard(0, [{"id": "bad_bunny_dtmf", "slug": "bad-bunny-dtmf", "title": "Bad Bunny - DtMf (DeBÍ TiRAR MáS FOToS)", "titleTranslation": "Bad Bunny - I Should Have Taken More Photos", "level": "B2", "thumbnail": "bad_bunny_dtmf_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAoElEQVR42lXByQ6CMBQF0PugAkUpIGpINNH//yDjwgWJMxtGxWJ9de05xNeo0gaeT0Y2K09SdQim4bGbZsH3FchMOYMc+LaAfYlHUBYRRH6yfX5JU3eX6q5n14GabRqW4UBJDF/DwQZ2XIZ93n1HtzYg7u7z4azWhU1SensxsdEjt6xa4yUzQRAQYlI969VeuIgIIAaXpbZb9YmsA4AY/37RE0glTq7VlAAAAABJRU5ErkJggg=="}, {"id": "espana_2021_silla_rota", "slug": "espana-2021-silla-rota", "title": "La silla rota del Airbnb", "titleTranslation": "The broken chair at the Airbnb", "level": "B2", "thumbnail": "espana_2021_silla_rota_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAMCAAAAABOjGJdAAAAv0lEQVR42gXBy3LCIAAF0AtCAgMmih11Wu1j6cY/6P9vunSpnW6qsbaMojElQfAcEhFpYGhkPHAdeY9dRCX//evHu/3+nOFtwn523WlJbB02ejxwvxPWzG12ls6s9JGncQRtvszM6yNv2rliPgOtq+2fWpt8eNitUVPQbpDK0L/qYG4Plc1AlTRues6vISNFMeqBLp5exKlz3CMflo8UrBDp1kpZuiSU1wmMCkz3zzbC52pEABKBVLf80udRAsAdWvhS0F4Q7mgAAAAASUVORK5CYII="}]);
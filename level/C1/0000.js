@@ -0,0 +1 @@
+__manifestShard(0, [{"id": "azotea_caja_preguntas", "slug": "azotea-caja-preguntas", "title": "La caja de las preguntas", "titleTranslation": "The box of questions", "level": "C1", "thumbnail": "azotea_caja_preguntas_thumbnail_rooftop.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAALCAAAAABTiVLlAAAAwElEQVR42gXBy26CQBQA0Dt3xqFIwEdDKmof6sqNa/d+Sb+zSVeNCxPXjTHGlWimKFqReQF6DslLUgcAANClhPgVrVMd5DEXN6FUbf2tWD1DX4HOlT1dFmbEWWlvLz6S05wG4qk9kCzdg3mz6E855marPTqjARZ6F5MvUfxWjQv9tIm+Z+efiCRypdIW7TjXj038jK4LIQZZhw25WIbRlQW8GrSTP8M8OjkfR7bbdCL0zPidLEnJ+8gLfic1+Z/2Hqk1WD0Z18kFAAAAAElFTkSuQmCC"}, {"id": "vecino_televisor", "slug": "vecino-televisor", "title": "Lo que oía a través de la pared", "titleTranslation": "What I heard through the wall", "level": "C1", "thumbnail": "vecino_televisor_thumbnail.png", "category": "Grammar", "thumbnailPlaceholder": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAKCAAAAACY1YFAAAAAi0lEQVR42gXBuQ6CQBRA0ftghj1IRCko/f/fsbTQxkTD5hIws3mOeKzyIkBAAIWfjusz100041ohms8La2e3OzYJV4is8dhb+2jAFQsoqYth6XU9lmbyFShHUpwuaWdgFwyozB2GPI1shWgPKDo+aVxajbyCdrGq+eVj795BZB+yGPHgvokthS0D+AOxbzsWnkAIqwAAAABJRU5ErkJggg=="}]);
@@ -3,16 +3,21 @@
 List missing story images. For each missing image, prints the filename to use
 and the full prompt (base style + story prompt) for AI image generation.
 Searches the stories/ folder for *.json. Expects images in ./images/.
-Usage: python3 list_missing_images.py
+Missing and orphaned images come from asset_graph.py (one scan of images/, cached story
+references); like before, each story lists its own missing images. --jsonl writes the
+prompts as a batch file for a generation queue, one {"story", "filename", "save_as", "prompt"}
+object per missing file (an image several stories use is generated once, with the first
+story's prompt); --orphans also lists files in images/ that no story references.
+Usage: python3 list_missing_images.py [--jsonl FILE] [--orphans]
 """
 
+import argparse
 import json
-import os
 import sys
 from pathlib import Path
 
-STORIES_DIR = Path("stories")
-IMAGES_DIR = Path("images")
+from asset_graph import IMAGES_DIR, build_graph
+
 BASE_PROMPT = (
     "Style to generate image: white bg, and only black lines, like a hand drawn pencil sketch. Not realistic, but a sketch. Not too much details. No shades or other colors. Ignore any colors in the prompt."
     "Never draw text"
@@ -20,77 +25,51 @@ BASE_PROMPT = (
 )
 
 
-def collect_images(story_path: Path, data: dict) -> list[tuple[str, str]]:
-    """Return list of (filename, story_prompt) for thumbnail + content images."""
-    out = []
-    # Thumbnail
-    if "thumbnail" in data and data["thumbnail"]:
-        t = data["thumbnail"]
-        fn = t.get("filename", "").strip()
-        if fn:
-            if not fn.lower().endswith(".png"):
-                fn = fn + ".png"
-            out.append((fn, t.get("generation_prompt", "")))
-    # Content images
-    for item in data.get("content") or []:
-        if item.get("type") != "image":
-            continue
-        fn = item.get("filename", "").strip()
-        if not fn:
-            continue
-        if not fn.lower().endswith(".png"):
-            fn = fn + ".png"
-        out.append((fn, item.get("generation_prompt", "")))
-    return out
+def full_prompt(story_prompt: str) -> str:
+    base_prompt = BASE_PROMPT.strip()
+    return base_prompt + story_prompt if story_prompt else base_prompt.rstrip()
 
 
 def main() -> None:
-    root = Path(__file__).resolve().parent
-    os.chdir(root)
-    images_dir = root / IMAGES_DIR
-    images_dir.mkdir(exist_ok=True)
+    parser = argparse.ArgumentParser(description="List missing story images with their generation prompts.")
+    parser.add_argument("--jsonl", type=Path, metavar="FILE", help="also write the missing images as a JSONL batch")
+    parser.add_argument("--orphans", action="store_true", help="also list images no story references")
+    args = parser.parse_args()
 
-    stories_dir = root / STORIES_DIR
-    paths = sorted(
-        p for p in (stories_dir.glob("*.json") if stories_dir.is_dir() else [])
-        if p.name != "manifest.json"
-    )
-
-    if not paths:
+    IMAGES_DIR.mkdir(exist_ok=True)
+    graph = build_graph()
+    if not graph.stories:
         print("No story JSONs found in stories/.", file=sys.stderr)
         sys.exit(1)
 
-    base_prompt = BASE_PROMPT.strip()
-    any_missing = False
-
-    for path in sorted(paths):
-        if not path.is_file():
-            print(f"Skip (not a file): {path}", file=sys.stderr)
-            continue
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except Exception as e:
-            print(f"Error reading {path}: {e}", file=sys.stderr)
-            continue
-
-        if not isinstance(data, dict):
-            continue
+    missing = graph.missing()
+    for story_name, filename, story_prompt in missing:
+        print(f"--- {story_name}: {filename} ---")
+        print(f"Save as: {filename}")
+        print(f"Full prompt:\n{full_prompt(story_prompt)}")
+        print()
+    if not missing:
+        print("No missing images.")
 
-        images = collect_images(path, data)
-        story_name = path.stem
-        for filename, story_prompt in images:
-            full_path = images_dir / filename
-            if full_path.is_file():
-                continue
-            any_missing = True
-            full_prompt = base_prompt + story_prompt if story_prompt else base_prompt.rstrip()
-            print(f"--- {story_name}: {filename} ---")
-            print(f"Save as: {filename}")
-            print(f"Full prompt:\n{full_prompt}")
-            print()
+    if args.jsonl:
+        batch = {}
+        for story_name, filename, story_prompt in missing:
+            batch.setdefault(filename, {
+                "story": story_name,
+                "filename": filename,
+                "save_as": f"images/{filename}",
+                "prompt": full_prompt(story_prompt),
+            })
+        with open(args.jsonl, "w", encoding="utf-8") as f:
+            for job in batch.values():
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+        print(f"Wrote {len(batch)} prompt(s) to {args.jsonl}")
 
-    if not any_missing:
-        print("No missing images.")
+    if args.orphans:
+        orphaned = graph.orphaned()
+        print(f"Orphaned images ({len(orphaned)}):" if orphaned else "No orphaned images.")
+        for name in orphaned:
+            print(f"  images/{name}")
 
 
 if __name__ == "__main__":
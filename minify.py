@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Whitespace and comment minifiers for generate_web.py --minify: page templates (HTML, with
+their inline <script>/<style>), the web/ CSS and JS, applied once per build. They only
+drop comments and whitespace that cannot matter; nothing is renamed or rewritten.
+  CSS   comments go; whitespace around { } ; , > and after : goes; the last ; in a block goes
+  JS    comments go; indentation and blank lines go; a space is kept wherever dropping it
+        would join two tokens (a b, a + +b, a / /re/), line breaks only go after { ( [ , ;
+        or before } ) ], so automatic semicolon insertion sees the same statements
+  HTML  whitespace next to a block-level or head element is dropped; between inline
+        elements it shrinks to one space
+--check renders every story and index.html both ways and compares them: the same
+elements, attributes and text, and the same JS/CSS token streams in scripts, styles and
+web/ assets (so the minified pages behave the same as the readable ones).
+Usage: python3 minify.py --check [--limit N]
+"""
+import argparse
+import re
+import sys
+from html.parser import HTMLParser
+
+# Elements whose surrounding whitespace never renders.
+BLOCK_TAGS = frozenset((
+    "!doctype", "html", "head", "body", "meta", "title", "link", "script", "style", "noscript", "template",
+    "div", "header", "main", "footer", "section", "nav", "article", "aside", "p", "h1", "h2", "h3", "h4",
+    "dl", "dt", "dd", "ul", "ol", "li", "br", "hr", "figure", "figcaption", "picture", "source",
+))
+_SLOT_RE = re.compile(r"__[A-Z][A-Z0-9_]*[A-Z0-9]__")
+# Content-hashed assets/ names (story.<hash>.css); minified assets get their own hash.
+_HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{10}\.(css|js)$")
+
+# --- JS ---
+
+_JS_PUNCTUATORS = sorted((
+    ">>>=", "...", "===", "!==", "**=", "<<=", ">>=", ">>>", "&&=", "||=", "??=",
+    "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--", "+=", "-=", "*=", "/=", "%=",
+    "&=", "|=", "^=", "<<", ">>", "**",
+), key=len, reverse=True)
+# After these a / starts a regular expression, not a division.
+_JS_REGEX_KEYWORDS = frozenset((
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else",
+    "yield", "await",
+))
+_JS_WORD_RE = re.compile(r"[\w$\u0080-\U0010ffff]+")
+_JS_SPACE_RE = re.compile(r"[ \t\r\n\f\v\u00a0\ufeff\u2028\u2029]+")
+
+
+def _scan_quoted(src: str, i: int, quote: str) -> int:
+    """Index just past the string or template literal starting at src[i]."""
+    i += 1
+    depth = 0
+    while i < len(src):
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if quote == "`":
+            if src.startswith("${", i):
+                depth += 1
+                i += 2
+                continue
+            if c == "}" and depth:
+                depth -= 1
+            elif c == "`" and not depth:
+                return i + 1
+        elif c == quote:
+            return i + 1
+        i += 1
+    return i
+
+
+def _scan_regex(src: str, i: int) -> int:
+    """Index just past the regular expression literal (with flags) starting at src[i]."""
+    i += 1
+    in_class = False
+    while i < len(src):
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            i += 1
+            break
+        elif c == "\n":
+            break
+        i += 1
+    m = _JS_WORD_RE.match(src, i)
+    return m.end() if m else i
+
+
+def js_tokens(src: str) -> list[tuple[str, str]]:
+    """(kind, text) tokens: word, string, regex, punct, space (kind "nl" if it held a line break);
+    comments are dropped."""
+    out = []
+    i = 0
+    last = None  # last significant token, for telling regexes from divisions
+    while i < len(src):
+        c = src[i]
+        m = _JS_SPACE_RE.match(src, i)
+        if m:
+            text = m.group()
+            out.append(("nl" if "\n" in text or "\u2028" in text or "\u2029" in text else "space", text))
+            i = m.end()
+            continue
+        if src.startswith("//", i):
+            end = src.find("\n", i)
+            i = len(src) if end < 0 else end
+            continue
+        if src.startswith("/*", i):
+            end = src.find("*/", i + 2)
+            i = len(src) if end < 0 else end + 2
+            out.append(("space", " "))  # a block comment separates tokens like whitespace
+            continue
+        if c in "'\"`":
+            end = _scan_quoted(src, i, c)
+            tok = ("string", src[i:end])
+        elif c == "/" and (
+            last is None
+            or (last[0] == "punct" and last[1] not in (")", "]", "}"))
+            or (last[0] == "word" and last[1] in _JS_REGEX_KEYWORDS)
+        ):
+            end = _scan_regex(src, i)
+            tok = ("regex", src[i:end])
+        else:
+            m = _JS_WORD_RE.match(src, i)
+            if m:
+                end = m.end()
+                # Decimal fractions and exponents: 0.5, 1e-3.
+                while end < len(src) and src[i].isdigit() and src[end] in ".eE+-":
+                    if src[end] in "+-" and src[end - 1] not in "eE":
+                        break
+                    m = _JS_WORD_RE.match(src, end + 1)
+                    end = m.end() if m else end + 1
+                tok = ("word", src[i:end])
+            else:
+                p = next((p for p in _JS_PUNCTUATORS if src.startswith(p, i)), c)
+                end = i + len(p)
+                tok = ("punct", p)
+        out.append(tok)
+        last = tok
+        i = end
+    return out
+
+
+def _js_join(prev: tuple, nxt: tuple) -> bool:
+    """Whether two tokens can touch without reading as different tokens."""
+    a, b = prev[1], nxt[1]
+    if prev[0] in ("word", "regex") and nxt[0] == "word":
+        return False
+    joined = a[-1:] + b[:1]
+    return joined not in ("++", "--", "//", "/*", "+-", "-+") and not (a[-1:] == "/" and nxt[0] == "regex")
+
+
+def minify_js(src: str) -> str:
+    tokens = js_tokens(src)
+    out = []
+    prev = None
+    newline = False
+    for tok in tokens:
+        if tok[0] in ("space", "nl"):
+            newline = newline or tok[0] == "nl"
+            continue
+        if prev is not None:
+            if newline and prev[1] not in ("{", "(", "[", ",", ";") and tok[1] not in ("}", ")", "]"):
+                out.append("\n")
+            elif not _js_join(prev, tok):
+                out.append(" ")
+        out.append(tok[1])
+        prev = tok
+        newline = False
+    return "".join(out)
+
+
+def js_signature(src: str) -> list[str]:
+    """Significant JS tokens, for checking that minifying kept the program the same."""
+    return [t[1] for t in js_tokens(src) if t[0] not in ("space", "nl")]
+
+
+# --- CSS ---
+
+_CSS_TOKEN_RE = re.compile(
+    r"""(?P<comment>/\*.*?\*/)|(?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(?P<space>\s+)"""
+    r"""|(?P<word>[^\s{}:;,>()"'/*]+)|(?P<punct>.)""",
+    re.S,
+)
+
+
+def css_tokens(src: str) -> list[tuple[str, str]]:
+    return [(m.lastgroup, m.group()) for m in _CSS_TOKEN_RE.finditer(src)]
+
+
+def minify_css(src: str) -> str:
+    tokens = [t for t in css_tokens(src) if t[0] != "comment"]
+    out = []
+    for i, (kind, text) in enumerate(tokens):
+        if kind == "space":
+            prev = out[-1] if out else ""
+            nxt = tokens[i + 1][1] if i + 1 < len(tokens) else ""
+            if not prev or not nxt or prev[-1] in "{};:,>" or nxt[0] in "{};,>":
+                continue
+            out.append(" ")
+        elif text == "}" and out and out[-1] == ";":
+            out[-1] = "}"
+        else:
+            out.append(text)
+    return "".join(out)
+
+
+def css_signature(src: str) -> list[str]:
+    tokens = [t[1] for t in css_tokens(src) if t[0] not in ("space", "comment")]
+    return [t for i, t in enumerate(tokens) if not (t == ";" and i + 1 < len(tokens) and tokens[i + 1] == "}")]
+
+
+# --- HTML ---
+
+_HTML_TOKEN_RE = re.compile(
+    r"(?P<comment><!--.*?-->)|(?P<raw><(script|style)\b[^>]*>)(?P<body>.*?)(?P<close></(?:script|style)\s*>)"
+    r"|(?P<tag></?[!\w][^>]*>)|(?P<text>[^<]+|<)",
+    re.S | re.I,
+)
+
+
+def _tag_name(tag: str) -> str:
+    m = re.match(r"</?([!\w-]+)", tag)
+    return m.group(1).lower() if m else ""
+
+
+def _is_boundary(piece) -> bool:
+    """A neighbour that makes adjacent whitespace insignificant: block tag, slot, start or end."""
+    return piece is None or piece[0] == "slot" or (piece[0] == "tag" and _tag_name(piece[1]) in BLOCK_TAGS)
+
+
+def minify_html(src: str) -> str:
+    """Minify an HTML page or template; __SLOT__ placeholders on their own stand for head or
+    block content (links, scripts, styles), as they do in generate_web's templates."""
+    pieces = []
+    for m in _HTML_TOKEN_RE.finditer(src):
+        if m.group("comment"):
+            continue
+        if m.group("raw"):
+            body = m.group("body")
+            body = minify_css(body) if m.group(3).lower() == "style" else minify_js(body)
+            pieces.append(("tag", m.group("raw") + body + m.group("close")))
+        elif m.group("tag"):
+            pieces.append(("tag", m.group("tag")))
+        else:
+            for part in re.split(r"(\s+|" + _SLOT_RE.pattern + ")", m.group("text")):
+                if not part:
+                    continue
+                kind = "space" if part.isspace() else "slot" if _SLOT_RE.fullmatch(part) else "text"
+                pieces.append((kind, part))
+    out = []
+    for i, (kind, text) in enumerate(pieces):
+        if kind != "space":
+            out.append(text)
+            continue
+        prev = pieces[i - 1] if i else None
+        nxt = pieces[i + 1] if i + 1 < len(pieces) else None
+        if prev and nxt and prev[0] == nxt[0] == "slot":
+            out.append("\n")  # keeps the two placeholders apart
+        elif not (_is_boundary(prev) or _is_boundary(nxt)):
+            out.append(" ")
+    return "".join(out)
+
+
+class _Outline(HTMLParser):
+    """Elements, attributes, text and script/style token streams of a page, whitespace-normalized."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.events = []
+        self.raw = None  # (tag, [data chunks]) inside <script> or <style>
+
+    def handle_starttag(self, tag, attrs):
+        attrs = [(k, _HASHED_ASSET_RE.sub(r".#.\1", v or "")) for k, v in attrs]
+        self.events.append(("start", tag, tuple(attrs)))
+        if tag in ("script", "style"):
+            self.raw = (tag, [])
+
+    def handle_startendtag(self, tag, attrs):
+        self.events.append(("start", tag, tuple(attrs)))
+
+    def handle_endtag(self, tag):
+        if self.raw:
+            kind, chunks = self.raw
+            signature = js_signature if kind == "script" else css_signature
+            self.events.append((kind, tuple(signature("".join(chunks)))))
+            self.raw = None
+        self.events.append(("end", tag))
+
+    def handle_data(self, data):
+        if self.raw:
+            self.raw[1].append(data)
+        else:
+            self.events.append(("text", data))
+
+    def handle_decl(self, decl):
+        self.events.append(("decl", decl.lower()))
+
+    def outline(self) -> list:
+        """Events with whitespace-only text next to block elements dropped and other runs collapsed."""
+        out = []
+        events = self.events
+        for i, e in enumerate(events):
+            if e[0] != "text":
+                out.append(e)
+                continue
+            text = re.sub(r"\s+", " ", e[1])
+            if not text.strip():
+                prev = events[i - 1] if i else None
+                nxt = events[i + 1] if i + 1 < len(events) else None
+                if any(
+                    n is None or n[0] == "decl" or (n[0] in ("start", "end") and n[1] in BLOCK_TAGS)
+                    for n in (prev, nxt)
+                ):
+                    continue
+            if out and out[-1][0] == "text":
+                out[-1] = ("text", out[-1][1] + text)
+            else:
+                out.append(("text", text))
+        return out
+
+
+def page_outline(html: str) -> list:
+    parser = _Outline()
+    parser.feed(html)
+    parser.close()
+    return parser.outline()
+
+
+def compare_pages(readable: str, minified: str) -> str:
+    """'' when both pages have the same outline, else a description of the first difference."""
+    a, b = page_outline(readable), page_outline(minified)
+    for i, (x, y) in enumerate(zip(a, b)):
+        if x != y:
+            return f"event {i}: {str(x)[:120]} != {str(y)[:120]}"
+    if len(a) != len(b):
+        return f"{len(a)} events != {len(b)} events"
+    return ""
+
+
+def check(limit: int = 0) -> int:
+    """Render pages readable and minified and compare them. Returns the number of differences."""
+    import generate_web as gw  # imports this module, so not at the top
+    from build_facets import facet_groups, index_nav_html, listing_html
+
+    problems = 0
+    for name, text in gw.load_web_assets().items():
+        signature = js_signature if name.endswith(".js") else css_signature
+        minify = minify_js if name.endswith(".js") else minify_css
+        if signature(text) != signature(minify(text)):
+            print(f"web/{name}: token streams differ after minifying")
+            problems += 1
+    paths = gw.story_paths()
+    if limit:
+        paths = paths[:limit]
+    stories = {p.stem: gw.parse_story(p.read_bytes(), p.name) for p in paths}
+    stories = {sid: data for sid, data in stories.items() if data is not None}
+    manifest = gw.build_manifest(stories)
+    root = {"total": len(manifest), "shardSize": gw.MANIFEST_SHARD_SIZE, "shards": []}
+    groups = facet_groups(manifest)
+    pages = 0
+    for client_render in (False, True):
+        for inline_assets in (False, True):
+            flags = dict(client_render=client_render, inline_assets=inline_assets)
+            readable, minified = gw.PageOptions(**flags), gw.PageOptions(minify=True, **flags)
+            label = ", ".join(k for k, v in flags.items() if v) or "default"
+            nav = index_nav_html(manifest)
+            pairs = [("index.html", gw.index_page_html(root, manifest, readable, nav), gw.index_page_html(root, manifest, minified, nav))]
+            for facet, values in groups.items():
+                for value in values:
+                    pairs.append((
+                        f"{facet}/{value}/index.html",
+                        listing_html(facet, value, groups, root, readable),
+                        listing_html(facet, value, groups, root, minified),
+                    ))
+            for sid, data in stories.items():
+                slug = gw.slugify(sid)
+                pairs.append((
+                    f"story/{slug}/index.html",
+                    gw.story_page_html(data, slug, readable),
+                    gw.story_page_html(data, slug, minified),
+                ))
+            for page, a, b in pairs:
+                pages += 1
+                diff = compare_pages(a, b)
+                if diff:
+                    print(f"{page} ({label}): {diff}")
+                    problems += 1
+    print(f"Compared {pages} page renders and {len(gw.WEB_ASSETS)} assets: {problems} difference(s).")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that --minify pages match the readable ones.")
+    parser.add_argument("--check", action="store_true", help="compare readable and minified renders of every page")
+    parser.add_argument("--limit", type=int, default=0, metavar="N", help="only check the first N stories")
+    args = parser.parse_args(argv)
+    if not args.check:
+        parser.print_help()
+        return
+    sys.exit(1 if check(args.limit) else 0)
+
+
+if __name__ == "__main__":
+    main()
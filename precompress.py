@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Write precompressed copies of the generated site next to each output: <file>.gz (gzip
+level 9) and, with --brotli, <file>.br (quality 11; needs the brotli package), so a
+static host can serve them as-is (nginx gzip_static/brotli_static, Caddy precompressed).
+Covers index.html, sw.js, story/*/index.html and the HTML, JSON, JS and CSS files in manifest/,
+assets/, search/, vocab/ and the level/ and category/ listings. Files under MIN_SIZE bytes,
+and copies that would not be smaller, are skipped.
+.precompress_cache.json records each output's size, mtime and content hash with its
+compressed sizes, so unchanged outputs are not recompressed (generate_web.py never
+rewrites an unchanged output, so its stat stays the same); copies whose output is gone
+are deleted. Run by generate_web.py --precompress after a full build.
+Usage: python3 precompress.py [--brotli] [--jobs N] [--force]
+"""
+import argparse
+import gzip
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_facets import FACETS
+from build_stats import stats
+from generate_web import ASSETS_DIR, MANIFEST_DIR, ROOT, STORY_OUTPUT_DIR, VOCAB_DIR, sha256_hex
+
+try:  # optional: only needed for .br copies
+    import brotli
+except ImportError:
+    brotli = None
+
+PRECOMPRESS_CACHE_PATH = ROOT / ".precompress_cache.json"
+# Bump when the encoder settings change.
+PRECOMPRESS_VERSION = "1"
+EXTENSIONS = (".html", ".json", ".js", ".css")
+# Smaller files fit in one packet anyway; compressing them only adds files.
+MIN_SIZE = 256
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def output_files() -> list[Path]:
+    """Every generated output that gets compressed copies, in a stable order."""
+    out = [ROOT / "index.html", ROOT / "sw.js"]
+    if STORY_OUTPUT_DIR.is_dir():
+        out += sorted(STORY_OUTPUT_DIR.glob("*/index.html"))
+    for folder in (MANIFEST_DIR, ASSETS_DIR, ROOT / "search", VOCAB_DIR):
+        if folder.is_dir():
+            out += sorted(p for p in folder.iterdir() if p.suffix in EXTENSIONS and p.is_file())
+    for facet in FACETS:  # level/category listings and their shards (build_facets.py)
+        if (ROOT / facet).is_dir():
+            out += sorted(p for p in (ROOT / facet).rglob("*") if p.suffix in EXTENSIONS and p.is_file())
+    return [p for p in out if p.is_file()]
+
+
+def encode(data: bytes, fmt: str) -> bytes:
+    if fmt == "gz":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)  # mtime=0: same bytes every build
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def compress_file(path: Path, formats: tuple, digest: str = None) -> dict:
+    """Write path.<fmt> for each format, or remove it when compression does not pay.
+    Returns {hash, size, <fmt>: compressed size or 0}; runs in worker processes with --jobs."""
+    data = path.read_bytes()
+    record = {"hash": digest or sha256_hex(data), "size": len(data)}
+    for fmt in formats:
+        target = path.with_name(path.name + "." + fmt)
+        packed = encode(data, fmt) if len(data) >= MIN_SIZE else b""
+        if packed and len(packed) < len(data):
+            tmp = target.with_name(target.name + ".tmp")
+            tmp.write_bytes(packed)
+            tmp.replace(target)
+            record[fmt] = len(packed)
+        else:
+            target.unlink(missing_ok=True)
+            record[fmt] = 0
+    return record
+
+
+def _compress_batch(batch: list) -> list:
+    return [compress_file(*task) for task in batch]
+
+
+def load_precompress_cache() -> dict:
+    try:
+        cache = json.loads(PRECOMPRESS_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("version") != PRECOMPRESS_VERSION:
+        return {"version": PRECOMPRESS_VERSION, "formats": [], "files": {}}
+    return cache
+
+
+def copies_exist(path: Path, record: dict, formats: tuple) -> bool:
+    return all(not record.get(fmt) or path.with_name(path.name + "." + fmt).is_file() for fmt in formats)
+
+
+def precompress(brotli_copies: bool = False, jobs: int = 1, force: bool = False) -> dict:
+    """Bring the .gz (and .br) copies of every output up to date.
+    Returns {files, compressed, bytes: {file type or "all": {raw, gz[, br]}}}."""
+    formats = ("gz", "br") if brotli_copies else ("gz",)
+    if brotli_copies and brotli is None:
+        raise RuntimeError("--brotli needs the brotli package (pip install brotli)")
+    cache = load_precompress_cache()
+    old = cache["files"]
+    if force or cache["formats"] != list(formats):
+        for fmt in set(cache["formats"]) - set(formats):  # e.g. .br copies after dropping --brotli
+            for rel in old:
+                (ROOT / (rel + "." + fmt)).unlink(missing_ok=True)
+        cache["formats"] = list(formats)
+        old = {}
+    files = {}
+    tasks = []
+    for path in output_files():
+        rel = path.relative_to(ROOT).as_posix()
+        st = path.stat()
+        record = old.get(rel)
+        if record and record.get("mtime") == st.st_mtime_ns and record["size"] == st.st_size and copies_exist(path, record, formats):
+            files[rel] = record
+            continue
+        digest = None
+        if record and record["size"] == st.st_size:
+            # Touched but maybe not changed: same content means the copies are still right.
+            data = path.read_bytes()
+            stats.read(len(data))
+            digest = sha256_hex(data)
+            if digest == record["hash"] and copies_exist(path, record, formats):
+                files[rel] = dict(record, mtime=st.st_mtime_ns)
+                continue
+        tasks.append((path, formats, digest))
+
+    if jobs > 1 and len(tasks) > 1:
+        size = max(1, -(-len(tasks) // (jobs * 4)))
+        batches = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = [r for batch in pool.map(_compress_batch, batches) for r in batch]
+    else:
+        results = _compress_batch(tasks)
+    for (path, _, _), record in zip(tasks, results):
+        record["mtime"] = path.stat().st_mtime_ns
+        files[path.relative_to(ROOT).as_posix()] = record
+        stats.read(record["size"])
+        for fmt in formats:
+            if record[fmt]:
+                stats.wrote(record[fmt])
+
+    # Copies whose output was deleted (orphaned story pages go with their directory).
+    for rel in old.keys() - files.keys():
+        for fmt in formats:
+            (ROOT / (rel + "." + fmt)).unlink(missing_ok=True)
+
+    cache["files"] = files
+    tmp = PRECOMPRESS_CACHE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(PRECOMPRESS_CACHE_PATH)
+    totals = {}
+    for rel, record in files.items():
+        for kind in ("all", Path(rel).suffix[1:]):
+            t = totals.setdefault(kind, {"raw": 0, **{fmt: 0 for fmt in formats}})
+            t["raw"] += record["size"]
+            for fmt in formats:
+                # Files left uncompressed are served as-is.
+                t[fmt] += record[fmt] or record["size"]
+    return {"files": len(files), "compressed": len(tasks), "bytes": totals}
+
+
+def describe(result: dict) -> list[str]:
+    """Report lines: compressed sizes and ratios per file type, then overall."""
+    lines = [f"Precompressed {result['compressed']} of {result['files']} outputs."]
+    totals = result["bytes"]
+    for kind in sorted(totals, key=lambda k: k == "all"):
+        t = totals[kind]
+        parts = [f"{fmt} {t[fmt] / 1024:,.0f} KB ({t[fmt] / t['raw']:.0%})" for fmt in t if fmt != "raw"]
+        lines.append(f"  {kind:<5} {t['raw'] / 1024:>9,.0f} KB -> " + ", ".join(parts))
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write .gz/.br copies of the generated site for static hosting.")
+    parser.add_argument("--brotli", action="store_true", help="also write .br copies (needs the brotli package)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N", help="worker processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="ignore the cache and recompress every output")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    try:
+        result = precompress(brotli_copies=args.brotli, jobs=jobs, force=args.force)
+    except RuntimeError as e:
+        parser.error(str(e))
+    print("\n".join(describe(result)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Publish images/ (and the responsive variants in images/derived/) as a content-addressed
+store: media/<content hash>.<ext>, one file per distinct content, so identical images
+used by several stories are stored and downloaded once, and every URL is safe to serve
+with immutable caching (changed content gets a new name).
+media/map.json maps each path relative to images/ ("a.png", "derived/a-320.webp") to its
+media/ name; generate_web.py --hashed-images rewrites image URLs, card thumbnails and
+og:image through it. Files in media/ that the map no longer uses are removed.
+.media_cache.json keeps each source's size, mtime and hash, so unchanged files are not
+re-read. Run by generate_web.py --hashed-images before each build.
+Usage: python3 publish_images.py [--force]
+"""
+import argparse
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+from asset_graph import IMAGES_DIR, ROOT, scan_images
+
+MEDIA_DIR = ROOT / "media"
+MEDIA_MAP_NAME = "map.json"
+MEDIA_MAP_PATH = MEDIA_DIR / MEDIA_MAP_NAME
+MEDIA_CACHE_PATH = ROOT / ".media_cache.json"
+# Hex digits of the SHA-256 kept in media/ names.
+MEDIA_HASH_LENGTH = 16
+DERIVED_DIRNAME = "derived"
+# Formats compress_images.py --derivatives writes.
+DERIVED_EXTS = (".webp", ".avif")
+
+
+def source_files(images_dir: Path = IMAGES_DIR) -> dict:
+    """{path relative to images_dir: (size, mtime_ns)} for the images and their derivatives."""
+    out = dict(scan_images(images_dir))
+    derived = images_dir / DERIVED_DIRNAME
+    if derived.is_dir():
+        for p in derived.iterdir():
+            if p.suffix.lower() in DERIVED_EXTS and p.is_file():
+                st = p.stat()
+                out[f"{DERIVED_DIRNAME}/{p.name}"] = (st.st_size, st.st_mtime_ns)
+    return out
+
+
+def load_media_cache() -> dict:
+    """.media_cache.json: {path relative to images/: {size, mtime, hash}}."""
+    try:
+        cache = json.loads(MEDIA_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def publish_images(images_dir: Path = IMAGES_DIR, force: bool = False) -> dict:
+    """Copy every new content into media/, rewrite media/map.json when it changes and
+    remove unused media/ files. Returns {files, unique, copied, removed, deduplicated}
+    (deduplicated: bytes not stored twice)."""
+    old = {} if force else load_media_cache()
+    cache = {}
+    mapping = {}
+    stored = set()
+    copied = duplicate_bytes = 0
+    MEDIA_DIR.mkdir(exist_ok=True)
+    for rel, (size, mtime) in sorted(source_files(images_dir).items()):
+        record = old.get(rel)
+        if not (record and record["size"] == size and record["mtime"] == mtime):
+            digest = hashlib.sha256((images_dir / rel).read_bytes()).hexdigest()
+            record = {"size": size, "mtime": mtime, "hash": digest}
+        cache[rel] = record
+        name = record["hash"][:MEDIA_HASH_LENGTH] + Path(rel).suffix.lower()
+        if name in stored:
+            duplicate_bytes += size
+        else:
+            target = MEDIA_DIR / name
+            if force or not target.is_file() or target.stat().st_size != size:
+                tmp = target.with_name(name + ".tmp")
+                shutil.copyfile(images_dir / rel, tmp)
+                tmp.replace(target)
+                copied += 1
+            stored.add(name)
+        mapping[rel] = name
+
+    text = json.dumps(mapping, indent=1, sort_keys=True)
+    try:
+        unchanged = MEDIA_MAP_PATH.read_text(encoding="utf-8") == text
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        MEDIA_MAP_PATH.write_text(text, encoding="utf-8")
+    keep = stored | {MEDIA_MAP_NAME}
+    removed = 0
+    for p in MEDIA_DIR.iterdir():
+        if p.is_file() and p.name not in keep:
+            p.unlink()
+            removed += 1
+    if cache != old:
+        tmp = MEDIA_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(MEDIA_CACHE_PATH)
+    return {
+        "files": len(mapping), "unique": len(stored), "copied": copied,
+        "removed": removed, "deduplicated": duplicate_bytes,
+    }
+
+
+def describe(result: dict) -> str:
+    line = (
+        f"media/: {result['files']} image file(s) as {result['unique']} unique, "
+        f"{result['copied']} copied, {result['removed']} removed"
+    )
+    if result["deduplicated"]:
+        line += f", {result['deduplicated'] / 1024:,.0f} KB of duplicates not stored"
+    return line + "."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish images/ as content-addressed files in media/.")
+    parser.add_argument("--force", action="store_true", help="re-hash and re-copy every image")
+    args = parser.parse_args(argv)
+    print(describe(publish_images(force=args.force)))
+
+
+if __name__ == "__main__":
+    main()
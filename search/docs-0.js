@@ -0,0 +1 @@
+__searchDocs(0, {"0":["apres-ski-pastel","El après-ski y el pastelito","The après-ski and the little pastry","A2"],"1":["azotea-caja-preguntas","La caja de las preguntas","The box of questions","C1"],"2":["bad-bunny-dtmf","Bad Bunny - DtMf (DeBÍ TiRAR MáS FOToS)","Bad Bunny - I Should Have Taken More Photos","B2"],"3":["bali-scooter","El surfista y la scooter en Bali","The surfer and the scooter in Bali","B1"],"4":["elefantes-mari-coco","Mari, Coco y la bolsa de gusanitos","Mari, Coco and the bag of cheese puffs","A1"],"5":["espana-2021-silla-rota","La silla rota del Airbnb","The broken chair at the Airbnb","B2"],"6":["vecino-televisor","Lo que oía a través de la pared","What I heard through the wall","C1"]});
@@ -0,0 +1 @@
+__searchIndex({"version":"3","prefixLength":2,"docChunkSize":500,"shards":{"20":{"file":"t-20","hash":"c25b509eeb73"},"a":{"file":"t-a","hash":"7e3d763ee8ab"},"ab":{"file":"t-ab","hash":"173144f53f85"},"ac":{"file":"t-ac","hash":"ac11dbf15a93"},"ad":{"file":"t-ad","hash":"29caaca2613d"},"af":{"file":"t-af","hash":"98a840f8c143"},"ag":{"file":"t-ag","hash":"e5f51ed1c07c"},"ah":{"file":"t-ah","hash":"ea9e49a1e2fd"},"ai":{"file":"t-ai","hash":"9be7638e97c6"},"al":{"file":"t-al","hash":"43f983b84c2d"},"am":{"file":"t-am","hash":"9ebf411fc305"},"an":{"file":"t-an","hash":"15be3ea0c25e"},"ap":{"file":"t-ap","hash":"3de067cb2a07"},"aq":{"file":"t-aq","hash":"7d670d09d6d5"},"ar":{"file":"t-ar","hash":"35a685164905"},"as":{"file":"t-as","hash":"3d59e7ae324e"},"at":{"file":"t-at","hash":"d324e28ed473"},"au":{"file":"t-au","hash":"3a6e194b5eea"},"av":{"file":"t-av","hash":"1568f334e179"},"aw":{"file":"t-aw","hash":"bed21f8ba9f6"},"ay":{"file":"t-ay","hash":"ff854370eb00"},"az":{"file":"t-az","hash":"5ae079ce2380"},"ba":{"file":"t-ba","hash":"990f14f26691"},"be":{"file":"t-be","hash":"b6a5578a17c4"},"bi":{"file":"t-bi","hash":"e5cabca64003"},"bl":{"file":"t-bl","hash":"8161b924f69b"},"bo":{"file":"t-bo","hash":"e663637b1174"},"br":{"file":"t-br","hash":"2bd6561545c4"},"bu":{"file":"t-bu","hash":"05405a3a3d11"},"by":{"file":"t-by","hash":"629fc5194775"},"ca":{"file":"t-ca","hash":"44b18d49bb53"},"ce":{"file":"t-ce","hash":"d9fbae0511fa"},"ch":{"file":"t-ch","hash":"e803790a5e0e"},"ci":{"file":"t-ci","hash":"aeff79501d12"},"cl":{"file":"t-cl","hash":"8bcfcf360289"},"co":{"file":"t-co","hash":"3ad64dc2d885"},"cr":{"file":"t-cr","hash":"a4a1c4bf9b4a"},"cu":{"file":"t-cu","hash":"dc32a9b1c78e"},"da":{"file":"t-da","hash":"f7544994f631"},"de":{"file":"t-de","hash":"955cbb33ad74"},"di":{"file":"t-di","hash":"270a5f0136d6"},"do":{"file":"t-do","hash":"28eb2ead5740"},"dr":{"file":"t-dr","hash":"b7b8cc763faa"},"dt":{"file":"t-dt","hash":"01f79d3e762a"},"du":{"file":"t-du","hash":"8ce45bad3edd"},"e":{"file":"t-e","hash":"d816824dc652"},"ea":{"file":"t-ea","hash":"5bed10046012"},"ec":{"file":"t-ec","hash":"37293ab9b617"},"ed":{"file":"t-ed","hash":"ae5c63936ad2"},"el":{"file":"t-el","hash":"6456f27e0677"},"em":{"file":"t-em","hash":"6649a3b5877f"},"en":{"file":"t-en","hash":"acae1eadcdb7"},"eq":{"file":"t-eq","hash":"76813120f6ad"},"er":{"file":"t-er","hash":"0615b043ac62"},"es":{"file":"t-es","hash":"067677fba547"},"et":{"file":"t-et","hash":"554443b5d1fa"},"eu":{"file":"t-eu","hash":"a6372e18c81e"},"ev":{"file":"t-ev","hash":"49e44ba69394"},"ex":{"file":"t-ex","hash":"830873185652"},"ey":{"file":"t-ey","hash":"b8fdfb7f38b0"},"f":{"file":"t-f","hash":"f0ad5f8b3fbd"},"fa":{"file":"t-fa","hash":"2e7512d5316c"},"fe":{"file":"t-fe","hash":"c1c8f1b5f47d"},"fi":{"file":"t-fi","hash":"bbc64e2af0ca"},"fl":{"file":"t-fl","hash":"21398d044d22"},"fo":{"file":"t-fo","hash":"a9ad14cd6f30"},"fr":{"file":"t-fr","hash":"2f161f462d37"},"fu":{"file":"t-fu","hash":"1d289605864e"},"ga":{"file":"t-ga","hash":"de7dd03b6395"},"ge":{"file":"t-ge","hash":"a647adff019b"},"gi":{"file":"t-gi","hash":"af1831639059"},"gl":{"file":"t-gl","hash":"e69fff8b74af"},"go":{"file":"t-go","hash":"ba434751fb4a"},"gr":{"file":"t-gr","hash":"3ab9b3b3f08f"},"gu":{"file":"t-gu","hash":"0b979f8102c3"},"ha":{"file":"t-ha","hash":"24669fbd560d"},"he":{"file":"t-he","hash":"12e298bcd6c5"},"hi":{"file":"t-hi","hash":"d91fae19cb04"},"ho":{"file":"t-ho","hash":"97aaa8e7f5a3"},"hu":{"file":"t-hu","hash":"052539238bfe"},"i":{"file":"t-i","hash":"a91c78f9cfc1"},"ib":{"file":"t-ib","hash":"f435f2998e26"},"id":{"file":"t-id","hash":"3e4a306cf11f"},"if":{"file":"t-if","hash":"1d27bbb69e43"},"ig":{"file":"t-ig","hash":"77275d2c2246"},"im":{"file":"t-im","hash":"1a0b5f42d4b3"},"in":{"file":"t-in","hash":"f39c3aa6adbb"},"ir":{"file":"t-ir","hash":"3b9a19af7482"},"is":{"file":"t-is","hash":"4f6b7f61a144"},"it":{"file":"t-it","hash":"7d465d4aedfe"},"iz":{"file":"t-iz","hash":"7c548f4ef6ab"},"ja":{"file":"t-ja","hash":"18d0742fda82"},"ju":{"file":"t-ju","hash":"29a0de46a80d"},"ke":{"file":"t-ke","hash":"8fe5835a6f62"},"ki":{"file":"t-ki","hash":"e0c0ece27674"},"kn":{"file":"t-kn","hash":"aefe6b93b848"},"kr":{"file":"t-kr","hash":"9740217c1eb4"},"l":{"file":"t-l","hash":"a44d658150bf"},"la":{"file":"t-la","hash":"c7964b26ff7a"},"le":{"file":"t-le","hash":"33149cd8ee89"},"li":{"file":"t-li","hash":"136b94a89603"},"ll":{"file":"t-ll","hash":"ce9edc753c41"},"lo":{"file":"t-lo","hash":"e181a0dd15b4"},"lu":{"file":"t-lu","hash":"baf8ca4b4d5d"},"ly":{"file":"t-ly","hash":"315a7d9bf7bf"},"m":{"file":"t-m","hash":"2250e33e31fc"},"ma":{"file":"t-ma","hash":"bb02b0d1bb34"},"me":{"file":"t-me","hash":"8027f0252f58"},"mi":{"file":"t-mi","hash":"02d8798ce11d"},"mo":{"file":"t-mo","hash":"dce357ef4ca5"},"mu":{"file":"t-mu","hash":"1e82b7539c14"},"my":{"file":"t-my","hash":"782b5882f4b0"},"na":{"file":"t-na","hash":"f3737af98253"},"ne":{"file":"t-ne","hash":"9431c19a275c"},"ni":{"file":"t-ni","hash":"b028958f5d8c"},"no":{"file":"t-no","hash":"d911bd9ad4c8"},"nu":{"file":"t-nu","hash":"5cfe5e3f439f"},"o":{"file":"t-o","hash":"5a6f247b2d72"},"oc":{"file":"t-oc","hash":"a999fa1dd443"},"od":{"file":"t-od","hash":"707b9c94d606"},"of":{"file":"t-of","hash":"5abaa9bdc559"},"oi":{"file":"t-oi","hash":"da3e8edbd6e7"},"oj":{"file":"t-oj","hash":"2077a58aafd4"},"ok":{"file":"t-ok","hash":"ff4faa9044c4"},"on":{"file":"t-on","hash":"3cd962248fbf"},"op":{"file":"t-op","hash":"4833730b39af"},"or":{"file":"t-or","hash":"0965dc6028d4"},"os":{"file":"t-os","hash":"f02b8b2fc7de"},"ot":{"file":"t-ot","hash":"18fcd31c0461"},"ou":{"file":"t-ou","hash":"0118d2d27827"},"ov":{"file":"t-ov","hash":"9dea5dc11fed"},"ow":{"file":"t-ow","hash":"ce548cf6f952"},"pa":{"file":"t-pa","hash":"dc8435a35a97"},"pe":{"file":"t-pe","hash":"38627c613378"},"ph":{"file":"t-ph","hash":"8536f2cb8fcc"},"pi":{"file":"t-pi","hash":"e2a4107faf0b"},"pl":{"file":"t-pl","hash":"658bc6b5153d"},"po":{"file":"t-po","hash":"6a0e29a41f14"},"pr":{"file":"t-pr","hash":"45644a134021"},"pu":{"file":"t-pu","hash":"0bd55f359de9"},"qu":{"file":"t-qu","hash":"fde8173a216f"},"ra":{"file":"t-ra","hash":"645236cbeca6"},"re":{"file":"t-re","hash":"d6104984fc42"},"ri":{"file":"t-ri","hash":"5c89e78974dd"},"ro":{"file":"t-ro","hash":"6b885f729e23"},"ru":{"file":"t-ru","hash":"20fd6cf1e163"},"s":{"file":"t-s","hash":"4aafd1446c69"},"sa":{"file":"t-sa","hash":"d6d61a1b23c8"},"sc":{"file":"t-sc","hash":"9f024f82c798"},"se":{"file":"t-se","hash":"eb827b76a871"},"sh":{"file":"t-sh","hash":"7ab235e25e5b"},"si":{"file":"t-si","hash":"2898a6059b06"},"sk":{"file":"t-sk","hash":"9bb399b30358"},"sl":{"file":"t-sl","hash":"9117cad499fd"},"sm":{"file":"t-sm","hash":"956aed0720f9"},"sn":{"file":"t-sn","hash":"adca586372d5"},"so":{"file":"t-so","hash":"0b5dd5034442"},"sp":{"file":"t-sp","hash":"e5897433fef8"},"st":{"file":"t-st","hash":"a7b38ffe8fc9"},"su":{"file":"t-su","hash":"08f4e79a8b94"},"sw":{"file":"t-sw","hash":"4f10cc55ad43"},"t":{"file":"t-t","hash":"df815ce94d35"},"ta":{"file":"t-ta","hash":"e66ae57cf018"},"te":{"file":"t-te","hash":"5c890d57ad21"},"th":{"file":"t-th","hash":"e805404b9ffe"},"ti":{"file":"t-ti","hash":"b53910d9902a"},"to":{"file":"t-to","hash":"e7146f4c853f"},"tr":{"file":"t-tr","hash":"01fe2d3aeffe"},"tu":{"file":"t-tu","hash":"664d99a1c68b"},"tv":{"file":"t-tv","hash":"89438496cd4a"},"ty":{"file":"t-ty","hash":"1e64c34c3a4a"},"uk":{"file":"t-uk","hash":"6a3ac446cbf4"},"ul":{"file":"t-ul","hash":"299e93acea9e"},"un":{"file":"t-un","hash":"fc47c108d6cc"},"up":{"file":"t-up","hash":"54e8ad2743a5"},"ur":{"file":"t-ur","hash":"1e622ee22234"},"us":{"file":"t-us","hash":"1a298b667f0a"},"va":{"file":"t-va","hash":"dfb0b6e65b7c"},"ve":{"file":"t-ve","hash":"168a7b56e06b"},"vi":{"file":"t-vi","hash":"8740b0265ab3"},"vo":{"file":"t-vo","hash":"f78b537a9814"},"wa":{"file":"t-wa","hash":"45d734b9e819"},"we":{"file":"t-we","hash":"74ef5eb291e4"},"wh":{"file":"t-wh","hash":"6bc5f1047d4c"},"wi":{"file":"t-wi","hash":"b219a137a20a"},"wo":{"file":"t-wo","hash":"d397517d0a53"},"wr":{"file":"t-wr","hash":"b401e22e8300"},"x":{"file":"t-x","hash":"3e5e17335e66"},"y":{"file":"t-y","hash":"7b3984fdddac"},"ya":{"file":"t-ya","hash":"35c93e8b710b"},"ye":{"file":"t-ye","hash":"d0b9a598c66f"},"yo":{"file":"t-yo","hash":"281ceadce5bb"},"zu":{"file":"t-zu","hash":"537b2b073260"}},"docs":{"0":{"file":"docs-0","hash":"6c7d16eee008"}}});
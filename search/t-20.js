@@ -0,0 +1 @@
+__searchShard("20", {"2021":[5,2]});
@@ -0,0 +1 @@
+__searchShard("a", {"a":[0,11,1,30,2,17,3,11,4,8,5,22,6,33]});
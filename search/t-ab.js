@@ -0,0 +1 @@
+__searchShard("ab", {"abbreviation":[2,1],"about":[1,6,2,2,3,2,5,1,6,2],"above":[1,1],"abrazo":[2,4],"abrazos":[2,2],"abre":[4,1],"abren":[4,3],"abres":[4,1],"abrimos":[4,1],"abrio":[6,1],"abrir":[4,2],"abris":[4,1],"abro":[4,1],"absolute":[6,1],"absoluto":[6,1],"abuelo":[2,1]});
@@ -0,0 +1 @@
+__searchShard("ac", {"aca":[2,1],"acababa":[6,2],"acabar":[6,2],"accommodation":[5,1],"acho":[2,2],"acting":[6,1],"action":[3,1],"actuar":[6,1]});
@@ -0,0 +1 @@
+__searchShard("ad", {"adelantaban":[3,2],"adelantar":[3,1],"adelante":[1,1],"adjective":[0,2,6,1],"admitted":[6,1],"ado":[2,1],"adventure":[4,2],"adverbial":[1,2,5,1]});
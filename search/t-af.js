@@ -0,0 +1 @@
+__searchShard("af", {"affectionate":[2,2],"aficion":[6,3],"afraid":[6,2],"afro":[2,1],"after":[0,1,5,1,6,1],"afternoon":[3,1],"afterwards":[5,1]});
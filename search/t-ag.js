@@ -0,0 +1 @@
+__searchShard("ag", {"again":[6,3],"ago":[3,1]});
@@ -0,0 +1 @@
+__searchShard("ah", {"ahi":[1,1]});
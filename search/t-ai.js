@@ -0,0 +1 @@
+__searchShard("ai", {"airbnb":[5,8]});
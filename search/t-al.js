@@ -0,0 +1 @@
+__searchShard("al", {"al":[0,2,1,6,3,2,5,1,6,9],"algo":[0,1,1,1,2,1,5,1,6,4],"alguien":[0,1,1,1,6,1],"aliviado":[6,2],"all":[1,2,2,4],"alli":[6,1],"almost":[6,1],"alojabamos":[5,2],"alojarse":[5,1],"aloje":[1,1],"aloud":[1,1],"alquilar":[3,1],"alquile":[3,2],"already":[2,2],"also":[0,1,2,1,6,2],"alta":[1,1],"alteradas":[6,1],"alto":[1,1],"always":[3,1,5,1]});
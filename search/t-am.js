@@ -0,0 +1 @@
+__searchShard("am", {"amigo":[5,3],"amigos":[1,1,4,1,5,1],"amo":[2,1],"amount":[5,1]});
@@ -0,0 +1 @@
+__searchShard("an", {"an":[0,1,1,2,4,3,6,3],"and":[0,4,1,10,2,24,3,6,4,4,5,2,6,10],"annoyed":[6,2],"ano":[3,1],"another":[2,1,3,1],"answer":[1,2],"answered":[6,1],"anymore":[0,1,2,2],"anything":[3,1,5,1]});
@@ -0,0 +1 @@
+__searchShard("ap", {"aparecio":[6,1],"apenas":[1,1],"apologise":[6,1],"apologized":[6,1],"apostrophe":[2,1],"appeared":[6,1],"apres":[0,7]});
@@ -0,0 +1 @@
+__searchShard("aq", {"aqui":[2,3]});
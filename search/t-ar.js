@@ -0,0 +1 @@
+__searchShard("ar", {"ar":[3,2,5,2],"are":[2,4,4,4],"area":[6,1],"argument":[6,2],"around":[3,1,5,1],"arrived":[0,1]});
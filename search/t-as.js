@@ -0,0 +1 @@
+__searchShard("as", {"as":[1,3,2,3,3,1],"asegurarme":[6,1],"asegurarse":[6,2],"asi":[2,1,5,2,6,1],"ask":[3,1],"asked":[1,1],"asking":[5,1],"asks":[2,1]});
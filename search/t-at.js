@@ -0,0 +1 @@
+__searchShard("at", {"at":[0,1,1,10,2,1,3,3,5,6,6,4],"atardecer":[1,1],"atencion":[1,1],"atmosphere":[1,1],"atrevidos":[3,1],"attack":[2,2],"attention":[1,1]});
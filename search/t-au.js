@@ -0,0 +1 @@
+__searchShard("au", {"aun":[2,1],"aura":[1,4]});
@@ -0,0 +1 @@
+__searchShard("av", {"aventura":[4,3]});
@@ -0,0 +1 @@
+__searchShard("aw", {"awake":[6,1],"aware":[5,1],"away":[2,3],"awkward":[1,1]});
@@ -0,0 +1 @@
+__searchShard("ay", {"ayude":[2,1],"ayuden":[2,2]});
@@ -0,0 +1 @@
+__searchShard("az", {"azar":[1,3],"azotea":[1,2]});
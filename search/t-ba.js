@@ -0,0 +1 @@
+__searchShard("ba", {"babie":[2,2],"babies":[2,2],"baby":[2,3],"back":[1,2,2,1,3,1],"bad":[2,2],"bag":[4,3],"bajamos":[0,1],"bajar":[0,1,5,1],"baje":[6,1],"baked":[0,1],"bali":[3,6],"bangs":[2,1],"bar":[0,1],"baraja":[1,3],"bare":[2,2],"barely":[1,1],"bata":[2,4]});
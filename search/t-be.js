@@ -0,0 +1 @@
+__searchShard("be", {"be":[0,1,1,1,2,5,4,1,5,1,6,4],"beach":[3,1],"beautiful":[2,1],"beber":[2,3],"bebidas":[5,1],"been":[3,1,5,1],"behind":[4,2],"being":[1,1,2,1],"beno":[2,2],"bernie":[2,2],"beso":[2,3],"besos":[2,2],"better":[0,1],"between":[6,3]});
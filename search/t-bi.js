@@ -0,0 +1 @@
+__searchShard("bi", {"bien":[1,1,2,12,3,1,4,3,6,3],"big":[2,3],"bit":[0,1,3,1,5,1]});
@@ -0,0 +1 @@
+__searchShard("bl", {"blanca":[2,1],"blanquita":[2,3],"blast":[6,2],"block":[4,2],"bloque":[4,2]});
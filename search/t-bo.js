@@ -0,0 +1 @@
+__searchShard("bo", {"board":[1,1],"bold":[3,1],"bolsa":[4,4],"bomba":[2,4],"bonito":[2,1],"booked":[5,1],"both":[6,2],"bought":[5,1],"box":[1,3],"boy":[2,1]});
@@ -0,0 +1 @@
+__searchShard("br", {"bring":[1,1,5,1],"broken":[2,1,5,3,6,1],"brought":[1,2],"brow":[6,1]});
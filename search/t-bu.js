@@ -0,0 +1 @@
+__searchShard("bu", {"budget":[5,1],"buen":[5,3],"buenos":[4,1],"building":[1,1,4,1],"bunny":[2,2],"burst":[6,1],"busque":[3,1],"but":[0,2,1,3,2,2,3,1,5,2,6,1]});
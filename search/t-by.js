@@ -0,0 +1 @@
+__searchShard("by", {"by":[1,2,6,1]});
@@ -0,0 +1 @@
+__searchShard("ca", {"ca":[2,3],"cabron":[2,4],"cada":[1,2,2,2],"cadena":[2,2],"cadenas":[2,2],"caja":[1,3],"calidos":[1,1],"call":[6,1],"callado":[1,1],"calle":[2,2],"calma":[1,1],"calmly":[1,1],"cambiado":[5,1],"cambiara":[3,1],"came":[1,1],"caminando":[2,1],"camino":[0,1,3,1],"can":[1,2,2,7,6,1],"cana":[2,4],"cantidad":[5,1],"car":[3,1],"card":[1,4],"cards":[1,3],"caribbean":[2,8],"carretera":[3,1],"carril":[3,1],"cars":[3,1],"carta":[1,2],"cartas":[1,3],"casa":[1,1],"casco":[3,1],"casi":[6,1],"casual":[2,1],"caught":[1,1],"cause":[2,2]});
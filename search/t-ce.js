@@ -0,0 +1 @@
+__searchShard("ce", {"ceno":[6,2],"cerca":[3,1],"cerquita":[2,1],"certain":[1,1],"certeza":[5,3]});
@@ -0,0 +1 @@
+__searchShard("ch", {"chains":[2,2],"chair":[5,4],"change":[3,1],"charlar":[1,1],"chat":[1,1],"check":[2,2,6,2],"cheese":[4,4],"chequeate":[2,2],"chest":[2,2],"chillin":[2,1],"choco":[2,1],"choose":[4,2]});
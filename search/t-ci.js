@@ -0,0 +1 @@
+__searchShard("ci", {"cien":[5,1],"circle":[1,1],"circulacion":[3,1]});
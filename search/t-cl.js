@@ -0,0 +1 @@
+__searchShard("cl", {"clause":[6,1],"close":[2,1]});
@@ -0,0 +1 @@
+__searchShard("co", {"cocaine":[2,1],"coche":[3,1],"coches":[3,1],"coco":[4,9],"cojone":[2,4],"cojones":[2,2],"colloquial":[2,2],"come":[2,2,3,1],"comentaristas":[6,1],"comfortable":[1,1],"commentators":[6,1],"common":[0,1,2,4],"como":[0,1,1,1,2,1,3,1],"comodo":[1,1],"compramos":[5,1],"comprobar":[6,4],"comun":[1,1],"con":[0,1,1,5,2,5,5,6,6,4],"concentrarme":[6,2],"concentrate":[6,2],"conduce":[3,2],"conduciendo":[3,1],"conducir":[3,1],"conductores":[3,1],"confeso":[6,1],"conocer":[5,3],"conoci":[1,1],"conocia":[6,1],"conocido":[5,3],"conocimos":[5,1],"contar":[1,1],"contarte":[2,1],"conte":[2,1],"contento":[4,2],"contentos":[4,2],"context":[2,2],"contexts":[2,1],"continued":[3,1],"contrast":[1,1],"corazon":[2,2,6,3],"corillo":[2,3],"corner":[4,2],"corta":[0,1],"cosa":[2,4],"cosas":[1,1,2,3,4,2,6,1],"cosquillas":[4,3],"cost":[5,2],"could":[1,1,2,4,6,2],"couldn":[6,1],"country":[3,1,5,1],"covid":[5,3]});
@@ -0,0 +1 @@
+__searchShard("cr", {"crash":[2,1],"crazy":[2,12,5,1],"crear":[1,1],"creating":[1,1],"crew":[2,4],"cristales":[6,2],"crowd":[6,1],"crunchy":[4,2],"crush":[2,6],"cruzarnos":[6,1]});
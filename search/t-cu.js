@@ -0,0 +1 @@
+__searchShard("cu", {"cuando":[1,1,2,3,3,2,5,1,6,2],"cuantas":[1,1],"cuban":[2,1],"cuenta":[5,3,6,3],"culpable":[6,1],"cuya":[1,1]});
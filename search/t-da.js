@@ -0,0 +1 @@
+__searchShard("da", {"da":[1,1,2,2],"daba":[0,3,1,1],"dado":[6,2],"damages":[5,3],"damn":[2,2],"dan":[2,2],"dance":[2,2],"dancing":[2,1],"dandome":[2,2],"danos":[5,4],"dar":[0,1,1,3,2,2],"dark":[1,1],"darnell":[2,2],"darse":[5,1,6,1],"darte":[2,3],"day":[2,2,3,2,4,2,5,1,6,1],"days":[3,2,6,1]});
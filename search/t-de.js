@@ -0,0 +1 @@
+__searchShard("de", {"de":[0,5,1,20,2,10,3,6,4,6,5,12,6,21],"debi":[2,8],"debia":[1,1,6,1],"decided":[0,1,5,1,6,1],"decidi":[6,1],"decidimos":[0,1,5,1],"deck":[1,2],"dedos":[4,1],"dejame":[2,1],"dejamo":[2,3],"dejamos":[2,1],"dejar":[2,1],"dejo":[1,1],"del":[4,2,5,6],"delante":[1,1],"demas":[1,2],"dentro":[1,1],"derecha":[0,1,3,4],"descubri":[3,2],"descubrir":[3,1],"desde":[0,1,3,2,6,1],"despacio":[1,1],"despierto":[6,1],"despues":[0,1,5,2],"destroyed":[2,2],"detras":[4,3]});
@@ -0,0 +1 @@
+__searchShard("di", {"dia":[2,2,3,2,4,3,5,1,6,1],"diablo":[2,1],"dias":[3,2,6,1],"didn":[0,3,1,1,2,2,3,2,6,2],"dieramos":[5,2],"digo":[2,1],"dijo":[0,1,1,1,3,1],"dime":[2,1],"diminutive":[0,2,2,1],"dio":[0,1,2,2,3,1],"discovered":[3,1],"discreet":[5,2],"discreta":[5,2],"discreto":[5,1],"disculpas":[6,3],"discusion":[6,2],"disfrutando":[2,2],"disfrutar":[2,2],"distancia":[5,1]});
@@ -0,0 +1 @@
+__searchShard("do", {"do":[1,1,5,1,6,1],"dog":[2,1],"doing":[1,1,6,1],"domino":[2,1],"dominoes":[2,1],"don":[2,3],"donde":[1,1,2,2,4,1,5,1],"door":[6,1],"doorbell":[6,2],"double":[2,1],"down":[0,2,4,2,5,1,6,1]});
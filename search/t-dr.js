@@ -0,0 +1 @@
+__searchShard("dr", {"draw":[1,1],"drew":[1,1],"drink":[2,3],"drinks":[5,1],"drive":[2,1,3,3],"drivers":[3,1],"driving":[3,2],"dropped":[2,2],"dropping":[2,1],"drug":[2,1],"drugs":[2,1],"drums":[2,1],"drunk":[2,3]});
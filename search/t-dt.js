@@ -0,0 +1 @@
+__searchShard("dt", {"dtmf":[2,1]});
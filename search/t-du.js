@@ -0,0 +1 @@
+__searchShard("du", {"dueno":[3,1,5,4],"dulce":[0,3,2,1],"dull":[6,1],"durante":[1,1,3,1],"during":[1,1,5,1]});
@@ -0,0 +1 @@
+__searchShard("e", {"e":[2,3]});
@@ -0,0 +1 @@
+__searchShard("ea", {"each":[1,2,2,2,6,1],"easy":[1,1]});
@@ -0,0 +1 @@
+__searchShard("ec", {"echarse":[6,2],"echo":[6,1]});
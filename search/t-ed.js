@@ -0,0 +1 @@
+__searchShard("ed", {"edgar":[2,2],"edificios":[1,1]});
@@ -0,0 +1 @@
+__searchShard("el", {"el":[0,4,1,10,2,8,3,6,5,8,6,12],"elefanta":[4,1],"elefante":[4,1],"elegir":[4,1],"elephant":[4,4],"eligen":[4,2],"ellos":[4,1,5,1]});
@@ -0,0 +1 @@
+__searchShard("em", {"emborracho":[2,3],"emotion":[2,1],"emotional":[2,1],"emotionally":[2,1],"empece":[3,1,6,2],"empinada":[0,3],"empinado":[0,1]});
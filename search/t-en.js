@@ -0,0 +1 @@
+__searchShard("en", {"en":[0,2,1,14,2,4,3,8,4,3,5,4,6,8],"encontramos":[0,1],"end":[0,1,1,1,5,2,6,1],"endearment":[2,3],"english":[0,1,1,1,2,4],"enjoy":[2,2],"enjoying":[2,2],"enough":[1,1],"enseno":[1,1],"entendi":[3,1],"enterarse":[3,1],"entonces":[0,1,3,2,6,1],"entre":[5,2,6,3],"entrometerme":[6,2],"entrometerse":[6,1],"enviar":[2,1],"envie":[2,4],"envies":[2,1],"envio":[5,1]});
@@ -0,0 +1 @@
+__searchShard("eq", {"equivocado":[3,2]});
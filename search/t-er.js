@@ -0,0 +1 @@
+__searchShard("er", {"era":[0,3,1,2,5,2,6,1],"eran":[1,1,3,1]});
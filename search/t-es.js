@@ -0,0 +1 @@
+__searchShard("es", {"es":[0,1,2,2,4,4],"esa":[0,2,1,1],"esas":[2,2],"esbarata":[2,3],"esbaratada":[2,1],"escaleros":[6,1],"escribio":[5,1],"escrita":[1,1],"escuchaban":[1,1],"escuchar":[1,2],"escucharle":[1,1],"ese":[0,2,1,1,4,2,6,1],"eso":[1,1],"espacio":[1,1],"espana":[5,2],"especie":[1,1],"esperar":[1,1],"esta":[1,1,2,3],"estaba":[1,1,6,3],"estabamos":[5,1],"estadia":[2,1],"estado":[3,1],"estamo":[2,4],"estamos":[2,2],"estan":[4,2],"estar":[1,1,2,2,4,2,5,2,6,4],"estaria":[6,1],"estas":[2,1,3,1],"esten":[2,1],"estoy":[2,4],"estuviera":[6,2]});
@@ -0,0 +1 @@
+__searchShard("et", {"etc":[2,3]});
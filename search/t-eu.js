@@ -0,0 +1 @@
+__searchShard("eu", {"euros":[5,2]});
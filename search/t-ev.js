@@ -0,0 +1 @@
+__searchShard("ev", {"even":[2,1],"everybody":[2,2],"everyone":[1,3],"everything":[1,1,3,1,5,1,6,3],"everywhere":[1,1]});
@@ -0,0 +1 @@
+__searchShard("ex", {"exagerado":[6,3],"except":[6,1],"exclamation":[2,1],"existe":[6,1],"exists":[6,1],"explain":[3,1],"explained":[1,1,6,1],"explico":[1,1,3,1],"explique":[6,1],"exposed":[2,1],"expresion":[6,1],"expression":[1,2,4,1,5,1,6,1],"expulsen":[2,1],"extranan":[2,1]});
@@ -0,0 +1 @@
+__searchShard("ey", {"ey":[2,5],"eyes":[2,1]});
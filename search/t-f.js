@@ -0,0 +1 @@
+__searchShard("f", {"f":[2,1]});
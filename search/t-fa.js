@@ -0,0 +1 @@
+__searchShard("fa", {"facil":[1,1],"fall":[1,1],"family":[2,1],"fans":[6,1],"favorito":[0,1],"favourite":[0,1]});
@@ -0,0 +1 @@
+__searchShard("fe", {"fear":[0,1],"feel":[1,1],"feeling":[6,1],"felt":[3,1,6,1],"female":[4,1],"feminine":[0,1,1,3,5,1],"few":[1,1,3,1]});
@@ -0,0 +1 @@
+__searchShard("fi", {"fiesta":[5,1],"fifty":[5,2],"fin":[5,2],"fina":[6,1],"final":[0,1,2,2,5,1,6,1],"finas":[6,2],"find":[3,1],"fines":[5,2],"fingers":[4,2],"finished":[1,1],"firecrackers":[2,1],"first":[1,1,3,1,6,1],"fitness":[2,1],"fixed":[5,1]});
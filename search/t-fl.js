@@ -0,0 +1 @@
+__searchShard("fl", {"flat":[1,1,5,1,6,2],"flavoured":[4,1],"flights":[6,1],"flows":[2,1]});
@@ -0,0 +1 @@
+__searchShard("fo", {"food":[4,1],"football":[6,3],"for":[0,2,1,1,2,53,3,1,4,1,5,7,6,4],"form":[2,2],"forma":[1,1,5,2],"foto":[2,7,5,1],"fotos":[2,5],"found":[0,1,5,2]});
@@ -0,0 +1 @@
+__searchShard("fr", {"friend":[5,3],"friendly":[2,1],"friends":[1,2,2,2,4,1,5,1],"from":[0,1,1,1,2,1,3,1],"front":[1,1],"frowned":[6,1],"fruncio":[6,1],"fruncir":[6,1]});
@@ -0,0 +1 @@
+__searchShard("fu", {"fue":[5,3,6,1],"fui":[0,1,3,1],"fuimos":[5,1],"full":[6,2],"fun":[0,1],"furrow":[6,1],"futbol":[6,2]});
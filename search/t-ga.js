@@ -0,0 +1 @@
+__searchShard("ga", {"game":[1,2],"games":[1,1],"ganas":[1,1],"gave":[0,1,1,1,2,2,3,1]});
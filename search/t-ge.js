@@ -0,0 +1 @@
+__searchShard("ge", {"genial":[0,1],"genre":[2,1],"gente":[1,2,2,1,5,3],"gesture":[3,1],"get":[0,1,1,1,2,5,3,1]});
@@ -0,0 +1 @@
+__searchShard("gi", {"gio":[1,6],"girl":[2,3],"girls":[2,1],"giuseppe":[5,5],"give":[0,1,2,2],"given":[2,3],"gives":[1,1],"giving":[2,2]});
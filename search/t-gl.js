@@ -0,0 +1 @@
+__searchShard("gl", {"glass":[6,2]});
@@ -0,0 +1 @@
+__searchShard("go", {"go":[0,1,1,1,2,4,3,1,4,2],"goat":[2,1],"goes":[2,1],"going":[0,2,1,1,2,1,5,1,6,2],"golpe":[1,3,6,1],"gonna":[2,1],"good":[2,2,4,3,5,1],"goodness":[3,1],"goods":[0,1],"got":[1,1,6,2],"gourd":[2,1]});
@@ -0,0 +1 @@
+__searchShard("gr", {"gracias":[2,1],"grandpa":[2,1],"grass":[4,2],"grave":[3,1,6,2],"great":[0,1,5,1],"gritaban":[6,1],"grito":[3,1],"gritos":[6,2],"group":[2,1]});
@@ -0,0 +1 @@
+__searchShard("gu", {"guardaba":[1,1],"guia":[2,1],"guilty":[6,1],"guiro":[2,5],"gunshots":[2,1],"gusanitos":[4,6],"guts":[2,2],"guy":[1,1,5,1],"guys":[2,1]});
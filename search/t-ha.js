@@ -0,0 +1 @@
+__searchShard("ha", {"haber":[5,2],"habia":[3,1,5,2,6,4],"habiamos":[5,2],"hablaba":[1,2],"hablamos":[1,1,5,1],"hablar":[1,1,2,1],"hace":[3,1],"hacen":[4,2],"hacer":[0,1,1,1,3,1,4,1,5,1,6,2],"hacia":[1,1],"had":[1,3,2,3,3,1,5,5,6,4],"hadn":[5,1,6,2],"haha":[2,1],"hand":[6,2],"hang":[1,1,2,1],"happen":[2,2],"happened":[3,1,6,2],"happens":[6,1],"happy":[4,3],"hard":[2,3],"has":[2,1],"hasta":[2,2],"have":[0,1,1,3,2,11,4,2],"hay":[0,1]});
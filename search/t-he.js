@@ -0,0 +1 @@
+__searchShard("he", {"he":[1,8,2,1,3,1,5,2,6,6],"hear":[6,4],"heard":[6,3],"heart":[2,5,6,2],"helmet":[3,1],"help":[2,3],"here":[0,1,2,13,6,1],"hey":[2,7]});
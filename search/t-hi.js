@@ -0,0 +1 @@
+__searchShard("hi", {"hierba":[4,3],"him":[1,1,2,1],"his":[1,1,3,1],"historias":[1,1],"hit":[2,1],"hits":[2,1],"hizo":[3,1,6,2]});
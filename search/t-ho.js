@@ -0,0 +1 @@
+__searchShard("ho", {"hobby":[6,1],"home":[1,1],"hope":[2,3],"host":[5,3],"hostal":[1,1,5,1],"hostales":[1,1,5,3],"hostel":[1,1],"hostels":[5,2],"how":[0,1,2,1,5,1],"hoy":[2,6]});
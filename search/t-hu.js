@@ -0,0 +1 @@
+__searchShard("hu", {"hubiera":[1,1],"hugs":[2,4],"hundred":[5,1],"hung":[1,1]});
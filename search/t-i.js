@@ -0,0 +1 @@
+__searchShard("i", {"i":[0,2,1,11,2,53,3,13,5,4,6,27]});
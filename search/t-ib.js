@@ -0,0 +1 @@
+__searchShard("ib", {"iba":[0,1,1,1,3,1]});
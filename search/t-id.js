@@ -0,0 +1 @@
+__searchShard("id", {"identity":[4,1],"idiom":[5,1,6,2],"ido":[6,1]});
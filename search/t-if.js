@@ -0,0 +1 @@
+__searchShard("if", {"if":[1,3,2,9]});
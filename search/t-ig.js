@@ -0,0 +1 @@
+__searchShard("ig", {"igual":[3,1]});
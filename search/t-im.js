@@ -0,0 +1 @@
+__searchShard("im", {"imaginando":[6,1],"imaginarme":[6,1],"imagine":[6,1],"imagining":[6,1],"imperfect":[3,1],"importa":[1,1],"important":[2,2],"importante":[2,2],"impresionado":[1,1],"impressed":[1,1]});
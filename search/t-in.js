@@ -0,0 +1 @@
+__searchShard("in", {"in":[0,6,1,8,2,22,3,10,4,3,5,6,6,9],"incomodo":[1,1],"indonesia":[3,5],"infinitive":[1,1,5,1,6,6],"inquietante":[6,3],"inside":[1,1],"instrument":[2,1],"insult":[2,1],"intense":[2,1],"interesante":[5,1],"interesting":[5,1],"interfering":[6,1],"interjection":[2,1],"internet":[3,2],"invisible":[1,2],"invitamos":[5,1],"invited":[5,1,6,2]});
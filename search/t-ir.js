@@ -0,0 +1 @@
+__searchShard("ir", {"ir":[0,1,3,1,4,3],"irme":[6,2],"irse":[6,1]});
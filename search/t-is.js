@@ -0,0 +1 @@
+__searchShard("is", {"is":[0,3,2,1,3,1,4,4,6,1],"isla":[3,1],"island":[3,1]});
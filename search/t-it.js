@@ -0,0 +1 @@
+__searchShard("it", {"it":[0,4,1,4,2,14,3,1,4,1,5,5,6,4],"italian":[1,1,5,2],"italiano":[1,1,5,1],"ito":[0,1]});
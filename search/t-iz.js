@@ -0,0 +1 @@
+__searchShard("iz", {"izquierda":[3,6]});
@@ -0,0 +1 @@
+__searchShard("ja", {"jaja":[2,1],"jan":[2,2],"japan":[3,1],"japon":[3,1],"jay":[2,2]});
@@ -0,0 +1 @@
+__searchShard("ju", {"juan":[2,2],"juego":[1,2],"juegos":[1,1],"jugamos":[1,1],"jugando":[1,1,2,1],"jugar":[1,2],"julito":[2,2],"jura":[2,3],"jurado":[2,1],"just":[1,1,3,1,6,4],"justo":[5,1]});
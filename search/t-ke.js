@@ -0,0 +1 @@
+__searchShard("ke", {"keen":[1,1],"keep":[1,1],"kept":[1,1],"keys":[3,1]});
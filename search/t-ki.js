@@ -0,0 +1 @@
+__searchShard("ki", {"kick":[2,1],"kicks":[2,2],"kill":[2,1],"kilo":[2,5],"kind":[1,1],"kisses":[2,3]});
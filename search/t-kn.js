@@ -0,0 +1 @@
+__searchShard("kn", {"knew":[0,1,5,2],"know":[0,1,2,2,5,1,6,2]});
@@ -0,0 +1 @@
+__searchShard("kr", {"krystal":[2,2]});
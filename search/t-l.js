@@ -0,0 +1 @@
+__searchShard("l", {"l":[2,11]});
@@ -0,0 +1 @@
+__searchShard("la", {"la":[0,5,1,12,2,21,3,15,4,6,5,5,6,10],"lado":[3,2,6,2],"laid":[1,1],"lame":[2,1],"landing":[6,2],"lanes":[3,1],"largas":[1,1],"las":[0,1,1,4,2,12,3,2,4,2,6,3],"last":[2,1],"later":[1,1],"laugh":[1,1],"laughing":[6,1]});
@@ -0,0 +1 @@
+__searchShard("le", {"le":[1,2,2,1,6,1],"lead":[1,1,2,1],"least":[6,1],"leave":[2,2,6,2],"lecciones":[1,1],"lecturing":[1,1],"leer":[1,2],"leerlas":[1,1],"left":[1,1,2,3,3,5,5,1,6,1],"lento":[0,1],"les":[4,2],"let":[2,8]});
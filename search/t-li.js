@@ -0,0 +1 @@
+__searchShard("li", {"life":[1,1],"light":[2,2],"like":[2,6,3,2,6,3],"limitarse":[6,2],"limito":[6,2],"linda":[2,1],"listen":[1,3],"listening":[1,1],"lit":[2,2],"literal":[2,1,6,1],"literally":[0,1,2,3,5,1],"little":[0,7,2,1,4,4],"live":[6,1],"living":[6,1]});
@@ -0,0 +1 @@
+__searchShard("ll", {"llamar":[6,1],"llamaria":[6,1],"llame":[6,1],"llamo":[1,1],"llaves":[3,1],"llegamos":[0,1,1,1],"llegar":[0,1,2,1],"llegarle":[2,1],"llevaba":[1,1]});
@@ -0,0 +1 @@
+__searchShard("lo", {"lo":[1,3,2,3,3,1,5,3,6,6],"loan":[0,1,2,2],"loco":[2,9],"lograba":[6,2],"logramos":[5,2],"lograr":[5,1,6,2],"long":[1,1],"longer":[6,1],"look":[2,5],"looked":[1,1,2,1,3,1],"looking":[2,1],"los":[1,1,2,10,3,3,4,3,5,4,6,2],"lot":[1,2,2,2,5,2],"loud":[1,1],"love":[2,4]});
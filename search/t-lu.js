@@ -0,0 +1 @@
+__searchShard("lu", {"luego":[6,2],"lugar":[0,1,1,1]});
@@ -0,0 +1 @@
+__searchShard("ly", {"lyrics":[2,1]});
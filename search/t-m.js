@@ -0,0 +1 @@
+__searchShard("m", {"m":[2,14]});
@@ -0,0 +1 @@
+__searchShard("ma", {"machines":[2,2],"made":[1,2],"madera":[1,1],"magia":[1,1],"magic":[1,1],"make":[6,2],"mal":[3,1],"male":[4,1],"mami":[2,2],"man":[2,2],"manage":[6,1],"managed":[5,2],"manana":[3,1],"manera":[1,1],"manos":[6,3],"maquina":[2,3],"maquinas":[2,1],"marcar":[6,2],"mari":[4,9],"mas":[0,1,1,1,2,10,6,1],"masculine":[0,4,3,1],"mata":[2,3],"matada":[2,1],"match":[6,1],"matters":[1,1],"may":[2,3]});
@@ -0,0 +1 @@
+__searchShard("me", {"me":[1,15,2,36,3,15,6,11],"mean":[0,1,2,5,6,1],"meaning":[2,2],"means":[0,2,2,2,3,1],"medias":[5,3],"medio":[0,1,3,3],"medios":[3,1],"meet":[5,2],"mejor":[0,1],"menos":[3,1,6,1],"mes":[5,1],"mesa":[1,1],"messed":[2,1],"met":[1,1,5,2],"metaphorical":[2,1],"metase":[2,1]});
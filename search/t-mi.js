@@ -0,0 +1 @@
+__searchShard("mi", {"mi":[2,9,3,2,5,2],"mia":[2,1],"middle":[0,1],"miedo":[0,4,6,2],"mierda":[2,1],"mil":[1,1],"mine":[2,4],"mio":[2,5],"mios":[2,1],"mire":[2,1],"miro":[1,1],"misma":[1,1],"miss":[2,1],"misteriosa":[1,1]});
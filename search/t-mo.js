@@ -0,0 +1 @@
+__searchShard("mo", {"molesta":[6,2],"momento":[1,1,5,1],"montana":[0,1],"montanas":[0,1],"month":[5,1],"more":[2,10],"morning":[3,1],"motivated":[1,1],"motivo":[1,1],"mountain":[0,1],"mountains":[0,1],"mouth":[6,2],"move":[2,3],"moverme":[3,1],"movie":[2,3],"movies":[2,3]});
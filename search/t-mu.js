@@ -0,0 +1 @@
+__searchShard("mu", {"much":[1,2],"mucha":[1,1,5,1],"mucho":[1,2,2,1,5,1],"muden":[2,3],"mundo":[1,3,2,2,5,2],"music":[2,4],"muy":[0,1,1,2,3,1,4,4,5,2]});
@@ -0,0 +1 @@
+__searchShard("my", {"my":[1,1,2,17,3,2,5,2,6,3],"myself":[6,2],"mysterious":[1,1]});
@@ -0,0 +1 @@
+__searchShard("na", {"nada":[1,1,3,2,5,3,6,3],"nadie":[3,1,4,1,6,1],"name":[2,1,4,2,5,2],"names":[2,1]});
@@ -0,0 +1 @@
+__searchShard("ne", {"near":[3,1],"necesitaba":[3,1],"needed":[3,1],"negociamos":[5,2],"negociar":[5,1],"negotiated":[5,2],"neighbor":[6,2],"neighbours":[6,1],"nena":[2,1],"nene":[2,1],"networks":[2,1],"never":[2,4],"next":[6,1]});
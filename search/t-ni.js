@@ -0,0 +1 @@
+__searchShard("ni", {"ni":[1,1],"nice":[0,1,5,1],"night":[1,1,5,1,6,1],"nights":[2,1]});
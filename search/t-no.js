@@ -0,0 +1 @@
+__searchShard("no", {"no":[0,4,1,2,2,10,3,3,5,5,6,12],"nobody":[3,1,4,1],"noche":[1,1,2,4,5,1,6,1],"nogal":[4,2],"noises":[6,1],"nombre":[2,1],"normal":[3,2],"normas":[3,1],"nos":[0,2,2,1,5,8],"nose":[6,1],"not":[2,3,6,1],"nothing":[1,1,3,1,5,2,6,2],"notice":[5,2],"noun":[0,3,1,3,3,2,5,1,6,1],"now":[2,1]});
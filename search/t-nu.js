@@ -0,0 +1 @@
+__searchShard("nu", {"nude":[2,3],"nudes":[2,3],"nuestro":[0,2],"nuevo":[6,1],"nunca":[2,4]});
@@ -0,0 +1 @@
+__searchShard("o", {"o":[2,8,3,1,6,2]});
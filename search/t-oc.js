@@ -0,0 +1 @@
+__searchShard("oc", {"ocurre":[6,2],"ocurrir":[6,2]});
@@ -0,0 +1 @@
+__searchShard("od", {"odd":[1,1]});
@@ -0,0 +1 @@
+__searchShard("of", {"of":[0,8,1,11,2,15,3,2,4,6,5,8,6,5],"off":[2,1],"often":[1,2,2,2]});
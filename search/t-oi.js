@@ -0,0 +1 @@
+__searchShard("oi", {"oia":[6,2],"oido":[6,1],"oigo":[6,2],"oir":[6,1]});
@@ -0,0 +1 @@
+__searchShard("oj", {"ojala":[2,3],"ojos":[2,1]});
@@ -0,0 +1 @@
+__searchShard("ok", {"okay":[6,2]});
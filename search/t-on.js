@@ -0,0 +1 @@
+__searchShard("on", {"on":[1,1,2,3,3,11,4,2,5,2,6,7],"once":[0,1,1,2],"one":[0,1,1,2,2,4,3,1,4,2,5,2,6,5],"onto":[3,1]});
@@ -0,0 +1 @@
+__searchShard("op", {"open":[4,2],"opened":[6,1],"opposite":[3,1,5,1]});
@@ -0,0 +1 @@
+__searchShard("or", {"or":[0,1,1,2,2,10,3,3,6,2],"orden":[1,1],"order":[2,1],"ordinary":[5,1],"origin":[4,1]});
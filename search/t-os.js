@@ -0,0 +1 @@
+__searchShard("os", {"oscar":[2,2],"oscura":[1,1]});
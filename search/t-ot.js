@@ -0,0 +1 @@
+__searchShard("ot", {"other":[2,1,6,3],"others":[1,1],"otra":[3,1],"otro":[2,1,5,2,6,2]});
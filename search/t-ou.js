@@ -0,0 +1 @@
+__searchShard("ou", {"ought":[6,1],"our":[0,2],"out":[1,5,2,5,3,2,5,4,6,3]});
@@ -0,0 +1 @@
+__searchShard("ov", {"over":[2,4],"overkill":[6,2],"overtaking":[3,1],"overtook":[3,1]});
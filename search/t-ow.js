@@ -0,0 +1 @@
+__searchShard("ow", {"owner":[3,1,5,1]});
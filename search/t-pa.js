@@ -0,0 +1 @@
+__searchShard("pa", {"pa":[2,18],"pagar":[5,1],"pago":[5,2],"pais":[3,1],"paises":[1,1],"pandemic":[5,1],"para":[1,6,2,6,3,3,4,1,5,2,6,2],"paradise":[4,2],"paraiso":[4,3],"parakeet":[2,1],"parece":[2,3],"pareces":[2,1],"parecia":[1,1,3,1],"parecido":[1,1],"parecio":[1,1],"pared":[6,3],"paredes":[6,2],"part":[0,1],"parte":[0,1],"partes":[1,1],"participle":[5,1],"particular":[1,2],"partido":[6,1],"party":[2,2,5,1],"pasaba":[5,1],"pasamos":[1,1,5,2],"pasar":[1,2,6,4],"pasara":[6,2],"pasaron":[6,1],"paso":[3,1],"passing":[6,1],"past":[3,2,5,1],"pastel":[0,2],"pastelito":[0,6],"pastelitos":[0,3],"pastries":[0,2],"pastry":[0,5],"pata":[2,3],"patadas":[2,1],"pattern":[2,1],"pausas":[1,1],"pauses":[1,1],"payment":[5,2]});
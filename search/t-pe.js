@@ -0,0 +1 @@
+__searchShard("pe", {"pecho":[2,2],"pedir":[6,2],"pela":[2,3],"pena":[2,2,5,3],"pendiente":[5,2],"pendientes":[5,1],"pensaba":[3,1],"pensar":[1,5],"people":[1,2,2,2,5,3],"peor":[6,2],"pequena":[4,1],"pequeno":[4,2,5,1],"percussion":[2,1],"perico":[2,3],"pero":[0,2,1,2,2,2,3,1,5,2,6,1],"perreo":[2,7],"perro":[2,1],"person":[1,1,2,2,3,1],"persona":[3,1],"petardo":[2,2],"petardos":[2,1]});
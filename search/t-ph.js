@@ -0,0 +1 @@
+__searchShard("ph", {"pho":[2,1],"photo":[2,2,5,1],"photos":[2,6],"phrase":[1,2,3,1,5,1]});
@@ -0,0 +1 @@
+__searchShard("pi", {"pick":[1,1],"pidiendo":[5,1],"pidio":[6,1],"piece":[0,1],"pienso":[2,1],"piso":[5,1,6,1],"pista":[0,8]});
@@ -0,0 +1 @@
+__searchShard("pl", {"place":[0,2,1,1],"places":[5,1],"plan":[1,1],"play":[1,1,2,2],"playa":[3,1],"played":[1,1],"playing":[1,3,2,2],"plena":[2,5],"plural":[0,1,2,2,3,2,5,2],"pluscuamperfecto":[5,1]});
@@ -0,0 +1 @@
+__searchShard("po", {"poco":[1,2,2,1,3,1,5,1],"podemos":[1,1],"podia":[1,1],"point":[1,1,5,1],"police":[6,1],"policia":[6,1],"popular":[4,1],"por":[0,3,1,3,2,1,3,10,5,3,6,3],"pounding":[2,2]});
@@ -0,0 +1 @@
+__searchShard("pr", {"pr":[2,5],"precio":[5,1],"pregunta":[1,5,2,1],"preguntandome":[6,2],"preguntarse":[6,1],"preguntas":[1,4],"pregunte":[1,1],"pregunto":[3,1],"prendan":[2,2],"presence":[1,2],"present":[4,1],"preterito":[5,1],"pretty":[2,1],"primeros":[3,1],"principio":[1,1,6,1],"produce":[1,1],"properly":[1,1]});
@@ -0,0 +1 @@
+__searchShard("pu", {"pude":[2,4],"pueden":[1,1],"puerta":[6,1],"puerto":[2,8],"pues":[2,2],"puffs":[4,3],"puno":[6,3],"punto":[6,4],"puse":[1,1]});
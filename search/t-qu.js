@@ -0,0 +1 @@
+__searchShard("qu", {"que":[0,3,1,12,2,36,3,5,5,5,6,20],"queda":[2,1],"quedara":[1,1],"quede":[6,1],"querer":[1,1],"queria":[1,1,6,1],"queriendo":[2,1],"querrias":[1,1],"question":[1,5],"questions":[1,4],"quien":[1,1,5,1],"quiero":[2,4]});
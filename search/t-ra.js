@@ -0,0 +1 @@
+__searchShard("ra", {"raised":[6,1],"random":[1,2],"rang":[6,1],"rara":[1,1],"raro":[3,1],"rato":[1,3,5,3]});
@@ -0,0 +1 @@
+__searchShard("re", {"re":[2,8,3,1],"read":[1,3],"real":[2,3],"realised":[6,2],"really":[1,1,2,3],"recordar":[6,2],"recorrido":[0,1],"reflexive":[4,1,5,2,6,2],"reggaeton":[2,1],"regions":[3,1],"reglas":[1,1],"regular":[3,3,4,1,5,2],"reino":[3,1],"reir":[6,2],"reirnos":[1,1],"relative":[6,1],"relaxed":[1,1],"relieved":[6,2],"rellano":[6,3],"remind":[6,2],"remotely":[5,1],"rentar":[3,1],"rented":[3,2],"repartimos":[5,1],"repartir":[5,1],"repartirse":[5,1],"repeated":[3,1],"reservabamos":[5,1],"responder":[1,2],"respondio":[6,1],"rest":[1,3],"resto":[1,1],"reunia":[1,1]});
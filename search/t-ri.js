@@ -0,0 +1 @@
+__searchShard("ri", {"rican":[2,6],"rico":[2,2],"ridges":[2,1],"ridiculo":[6,2],"ridiculous":[6,2],"right":[0,1,3,2,5,1],"rincon":[4,3],"ring":[6,1]});
@@ -0,0 +1 @@
+__searchShard("ro", {"road":[3,1],"roaring":[6,1],"roig":[2,2],"romania":[0,1],"romantic":[2,1],"ronda":[1,1],"rondas":[1,1],"rooftop":[1,1],"room":[6,1],"roro":[2,2],"rota":[5,4],"rotos":[6,1],"rounds":[1,1]});
@@ -0,0 +1 @@
+__searchShard("ru", {"rugia":[6,1],"ruidos":[6,1],"rules":[1,1,3,1],"rum":[2,2],"rumania":[0,1],"run":[0,2]});
@@ -0,0 +1 @@
+__searchShard("s", {"s":[2,10,5,1,6,3]});
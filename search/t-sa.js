@@ -0,0 +1 @@
+__searchShard("sa", {"sabe":[2,1],"saben":[4,2],"saber":[4,2,5,1],"saberlo":[5,1],"sabia":[0,1,6,1],"sabiamos":[0,1,5,2],"sacaba":[1,1],"sacar":[1,3],"saco":[1,1],"said":[1,1],"salen":[2,2],"sali":[3,1,6,1],"saliera":[1,1],"salon":[6,1],"salsa":[2,2],"same":[0,1,1,2,2,4,3,1,5,2],"san":[2,2],"santurce":[2,2],"saw":[1,1]});
@@ -0,0 +1 @@
+__searchShard("sc", {"scary":[0,3],"scooter":[3,4],"scored":[6,2]});
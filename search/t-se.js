@@ -0,0 +1 @@
+__searchShard("se", {"se":[1,2,2,12,3,2,4,2,6,7],"seba":[2,2],"secret":[4,1],"section":[0,1],"see":[1,1,2,2],"seemed":[1,1,3,1],"seems":[1,1],"seen":[5,1],"sees":[4,1],"segui":[3,1],"seguida":[1,1],"seguir":[1,1],"semana":[5,6],"sena":[3,1],"senas":[3,3],"send":[2,3],"sense":[1,1],"sent":[5,1],"sentarse":[4,1],"sentia":[3,1,6,1],"sentido":[1,1],"ser":[4,2,5,1],"seria":[2,2,6,2],"serious":[3,1,6,2],"set":[1,2],"settings":[1,1],"several":[5,1]});
@@ -0,0 +1 @@
+__searchShard("sh", {"shade":[4,2],"shame":[5,2],"shit":[2,1],"short":[0,1],"shortened":[2,38],"shots":[2,1],"should":[2,8],"shouted":[3,1],"shouting":[6,1],"shouts":[6,2],"showed":[6,1]});
@@ -0,0 +1 @@
+__searchShard("si", {"si":[1,3,2,8,6,5],"side":[3,2,6,2],"sido":[5,1],"siempre":[3,1],"sientan":[4,2],"sighs":[2,2],"significa":[0,3,2,1],"significar":[0,1],"siguiente":[6,1],"silence":[1,2,6,3],"silencio":[1,3,6,3],"silent":[1,1],"silla":[5,5],"similar":[1,1,3,1],"simpatico":[5,1],"simple":[4,3],"simples":[4,2],"sin":[1,2],"since":[0,1,3,1,6,1],"sino":[1,1],"sintiendome":[6,1],"sit":[4,2],"sitio":[4,1]});
@@ -0,0 +1 @@
+__searchShard("sk", {"ski":[0,7],"skiing":[0,1],"skinned":[2,1]});
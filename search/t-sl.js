@@ -0,0 +1 @@
+__searchShard("sl", {"slang":[2,8],"slope":[0,8],"slower":[0,1],"slowly":[1,1]});
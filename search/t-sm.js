@@ -0,0 +1 @@
+__searchShard("sm", {"small":[0,1,5,1],"smile":[1,1]});
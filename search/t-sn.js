@@ -0,0 +1 @@
+__searchShard("sn", {"snack":[4,1],"snacks":[4,1],"snowboard":[0,1],"snowboarding":[0,1]});
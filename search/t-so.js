@@ -0,0 +1 @@
+__searchShard("so", {"so":[1,2,2,11,5,3,6,2],"sobre":[1,3,3,1],"solo":[1,1],"sombra":[4,3],"some":[1,2,3,1,5,1],"someone":[0,1,1,2,3,1,6,1],"something":[0,1,1,3,2,1,5,2,6,6],"sometimes":[3,1],"somewhere":[6,2],"son":[2,2,4,2],"sonaba":[6,2],"sonar":[6,2],"song":[2,2],"sonrisa":[1,1],"soon":[1,1],"sordo":[6,1],"sorprendida":[6,2],"sounded":[6,2],"sounds":[2,1]});
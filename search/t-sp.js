@@ -0,0 +1 @@
+__searchShard("sp", {"space":[1,1],"spain":[4,2,5,1],"spanish":[2,3,5,2],"speaking":[1,1],"speech":[2,3],"speechless":[1,1],"split":[5,3],"spoke":[1,2],"spot":[4,2]});
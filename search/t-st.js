@@ -0,0 +1 @@
+__searchShard("st", {"stairs":[6,2],"start":[2,2,6,1],"started":[3,1,6,2],"state":[2,1],"stay":[2,1],"stayed":[1,1,6,1],"staying":[5,2],"steep":[0,2],"sticking":[6,1],"sticks":[4,1],"still":[1,1,2,2],"stories":[1,1],"strange":[3,1],"street":[2,2],"strong":[2,1],"struck":[1,1],"style":[2,1]});
@@ -0,0 +1 @@
+__searchShard("su", {"su":[1,1,3,1,4,1],"subiamos":[1,1],"subjunctive":[2,2,6,3],"suddenly":[6,1],"suena":[2,1],"sugarcane":[2,1],"sunset":[1,1,2,3],"supimos":[5,2],"sure":[5,2,6,2],"surf":[3,2],"surfear":[3,1],"surfer":[3,1],"surfing":[3,1],"surfista":[3,1],"surprised":[6,2],"suspiro":[2,3],"suspiros":[2,1]});
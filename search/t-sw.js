@@ -0,0 +1 @@
+__searchShard("sw", {"swapped":[5,1],"swear":[2,2],"sweet":[0,4,2,1]});
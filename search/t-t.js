@@ -0,0 +1 @@
+__searchShard("t", {"t":[0,5,1,2,2,5,3,2,5,5,6,5]});
@@ -0,0 +1 @@
+__searchShard("ta", {"take":[2,4],"taken":[2,5],"talk":[2,1],"talked":[1,1,5,1],"tambien":[6,1],"tamos":[2,3],"tan":[1,1,5,1,6,1],"tanto":[1,1],"tarde":[3,1],"taste":[0,1,4,3],"taught":[1,1]});
@@ -0,0 +1 @@
+__searchShard("te", {"te":[2,10],"television":[6,1],"tell":[1,1,2,4],"tener":[1,2,6,1],"tengo":[2,1],"tenia":[1,1,6,1],"tenian":[0,1],"tercer":[3,1],"term":[2,3],"terminaba":[1,1],"termino":[2,2],"terrace":[1,2],"terraza":[1,1]});
@@ -0,0 +1 @@
+__searchShard("th", {"than":[0,1],"thank":[3,1],"thanks":[2,1],"that":[0,5,1,10,2,11,3,1,4,2,5,4,6,19],"the":[0,17,1,17,2,29,3,26,4,11,5,20,6,24],"their":[4,4],"them":[1,1,2,2,4,3,5,1],"then":[0,2,3,2,6,3],"there":[0,2,1,2],"they":[0,1,1,1,2,6,3,2,4,14],"thin":[6,2],"thing":[6,1],"things":[1,2,2,5,4,2,6,1],"think":[1,3,2,1],"thinking":[1,1],"third":[3,1],"this":[1,1],"those":[2,3],"thought":[3,1],"thousand":[1,1],"three":[3,1,6,1],"through":[6,2],"throw":[5,1],"thud":[6,1]});
@@ -0,0 +1 @@
+__searchShard("ti", {"ti":[2,2],"tickle":[4,2],"tiene":[2,1],"tienen":[4,1],"timbre":[6,2],"time":[1,1,2,1,4,1,5,2],"times":[2,4],"tipo":[1,1],"tirar":[2,6],"tirarte":[2,2],"tire":[2,1],"tiro":[2,2],"tiros":[2,1]});
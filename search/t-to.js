@@ -0,0 +1 @@
+__searchShard("to", {"to":[0,4,1,23,2,21,3,8,4,2,5,10,6,15],"tocando":[2,1],"tocar":[2,1],"todas":[1,2,2,1],"todavia":[1,1,2,1],"today":[2,6],"todo":[1,4,2,1,3,1,5,1,6,6],"todos":[1,1],"together":[1,1],"told":[0,1,3,1],"top":[1,1],"toque":[2,3],"toques":[2,1],"tore":[2,1],"tough":[2,1],"tourist":[3,1],"toy":[2,10]});
@@ -0,0 +1 @@
+__searchShard("tr", {"trabajabamos":[5,1],"trabajo":[6,1],"traditional":[2,1],"traffic":[3,2],"trafico":[3,1],"traia":[1,1],"tranquilo":[1,1,2,1],"transport":[3,1],"transporte":[3,3],"travel":[3,1],"travelled":[5,2],"travellers":[1,1],"traves":[6,2],"tree":[4,2],"tres":[3,1,6,1],"trip":[1,1],"trivial":[1,2],"trozo":[0,4],"truth":[3,1]});
@@ -0,0 +1 @@
+__searchShard("tu", {"tu":[2,8],"turista":[3,1],"tuve":[2,3]});
@@ -0,0 +1 @@
+__searchShard("tv", {"tv":[2,2,6,1]});
@@ -0,0 +1 @@
+__searchShard("ty", {"typical":[2,1]});
@@ -0,0 +1 @@
+__searchShard("uk", {"uk":[3,1]});
@@ -0,0 +1 @@
+__searchShard("ul", {"ultima":[2,1]});
@@ -0,0 +1 @@
+__searchShard("un", {"un":[0,6,1,6,3,7,4,7,5,6,6,6],"una":[0,3,1,8,2,3,3,1,4,4,5,6,6,4],"unas":[1,2],"understand":[3,1],"unido":[3,1],"uno":[1,1,2,2,5,1],"unsettling":[6,2],"until":[2,1]});
@@ -0,0 +1 @@
+__searchShard("up", {"up":[1,3,2,4,3,1]});
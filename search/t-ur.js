@@ -0,0 +1 @@
+__searchShard("ur", {"urban":[2,1]});
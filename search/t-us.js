@@ -0,0 +1 @@
+__searchShard("us", {"us":[0,2,5,2],"use":[1,1,3,1],"used":[0,1,1,2,2,2,3,1],"uso":[1,1],"ustede":[2,3],"ustedes":[2,1]});
@@ -0,0 +1 @@
+__searchShard("va", {"va":[4,1],"vais":[4,1],"valgan":[2,2],"vamo":[2,5],"vamos":[2,1,4,1],"van":[2,1,4,3],"varios":[5,1],"vas":[4,1]});
@@ -0,0 +1 @@
+__searchShard("ve", {"ve":[4,1],"vece":[2,3],"veces":[2,3,3,1],"vecino":[6,2],"vengan":[2,2],"veo":[2,2],"ver":[1,1],"verb":[0,1,3,3,4,1,5,2,6,1],"verdad":[1,1,2,1,3,1],"very":[0,1,1,1,2,3,3,1,4,4,5,1],"ves":[2,2],"vez":[0,1,1,1,2,1,6,3]});
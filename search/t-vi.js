@@ -0,0 +1 @@
+__searchShard("vi", {"vi":[1,1],"viajar":[5,1],"viaje":[1,1,5,2],"viajeros":[1,1],"viajo":[3,1],"vida":[1,1],"visto":[5,1],"vivo":[6,1]});
@@ -0,0 +1 @@
+__searchShard("vo", {"voces":[6,1],"voices":[6,1],"volume":[6,1],"volumen":[6,4],"volver":[1,1,2,1,6,2],"volvia":[3,1],"volvio":[6,2],"voy":[2,2,4,1],"voz":[1,1]});
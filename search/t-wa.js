@@ -0,0 +1 @@
+__searchShard("wa", {"wait":[1,1],"walking":[2,1],"wall":[6,2],"walls":[6,2],"walnut":[4,2],"want":[1,2,2,1],"wanted":[1,1,6,1],"wanting":[2,1],"was":[0,3,1,3,5,4,6,11],"wasn":[0,2,1,1,5,1],"watch":[5,1],"watching":[5,1],"wave":[3,1],"waved":[3,1],"way":[0,2,1,2,3,1,5,2]});
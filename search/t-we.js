@@ -0,0 +1 @@
+__searchShard("we", {"we":[0,4,1,6,2,9,5,23],"week":[5,1],"weekdays":[5,1],"weekends":[5,2],"weight":[2,1],"well":[2,2,3,1],"went":[0,3,3,2,5,1,6,2],"were":[1,2,3,2,5,2,6,1],"weren":[5,1]});
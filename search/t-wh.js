@@ -0,0 +1 @@
+__searchShard("wh", {"what":[1,1,6,3],"whatever":[1,1],"when":[1,2,2,4,3,2,5,1,6,2],"where":[0,1,1,1,2,2,4,1,5,1],"whether":[6,5],"white":[2,2],"who":[2,1,5,1],"whoever":[1,1],"whole":[2,2],"whom":[5,1],"whose":[1,1],"why":[1,2]});
@@ -0,0 +1 @@
+__searchShard("wi", {"with":[0,1,1,5,2,8,5,3,6,4],"without":[1,1]});
@@ -0,0 +1 @@
+__searchShard("wo", {"wondering":[6,2],"wood":[1,1],"word":[0,2,2,2],"work":[6,1],"worked":[5,1],"world":[1,1],"worse":[6,1],"worst":[6,1],"worth":[2,2],"would":[1,5,2,2,6,3],"wouldn":[5,2]});
@@ -0,0 +1 @@
+__searchShard("wr", {"written":[1,1,2,1],"wrong":[3,2],"wrote":[5,1]});
@@ -0,0 +1 @@
+__searchShard("x", {"x":[0,2]});
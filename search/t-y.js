@@ -0,0 +1 @@
+__searchShard("y", {"y":[0,6,1,11,2,17,3,6,4,4,5,2,6,10]});
@@ -0,0 +1 @@
+__searchShard("ya", {"ya":[0,1,2,7,6,1]});
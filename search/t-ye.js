@@ -0,0 +1 @@
+__searchShard("ye", {"year":[3,1]});
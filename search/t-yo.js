@@ -0,0 +1 @@
+__searchShard("yo", {"yo":[1,1,2,6,3,1,5,2],"you":[0,1,1,3,2,36,3,3,6,1],"your":[2,1]});
@@ -0,0 +1 @@
+__searchShard("zu", {"zumba":[2,2]});
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Write sw.js, the service worker the pages register (web/offline.js), from web/sw.js and a
+precache manifest of the current build: index.html and the assets/ files (precached at
+install), every story page, and each story's images and vocab chunks, all with content
+hashes. Saving a story for offline reading fetches its page, images and vocab chunks; the
+responsive derivatives are listed separately and only cached when the browser picks one. The worker caches files under their hash, so after a rebuild only changed files
+are fetched again; a story's page and files share one cache, evicted least recently read
+first beyond IMAGE_CACHE_BYTES unless the learner saved the story for offline reading.
+The manifest's version changes with any listed hash, which makes browsers install the
+new worker. .sw_cache.json keeps each listed file's size, mtime and hash, so unchanged
+files are not re-read. Written by generate_web.py --service-worker after each build (pass
+the same options). A build without it replaces an existing sw.js with web/sw-retire.js,
+which clears the worker's caches and unregisters it in browsers that installed it.
+"""
+import json
+from pathlib import Path
+
+from generate_web import (
+    ROOT, WEB_DIR, PageOptions, image_path, image_variants, json_text, minify_js, sha256_hex, web_assets,
+    write_if_changed,
+)
+
+SW_PATH = ROOT / "sw.js"
+SW_SOURCE = WEB_DIR / "sw.js"
+SW_RETIRE_SOURCE = WEB_DIR / "sw-retire.js"
+SW_CACHE_PATH = ROOT / ".sw_cache.json"
+# Hex digits of the content hash the worker keys cached files by.
+SW_HASH_LENGTH = 12
+# Runtime-cached story files (images, vocab chunks) kept beyond saved-offline stories.
+IMAGE_CACHE_BYTES = 50 * 1024 * 1024
+
+
+def site_file(path: str) -> Path:
+    """The file served for a site path ("" is index.html, "story/<slug>/" its index.html)."""
+    return ROOT / (path + "index.html" if path == "" or path.endswith("/") else path)
+
+
+def file_hashes(paths: list) -> dict:
+    """{site path: (hash, size)} for the paths whose file exists, re-hashing only files whose
+    size or mtime changed since .sw_cache.json was written."""
+    try:
+        old = json.loads(SW_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        old = {}
+    cache = {}
+    for path in paths:
+        if path in cache:
+            continue
+        try:
+            st = site_file(path).stat()
+        except OSError:
+            continue
+        record = old.get(path)
+        if not (record and record["size"] == st.st_size and record["mtime"] == st.st_mtime_ns):
+            digest = sha256_hex(site_file(path).read_bytes())[:SW_HASH_LENGTH]
+            record = {"size": st.st_size, "mtime": st.st_mtime_ns, "hash": digest}
+        cache[path] = record
+    if cache != old:
+        tmp = SW_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(SW_CACHE_PATH)
+    return {path: (r["hash"], r["size"]) for path, r in cache.items()}
+
+
+def story_files(record: dict, options: PageOptions) -> list[str]:
+    """Site paths a story is saved offline with: its images (the PNG fallback) and vocab chunks."""
+    folder = "media/" if options.hashed_images else "images/"
+    out = [folder + image_path(name, options) for name in record.get("images") or []]
+    out.extend("vocab/" + f for f in record.get("vocab") or [])
+    return out
+
+
+def story_variants(record: dict, options: PageOptions, variants: dict) -> list[str]:
+    """Site paths of a story's image derivatives (variants: image_variants()), cached only as read."""
+    folder = "media/" if options.hashed_images else "images/"
+    return [
+        folder + image_path(f"derived/{v['file']}", options)
+        for name in record.get("images") or []
+        for v in (variants.get(name) or {}).get("variants", ())
+    ]
+
+
+def sw_manifest(records: dict, options: PageOptions) -> dict:
+    """The manifest sw.js is written with (see web/sw.js): {version, shell, pages, files, stories, variants, limit}."""
+    shell = [""] + ([] if options.inline_assets else ["assets/" + f for f in sorted(web_assets(options)[1].values())])
+    pages = {sid: f"story/{record['slug']}/" for sid, record in records.items()}
+    files = {record["slug"]: story_files(record, options) for record in records.values()}
+    derived = image_variants()
+    variants = {record["slug"]: story_variants(record, options, derived) for record in records.values()}
+    listed = [p for paths in files.values() for p in paths] + [p for paths in variants.values() for p in paths]
+    hashes = file_hashes(shell + list(pages.values()) + listed)
+    manifest = {
+        "shell": {p: hashes[p][0] for p in shell if p in hashes},
+        "pages": {p: hashes[p][0] for p in pages.values() if p in hashes},
+        "files": {p: list(hashes[p]) for p in listed if p in hashes},
+        "stories": {slug: [p for p in paths if p in hashes] for slug, paths in files.items()},
+        "variants": {slug: [p for p in paths if p in hashes] for slug, paths in variants.items() if paths},
+        "limit": IMAGE_CACHE_BYTES,
+    }
+    manifest["version"] = sha256_hex(json.dumps(manifest, sort_keys=True).encode("utf-8"))[:SW_HASH_LENGTH]
+    return manifest
+
+
+def write_service_worker(records: dict, options: PageOptions = PageOptions()) -> dict:
+    """Write sw.js for the build records (the build cache's stories) unless it is unchanged.
+    Returns {version, shell, pages, files, bytes (of the listed story files), written}."""
+    manifest = sw_manifest(records, options)
+    source = SW_SOURCE.read_text(encoding="utf-8")
+    text = f"self.SW_MANIFEST = {json_text(manifest, options)};\n" + (minify_js(source) if options.minify else source)
+    return {
+        "version": manifest["version"],
+        "shell": len(manifest["shell"]),
+        "pages": len(manifest["pages"]),
+        "files": len(manifest["files"]),
+        "bytes": sum(size for _, size in manifest["files"].values()),
+        "written": write_if_changed(SW_PATH, text),
+    }
+
+
+def retire_service_worker() -> bool:
+    """Replace a published sw.js with the retiring worker (see web/sw-retire.js); no sw.js
+    means no worker was published, so none is written. Returns True if sw.js was replaced."""
+    if not SW_PATH.is_file():
+        return False
+    return write_if_changed(SW_PATH, SW_RETIRE_SOURCE.read_text(encoding="utf-8"))
+
+
+def describe(result: dict) -> str:
+    return (
+        f"Service worker {result['version']} ({'updated' if result['written'] else 'unchanged'}): "
+        f"{result['shell']} precached, {result['pages']} story pages, "
+        f"{result['files']} story files ({result['bytes'] / 1024:,.0f} KB)."
+    )
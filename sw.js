@@ -0,0 +1,17 @@
+// Retiring service worker: service_worker.py writes it to sw.js when a build without
+// --service-worker replaces one that had it. Browsers that installed the old worker fetch
+// this update, which deletes the worker's caches, unregisters itself and reloads open pages
+// from the network. Delete sw.js once learners have had time to visit again.
+'use strict';
+self.addEventListener('install', function () { self.skipWaiting(); });
+self.addEventListener('activate', function (event) {
+  event.waitUntil(caches.keys().then(function (names) {
+    return Promise.all(names.filter(function (n) { return n.indexOf('cuentito-') === 0; }).map(function (n) {
+      return caches.delete(n);
+    }));
+  }).then(function () { return self.registration.unregister(); }).then(function () {
+    return self.clients.matchAll({ type: 'window' });
+  }).then(function (clients) {
+    clients.forEach(function (client) { client.navigate(client.url); });
+  }));
+});
@@ -0,0 +1,42 @@
+"""Shared fixtures: the repo root on sys.path, and scratch copies of the site to build in."""
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def site(tmp_path) -> Path:
+    """A copy of the generator's code, web/, schemas/ and stories/ with an empty images/.
+    Every module derives its paths from its own location, so builds there leave the repo alone."""
+    for path in ROOT.glob("*.py"):
+        shutil.copy2(path, tmp_path / path.name)
+    for name in ("web", "schemas", "stories"):
+        shutil.copytree(ROOT / name, tmp_path / name)
+    (tmp_path / "images").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def build(site):
+    """build(**options) runs generate_web.build() in the copy (in a fresh process, so module
+    state never leaks between builds) and returns its result dict."""
+    code = (
+        "import json, sys, generate_web as gw\n"
+        "result = gw.build(options=gw.PageOptions(**json.loads(sys.argv[1])))\n"
+        "print(json.dumps(result, default=str))\n"
+    )
+
+    def run(**options) -> dict:
+        proc = subprocess.run(
+            [sys.executable, "-c", code, json.dumps(options)], cwd=site, capture_output=True, text=True, check=True,
+        )
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+
+    return run
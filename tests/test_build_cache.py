@@ -0,0 +1,55 @@
+"""Incremental builds: .build_cache.json decides which story pages are rendered again."""
+import json
+
+
+def story_count(site) -> int:
+    return len(list((site / "stories").glob("*.json")))
+
+
+def test_second_build_renders_nothing(site, build):
+    assert build()["rendered"] == story_count(site)
+    page = site / "story" / "bali-scooter" / "index.html"
+    mtime = page.stat().st_mtime_ns
+    assert build()["rendered"] == 0
+    assert page.stat().st_mtime_ns == mtime
+
+
+def test_edited_story_is_the_only_one_rendered(site, build):
+    build()
+    other = site / "story" / "vecino-televisor" / "index.html"
+    mtime = other.stat().st_mtime_ns
+    path = site / "stories" / "bali_scooter.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["title"] = "Un título editado"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    assert build()["rendered"] == 1
+    assert "Un título editado" in (site / "story" / "bali-scooter" / "index.html").read_text(encoding="utf-8")
+    assert other.stat().st_mtime_ns == mtime
+
+
+def test_touched_but_unchanged_story_is_not_rendered(site, build):
+    build()
+    path = site / "stories" / "bali_scooter.json"
+    path.write_bytes(path.read_bytes())  # new mtime, same content hash
+    assert build()["rendered"] == 0
+
+
+def test_changed_options_render_every_story(site, build):
+    build()
+    assert build(minify=True)["rendered"] == story_count(site)
+
+
+def test_deleted_page_is_rendered_again(site, build):
+    build()
+    (site / "story" / "bali-scooter" / "index.html").unlink()
+    assert build()["rendered"] == 1
+    assert (site / "story" / "bali-scooter" / "index.html").is_file()
+
+
+def test_removed_story_loses_its_page(site, build):
+    build()
+    (site / "stories" / "bali_scooter.json").unlink()
+    result = build()
+    assert result["removed"] == 1
+    assert not (site / "story" / "bali-scooter").exists()
+    assert "bali-scooter" not in (site / "manifest" / "0000.json").read_text(encoding="utf-8")
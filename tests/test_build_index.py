@@ -0,0 +1,40 @@
+"""build_index.py term folding, which web/search.js must reproduce for queries to match."""
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from build_index import fold, story_terms, tokenize
+
+ROOT = Path(__file__).resolve().parent.parent
+SAMPLES = ["Año Pequeño", "ÉL CAMIÓN", "Straße", "ﬁesta", "Ñandú", "pingüino", "İstanbul", "naïve café"]
+
+
+def test_fold_strips_accents_and_case():
+    assert fold("Año Pequeño") == "ano pequeno"
+    assert fold("PINGÜINO") == "pinguino"
+    assert fold("Straße") == "straße"  # lower(), not casefold(): search.js has no 'ss'
+
+
+def test_tokenize_splits_on_punctuation_and_underscores():
+    assert tokenize("¿Qué tal? Muy_bien, 2021.") == ["que", "tal", "muy", "bien", "2021"]
+
+
+def test_story_terms_counts_folded_words():
+    data = {"title": "El Año", "content": [{"type": "sentence", "text": "año tras año", "translation": "year"}]}
+    terms = story_terms(data)
+    assert terms["ano"] == 3
+    assert terms["el"] == 1
+    assert terms["year"] == 1
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_search_js_folds_like_python():
+    source = (ROOT / "web" / "search.js").read_text(encoding="utf-8")
+    js_fold = re.search(r"function fold\(s\) \{.*?\n  \}", source, re.S).group(0)
+    script = f"{js_fold}\nconsole.log(JSON.stringify({json.dumps(SAMPLES)}.map(fold)));"
+    out = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout
+    assert json.loads(out) == [fold(s) for s in SAMPLES]
@@ -0,0 +1,63 @@
+"""--compact-payload: generate_web.compact_story, decoded by web/story-columns.js, gives the story back."""
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from generate_web import compact_story
+
+ROOT = Path(__file__).resolve().parent.parent
+DECODE = """
+var window = {{}};
+{source}
+var s = window.decodeStoryColumns(JSON.parse(require('fs').readFileSync(0, 'utf8')));
+var items = [];
+for (var i = 0; i < s.count; i++) items.push(s.item(i));
+console.log(JSON.stringify({{ meta: s.meta, content: items, glossary: s.glossary() }}));
+"""
+
+
+@pytest.fixture
+def story():
+    return json.loads((ROOT / "stories" / "bali_scooter.json").read_text(encoding="utf-8"))
+
+
+def expected_item(item: dict) -> dict:
+    """An item as the decoder returns it: highlight text is dropped, missing lists are empty."""
+    if item["type"] == "image":
+        return {"type": "image", "filename": item.get("filename"), "generation_prompt": item.get("generation_prompt")}
+    if item["type"] != "sentence":
+        return {}
+    return {
+        "type": "sentence",
+        "text": item.get("text"),
+        "translation": item.get("translation"),
+        "detailedTranslation": item.get("detailedTranslation") or [],
+        "highlights": [
+            {"startIndex": h["startIndex"], "endIndex": h["endIndex"], "glossaryKey": h.get("glossaryKey")}
+            for h in item.get("highlights") or []
+        ],
+    }
+
+
+def test_strings_are_stored_once(story):
+    payload = compact_story(story)
+    assert len(payload["strings"]) == len(set(payload["strings"]))
+    assert len(payload["kinds"]) == len(story["content"])
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_decoded_payload_matches_the_story(story):
+    source = (ROOT / "web" / "story-columns.js").read_text(encoding="utf-8")
+    proc = subprocess.run(
+        ["node", "-e", DECODE.format(source=source)],
+        input=json.dumps(compact_story(story)), capture_output=True, text=True, check=True,
+    )
+    decoded = json.loads(proc.stdout)
+    assert decoded["meta"] == {k: v for k, v in story.items() if k not in ("content", "glossary")}
+    assert decoded["content"] == [expected_item(item) for item in story["content"]]
+    assert decoded["glossary"] == {
+        k: {"translation": e.get("translation"), "explanation": e.get("explanation")} for k, e in story["glossary"].items()
+    }
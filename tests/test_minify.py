@@ -0,0 +1,46 @@
+"""minify.py: minified assets and pages must keep the same tokens, elements and text."""
+import json
+from pathlib import Path
+
+import pytest
+
+import generate_web as gw
+from minify import compare_pages, css_signature, js_signature, minify_css, minify_html, minify_js
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("name", gw.WEB_ASSETS)
+def test_web_asset_keeps_its_tokens(name):
+    text = gw.load_web_assets()[name]
+    signature, minify = (js_signature, minify_js) if name.endswith(".js") else (css_signature, minify_css)
+    minified = minify(text)
+    assert signature(minified) == signature(text)
+    assert len(minified) < len(text)
+
+
+def test_js_keeps_strings_regexes_and_line_breaks_that_matter():
+    src = 'var a = "a  b"; // note\nvar r = /x  y/g;\nreturn a +\n  ++b;'
+    assert minify_js(src) == 'var a="a  b";var r=/x  y/g;return a+\n++b;'
+
+
+def test_css_keeps_strings():
+    assert minify_css('/* c */ b { content: "x  y"; }') == 'b{content:"x  y"}'
+
+
+def test_html_collapses_inline_whitespace_only():
+    assert minify_html("<p>a  <b>b</b>\n</p>\n<div> c </div>") == "<p>a <b>b</b></p><div>c</div>"
+
+
+@pytest.mark.parametrize("flags", [{}, {"client_render": True}, {"inline_assets": True}])
+def test_story_page_round_trips(flags):
+    data = json.loads((ROOT / "stories" / "bali_scooter.json").read_text(encoding="utf-8"))
+    readable = gw.story_page_html(data, "bali-scooter", gw.PageOptions(**flags))
+    minified = gw.story_page_html(data, "bali-scooter", gw.PageOptions(minify=True, **flags))
+    assert len(minified) < len(readable)
+    assert compare_pages(readable, minified) == ""
+    assert compare_pages(readable, minify_html(readable)) == ""
+
+
+def test_compare_pages_reports_a_changed_text():
+    assert compare_pages("<p>a <b>b</b></p>", "<p>a<b>b</b></p>") != ""
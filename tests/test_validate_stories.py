@@ -0,0 +1,58 @@
+"""validate_stories.py: the compiled schema checks and the semantic checks, as reported per story."""
+import json
+from pathlib import Path
+
+import pytest
+
+from asset_graph import story_images
+from validate_stories import validate_paths, validate_story
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def story():
+    return json.loads((ROOT / "stories" / "bali_scooter.json").read_text(encoding="utf-8"))
+
+
+def problems(tmp_path, data, images=frozenset()) -> list[tuple[str, str, str]]:
+    path = tmp_path / "story.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return [(p["path"], p["code"], p["severity"]) for p in validate_story(path, images)]
+
+
+def test_repo_stories_have_no_errors():
+    paths = sorted((ROOT / "stories").glob("*.json"))
+    assert [p for p in validate_paths(paths, jobs=1) if p["severity"] == "error"] == []
+
+
+def test_valid_story_with_its_images(tmp_path, story):
+    assert problems(tmp_path, story, frozenset(story_images(story))) == []
+
+
+def test_schema_errors_point_at_the_field(tmp_path, story):
+    del story["level"]
+    story["tags"] = "grammar"
+    story["content"][0]["text"] = 5
+    found = problems(tmp_path, story, frozenset({"x"}))
+    assert ("", "required", "error") in found
+    assert ("/tags", "type", "error") in found
+    assert ("/content/0/text", "type", "error") in found
+
+
+def test_highlight_outside_the_sentence(tmp_path, story):
+    story["content"][1]["highlights"][0]["endIndex"] = 999
+    assert ("/content/1/highlights/0", "highlight-range", "error") in problems(tmp_path, story)
+
+
+def test_missing_image_is_a_warning(tmp_path, story):
+    found = problems(tmp_path, story)
+    assert ("/thumbnail/filename", "missing-image", "warning") in found
+    assert all(severity == "warning" for _, code, severity in found if code == "missing-image")
+
+
+def test_unparsable_file_is_one_json_error(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text("{oops", encoding="utf-8")
+    [problem] = validate_story(path, frozenset())
+    assert (problem["file"], problem["code"], problem["severity"]) == ("broken.json", "json", "error")
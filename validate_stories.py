@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Validate stories/*.json against schemas/story.schema.json plus semantic checks:
+  - highlight spans lie inside the sentence, do not overlap, and text[startIndex:endIndex]
+    equals the highlight's text
+  - every highlight glossaryKey exists in the story's glossary
+  - thumbnail and content images exist in images/ (a warning: images are generated later,
+    see list_missing_images.py)
+The schema is compiled once into nested check functions (no jsonschema dependency), and
+stories are checked in parallel across processes when there are many of them.
+Every problem is reported, not just the first per story. Exit status is 1 if any story
+has errors (or warnings, with --strict).
+Usage: python3 validate_stories.py [--json] [--strict] [--jobs N] [story.json ...]
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from asset_graph import IMAGES_DIR, image_filename, scan_images
+
+ROOT = Path(__file__).resolve().parent
+SCHEMA_PATH = ROOT / "schemas" / "story.schema.json"
+# Below this many stories a process pool costs more than it saves.
+POOL_MIN_STORIES = 64
+
+# Keywords that only document the schema.
+_ANNOTATIONS = frozenset(("$schema", "$id", "title", "description", "default", "definitions", "examples"))
+_TYPES = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+# A compiled check: (value, path, error list) -> None; appends (path, code, message).
+# Paths are (parent path, key) pairs rooted at (), turned into JSON pointers only for errors.
+Check = Callable[[object, tuple, list], None]
+
+
+def compile_schema(schema: dict, root: dict = None, refs: dict = None) -> Check:
+    """Compile a draft-07 schema (the subset story.schema.json uses) into one check function.
+    Raises ValueError on keywords it does not implement, so the schema cannot outgrow it silently."""
+    root = schema if root is None else root
+    refs = {} if refs is None else refs
+    if "$ref" in schema:
+        return _compile_ref(schema["$ref"], root, refs)
+    if set(schema) - _ANNOTATIONS == {"type"}:
+        return _compile_type(schema["type"])
+    unknown = set(schema) - _ANNOTATIONS - {
+        "type", "required", "properties", "additionalProperties", "items", "enum", "const", "minimum", "oneOf",
+    }
+    if unknown:
+        raise ValueError(f"unsupported schema keyword(s): {', '.join(sorted(unknown))}")
+    checks = []
+
+    check_type = _compile_type(schema["type"]) if "type" in schema else None
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append((path, "enum", f"{value!r} is not one of {allowed}"))
+        checks.append(check_enum)
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(value, path, errors):
+            if value != const:
+                errors.append((path, "const", f"expected {const!r}, got {value!r}"))
+        checks.append(check_const)
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def check_minimum(value, path, errors):
+            if _TYPES["number"](value) and value < minimum:
+                errors.append((path, "minimum", f"{value} is less than {minimum}"))
+        checks.append(check_minimum)
+
+    required = tuple(schema.get("required", ()))
+    props = {k: compile_schema(s, root, refs) for k, s in schema.get("properties", {}).items()}
+    extra = schema.get("additionalProperties", True)
+    extra_check = compile_schema(extra, root, refs) if isinstance(extra, dict) else None
+    if required or props or extra is not True:
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for key in required:
+                if key not in value:
+                    errors.append((path, "required", f"missing required property {key!r}"))
+            for key, item in value.items():
+                sub = props.get(key)
+                if sub is not None:
+                    sub(item, (path, key), errors)
+                elif extra_check is not None:
+                    extra_check(item, (path, key), errors)
+                elif extra is False:
+                    errors.append((path, "additionalProperties", f"unexpected property {key!r}"))
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = compile_schema(schema["items"], root, refs)
+
+        def check_items(value, path, errors):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    item_check(item, (path, i), errors)
+        checks.append(check_items)
+
+    if "oneOf" in schema:
+        checks.append(_compile_one_of(schema["oneOf"], root, refs))
+
+    checks = tuple(checks)
+
+    def check(value, path, errors):
+        if check_type is not None and not check_type(value, path, errors):
+            return
+        for c in checks:
+            c(value, path, errors)
+    return check
+
+
+def _compile_type(name: str) -> Check:
+    """A check for a JSON type that returns whether the value has it."""
+    is_type = _TYPES[name]
+
+    def check_type(value, path, errors):
+        if not is_type(value):
+            errors.append((path, "type", f"expected {name}, got {_json_type(value)}"))
+            return False
+        return True
+    return check_type
+
+
+def _compile_ref(ref: str, root: dict, refs: dict) -> Check:
+    if ref not in refs:
+        if not ref.startswith("#/"):
+            raise ValueError(f"unsupported $ref {ref!r}")
+        target = root
+        for part in ref[2:].split("/"):
+            target = target[part]
+        # Placeholder first, so recursive definitions resolve to the same compiled check.
+        slot = []
+        refs[ref] = lambda value, path, errors: slot[0](value, path, errors)
+        slot.append(compile_schema(target, root, refs))
+        refs[ref] = slot[0]  # later references call it directly
+    return refs[ref]
+
+
+def _compile_one_of(branches: list, root: dict, refs: dict) -> Check:
+    compiled = [compile_schema(b, root, refs) for b in branches]
+    # Branches told apart by a const property ("type": "sentence" / "image") are dispatched
+    # on that value instead of validating the item against every branch.
+    tag = None
+    for b in branches:
+        consts = {k: p["const"] for k, p in b.get("properties", {}).items() if isinstance(p, dict) and "const" in p}
+        tag = set(consts) if tag is None else tag & set(consts)
+    tag = sorted(tag or ())
+    if tag:
+        field = tag[0]
+        by_value = {b["properties"][field]["const"]: c for b, c in zip(branches, compiled)}
+        allowed = sorted(by_value)
+
+        def check_tagged(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append((path, "type", f"expected object, got {_json_type(value)}"))
+                return
+            branch = by_value.get(value.get(field))
+            if branch is None:
+                errors.append(((path, field), "oneOf", f"{value.get(field)!r} is not one of {allowed}"))
+                return
+            branch(value, path, errors)
+        return check_tagged
+
+    def check_any(value, path, errors):
+        results = []
+        for c in compiled:
+            errs = []
+            c(value, path, errs)
+            results.append(errs)
+        matched = sum(1 for errs in results if not errs)
+        if matched == 0:
+            errors.extend(min(results, key=len))
+        elif matched > 1:
+            errors.append((path, "oneOf", f"matches {matched} alternatives, expected exactly one"))
+    return check_any
+
+
+def _json_type(value) -> str:
+    for name in ("null", "boolean", "integer", "number", "string", "array", "object"):
+        if _TYPES[name](value):
+            return name
+    return type(value).__name__
+
+
+def pointer(path: tuple) -> str:
+    """JSON pointer for a (parent, key) path chain: ((((), 'content'), 3), 'text') -> /content/3/text."""
+    parts = []
+    while path:
+        path, key = path
+        parts.append(str(key).replace("~", "~0").replace("/", "~1"))
+    return "".join("/" + p for p in reversed(parts))
+
+
+def semantic_errors(data: dict, images: frozenset) -> list:
+    """Checks the schema cannot express. Returns [(pointer, code, message, severity)]."""
+    out = []
+    glossary = data.get("glossary") if isinstance(data.get("glossary"), dict) else {}
+    content = data.get("content") if isinstance(data.get("content"), list) else []
+    for i, item in enumerate(content):
+        if not isinstance(item, dict):
+            continue
+        base = f"/content/{i}"
+        if item.get("type") == "image":
+            _check_image(item.get("filename"), f"{base}/filename", images, out)
+            continue
+        text = item.get("text")
+        highlights = item.get("highlights")
+        if not isinstance(text, str) or not isinstance(highlights, list):
+            continue
+        spans = []
+        for j, h in enumerate(highlights):
+            if not isinstance(h, dict):
+                continue
+            path = f"{base}/highlights/{j}"
+            start, end = h.get("startIndex"), h.get("endIndex")
+            if isinstance(start, int) and isinstance(end, int):
+                if not 0 <= start < end <= len(text):
+                    out.append((path, "highlight-range",
+                                f"span {start}..{end} is outside the {len(text)}-character sentence", "error"))
+                else:
+                    spans.append((start, end, j))
+                    if isinstance(h.get("text"), str) and text[start:end] != h["text"]:
+                        out.append((path, "highlight-text",
+                                    f"text[{start}:{end}] is {text[start:end]!r}, highlight text is {h['text']!r}",
+                                    "error"))
+            key = h.get("glossaryKey")
+            if isinstance(key, str) and key not in glossary:
+                out.append((f"{path}/glossaryKey", "glossary-key", f"{key!r} is not in the glossary", "error"))
+        spans.sort()
+        for (s1, e1, j1), (s2, e2, j2) in zip(spans, spans[1:]):
+            if s2 < e1:
+                out.append((f"{base}/highlights/{j2}", "highlight-overlap",
+                            f"span {s2}..{e2} overlaps highlight {j1} ({s1}..{e1})", "error"))
+    thumb = data.get("thumbnail")
+    if isinstance(thumb, dict):
+        _check_image(thumb.get("filename"), "/thumbnail/filename", images, out)
+    return out
+
+
+def _check_image(filename, path: str, images: frozenset, out: list) -> None:
+    if not isinstance(filename, str) or not filename.strip():
+        return
+    name = image_filename(filename)
+    if name not in images:
+        out.append((path, "missing-image", f"images/{name} does not exist", "warning"))
+
+
+_compiled = {}
+
+
+def story_validator() -> Check:
+    """The compiled story schema, built once per process."""
+    if "story" not in _compiled:
+        _compiled["story"] = compile_schema(json.loads(SCHEMA_PATH.read_text(encoding="utf-8")))
+    return _compiled["story"]
+
+
+def validate_story(path: Path, images: frozenset) -> list[dict]:
+    """All problems in one story file as dicts {file, path, code, message, severity}."""
+    name = path.name
+    try:
+        data = json.loads(path.read_bytes().decode("utf-8"))
+    except OSError as e:
+        return [{"file": name, "path": "", "code": "read", "message": e.strerror or str(e), "severity": "error"}]
+    except ValueError as e:  # includes UnicodeDecodeError
+        return [{"file": name, "path": "", "code": "json", "message": str(e), "severity": "error"}]
+    errors = []
+    story_validator()(data, (), errors)
+    problems = [
+        {"file": name, "path": pointer(p), "code": c, "message": m, "severity": "error"} for p, c, m in errors
+    ]
+    if isinstance(data, dict):
+        problems.extend(
+            {"file": name, "path": p, "code": c, "message": m, "severity": s}
+            for p, c, m, s in semantic_errors(data, images)
+        )
+    return problems
+
+
+def _validate_batch(paths: list, images: frozenset) -> list:
+    """Worker entry point: problems for a batch of stories, in order."""
+    return [problem for path in paths for problem in validate_story(path, images)]
+
+
+def image_names() -> frozenset:
+    """Files in images/, listed once instead of one stat per referenced image."""
+    return frozenset(scan_images(IMAGES_DIR))
+
+
+def validate_paths(paths: list, jobs: int = 0) -> list[dict]:
+    """Validate story files (serially, or across jobs processes; 0 = one per CPU).
+    Problems come back in path order either way."""
+    story_validator()  # compile (and surface schema errors) before any work is handed out
+    images = image_names()
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    if jobs <= 1 or len(paths) < POOL_MIN_STORIES:
+        return _validate_batch(paths, images)
+    size = max(1, -(-len(paths) // (jobs * 4)))
+    batches = [paths[i:i + size] for i in range(0, len(paths), size)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_validate_batch, batches, [images] * len(batches))
+        return [problem for result in results for problem in result]
+
+
+def summarize(paths: list, problems: list) -> dict:
+    errors = sum(1 for p in problems if p["severity"] == "error")
+    return {
+        "stories": len(paths),
+        "invalid": len({p["file"] for p in problems if p["severity"] == "error"}),
+        "errors": errors,
+        "warnings": len(problems) - errors,
+        "problems": problems,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate story JSONs against schemas/story.schema.json.")
+    parser.add_argument("stories", nargs="*", type=Path, help="story files (default: stories/*.json)")
+    parser.add_argument("--json", action="store_true", help="print one JSON report instead of text")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 on warnings too")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=0, metavar="N",
+        help="check stories with N worker processes (0 = one per CPU)",
+    )
+    args = parser.parse_args(argv)
+    from generate_web import story_paths  # imports this module, so not at the top
+
+    paths = args.stories or story_paths()
+    report = summarize(paths, validate_paths(paths, args.jobs))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=1))
+    else:
+        for p in report["problems"]:
+            print(f"{p['file']}:{p['path'] or '/'}: {p['severity']}: [{p['code']}] {p['message']}")
+        print(
+            f"Checked {report['stories']} stories: {report['errors']} error(s) in {report['invalid']} "
+            f"story(ies), {report['warnings']} warning(s)."
+        )
+    failed = report["errors"] or (args.strict and report["warnings"])
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Watch mode for generate_web.py (--watch, --serve): poll stories/, images/, web/ and the
+generator's own *.py modules, and after a burst of changes settles, rebuild only what it affects.
+  - story saved: that story's page and its manifest shard (plus index.html, which embeds
+    the manifest root); adding or deleting a story rewrites the shards after it; the level
+    and category listings the story is in (build_facets.py)
+  - image added or changed: compress_images.py (cached, so only changed images are
+    processed; with --derivatives when images/derived/ is in use), image_meta.py and, with
+    --hashed-images, publish_images.py; then the pages whose image derivatives, size,
+    placeholder or media/ name changed
+  - web/ changed: the process restarts itself, and the changed render key makes that a
+    full rebuild
+  - a *.py module changed (generate_web.py, build_facets.py, ...): the process restarts with
+    --force, since outputs written by the old code are not covered by the render key
+The build cache, the search index and sw.js are written once changes have been idle for a
+moment, so saving a story costs one page render however large the catalog is.
+With --serve, the site is served on localhost and open pages reload after each rebuild
+(server-sent events on /__livereload; the reload script is injected into served HTML
+only, never written to the generated files).
+"""
+import bisect
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import generate_web as gw
+from asset_graph import IMAGE_EXTS
+from build_facets import index_nav_html, update_facets
+from image_meta import update_image_meta
+from publish_images import publish_images
+
+# Seconds between scans for changes.
+POLL_INTERVAL = 0.2
+# A burst of changes is rebuilt once nothing has changed for this long.
+DEBOUNCE = 0.15
+# Seconds without changes before the build cache and search index are brought up to date.
+IDLE_FLUSH = 2.0
+
+LIVE_RELOAD_SCRIPT = (
+    b"<script>(function () { var build = null; var events = new EventSource('/__livereload');"
+    b" events.onmessage = function (e) { if (build === null) build = e.data; else if (e.data !== build) location.reload(); };"
+    b" })();</script>"
+)
+
+
+def is_code(name: str) -> bool:
+    """The generator's own modules: every .py file next to generate_web.py."""
+    return name.endswith(".py")
+
+
+def snapshot() -> dict:
+    """{path: (size, mtime_ns)} of every watched file."""
+    out = {}
+    for folder, keep in (
+        (gw.STORIES_DIR, lambda name: name.endswith(".json") and name != "manifest.json"),
+        (gw.ROOT / "images", lambda name: name.lower().endswith(IMAGE_EXTS)),
+        (gw.WEB_DIR, lambda name: not name.startswith(".")),
+        (gw.ROOT, is_code),
+    ):
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        for e in entries:
+            if keep(e.name) and e.is_file():
+                st = e.stat()
+                out[Path(e.path)] = (st.st_size, st.st_mtime_ns)
+    return out
+
+
+def _path_order(sid: str) -> str:
+    """Sort key matching story_paths(), which sorts by file name."""
+    return sid + ".json"
+
+
+class Watcher:
+    """In-memory build state: the story records and manifest, patched per change."""
+
+    def __init__(self, options: gw.PageOptions, jobs: int, force: bool = False):
+        self.options = options
+        result = gw.build(force=force, jobs=jobs, options=options)
+        print(f"Built {result['stories']} stories ({result['rendered']} rendered).")
+        self.cache = gw.load_build_cache(gw.render_key(options))
+        self.records = self.cache["stories"]
+        self.order = list(self.records)  # story path order, as in the manifest
+        self.manifest = [self.records[sid]["manifest"] for sid in self.order]
+        self.root = gw.write_manifest_shards(self.manifest, self.options) if self.manifest else None
+        self.dirty = False
+
+    def rebuild_stories(self, paths: set) -> int:
+        """Re-render the given story files (deleted ones lose their page). Returns pages rendered."""
+        if self.options.shared_glossary:
+            from build_vocab import build_vocabulary  # imports generate_web, so not at the top
+
+            build_vocabulary()
+        rendered = 0
+        structural = False
+        changed = set()
+        for path in sorted(paths):
+            sid = path.stem
+            if not path.is_file():
+                record = self.records.pop(sid, None)
+                if record is not None:
+                    self.order.remove(sid)
+                    shutil.rmtree(gw.STORY_OUTPUT_DIR / record["slug"], ignore_errors=True)
+                    structural = True
+                    print(f"Removed {record['slug']}")
+                continue
+            record, did_render = gw.build_story(path, self.records.get(sid), self.options)
+            if record is None:  # unreadable: keep the last good page until it is fixed
+                continue
+            if sid not in self.records:
+                bisect.insort(self.order, sid, key=_path_order)
+                structural = True
+            self.records[sid] = record
+            changed.add(sid)
+            rendered += did_render
+        if structural:
+            self.manifest = [self.records[sid]["manifest"] for sid in self.order]
+            self.root = gw.write_manifest_shards(self.manifest, self.options) if self.manifest else None
+            self.write_index()
+        else:
+            self.update_manifest(changed)
+        self.dirty = True
+        return rendered
+
+    def update_manifest(self, sids: set) -> None:
+        """Patch the manifest entries of stories that stayed in place; rewrite only their shards."""
+        size = gw.MANIFEST_SHARD_SIZE
+        shards = set()
+        for sid in sids:
+            i = bisect.bisect_left(self.order, _path_order(sid), key=_path_order)
+            entry = self.records[sid]["manifest"]
+            if self.manifest[i] != entry:
+                self.manifest[i] = entry
+                shards.add(i // size)
+        if not shards:
+            return
+        for n in shards:
+            self.root["shards"][n] = gw.write_manifest_shard(n, self.manifest[n * size:(n + 1) * size], self.options)
+        gw.write_if_changed(gw.MANIFEST_DIR / "index.json", json.dumps(self.root))
+        self.write_index()
+
+    def write_index(self) -> None:
+        """Write index.html and the listings of the facet values whose stories changed."""
+        if self.root:
+            gw.write_index(self.root, self.manifest[:gw.MANIFEST_SHARD_SIZE], self.options, index_nav_html(self.manifest))
+        update_facets(self.manifest, self.cache, self.options)
+
+    def rebuild_images(self, names: set) -> int:
+        """Compress changed images and refresh their metadata, then re-render pages whose image
+        derivatives, size, placeholder or media/ name changed."""
+        args = [sys.executable, str(gw.ROOT / "compress_images.py")]
+        if gw.DERIVED_MANIFEST_PATH.is_file():
+            args.append("--derivatives")
+        proc = subprocess.run(args, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print("compress_images.py failed:", (proc.stderr or proc.stdout).strip().splitlines()[-1:])
+        update_image_meta()
+        if self.options.hashed_images:
+            publish_images()
+        stale = {
+            gw.STORIES_DIR / f"{sid}.json"
+            for sid, record in self.records.items()
+            if names & set(record.get("images") or ()) and not gw.deps_match(record)
+        }
+        return self.rebuild_stories(stale) if stale else 0
+
+    def flush(self) -> None:
+        """Persist the build cache and refresh the search index and sw.js after a quiet period."""
+        if not self.dirty:
+            return
+        self.cache["stories"] = {sid: self.records[sid] for sid in self.order}
+        self.cache["manifest"] = gw.manifest_hash(self.manifest) if self.manifest else ""
+        gw.save_build_cache(self.cache)
+        from build_index import build_search_index  # imports generate_web, so not at the top
+
+        build_search_index()
+        if self.options.service_worker:
+            from service_worker import write_service_worker  # imports generate_web, so not at the top
+
+            write_service_worker(self.records, self.options)
+        self.dirty = False
+
+
+class LiveReload:
+    """Build counter that /__livereload clients wait on."""
+
+    def __init__(self):
+        # Differs per process, so pages reload after a restart too.
+        self.build = f"{os.getpid()}-0"
+        self.count = 0
+        self.changed = threading.Condition()
+
+    def bump(self) -> None:
+        with self.changed:
+            self.count += 1
+            self.build = f"{os.getpid()}-{self.count}"
+            self.changed.notify_all()
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    live: LiveReload = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    def do_GET(self):
+        if self.path == "/__livereload":
+            self.stream_events()
+            return
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() and self.path.endswith("/"):
+            path = path / "index.html"
+        if path.suffix == ".html" and path.is_file():
+            body = path.read_bytes()
+            i = body.rfind(b"</body>")
+            body = body[:i] + LIVE_RELOAD_SCRIPT + body[i:] if i >= 0 else body + LIVE_RELOAD_SCRIPT
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        super().do_GET()
+
+    def stream_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        live = self.live
+        sent = None
+        try:
+            while True:
+                with live.changed:
+                    if sent == live.build:
+                        live.changed.wait(timeout=15)
+                    build = live.build
+                if build != sent:
+                    self.wfile.write(f"data: {build}\n\n".encode("ascii"))
+                    sent = build
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except OSError:  # client went away
+            pass
+
+
+def serve(port: int, live: LiveReload) -> ThreadingHTTPServer:
+    """Serve the repo root on localhost in a background thread."""
+    handler = partial(type("Handler", (_Handler,), {"live": live}), directory=str(gw.ROOT))
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving http://127.0.0.1:{port}/ with live reload")
+    return server
+
+
+def watch(options: gw.PageOptions, jobs: int = 1, port: int = None, force: bool = False) -> None:
+    """Build once (ignoring the build cache with force), then rebuild on changes until interrupted."""
+    watcher = Watcher(options, jobs, force)
+    live = LiveReload()
+    if port is not None:
+        serve(port, live)
+    print("Watching stories/, images/, web/ and the generator's *.py modules (Ctrl+C to stop)")
+    state = snapshot()
+    pending = set()
+    last_change = idle_since = time.monotonic()
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = snapshot()
+            changed = {p for p in current.keys() | state.keys() if current.get(p) != state.get(p)}
+            state = current
+            now = time.monotonic()
+            if changed:
+                pending |= changed
+                last_change = now
+                continue
+            if pending and now - last_change >= DEBOUNCE:
+                batch, pending = pending, set()
+                code = any(p.parent == gw.ROOT and is_code(p.name) for p in batch)
+                if code or any(p.parent == gw.WEB_DIR for p in batch):
+                    print("Generator code or web/ changed; restarting for a full rebuild")
+                    watcher.flush()
+                    argv = sys.argv + (["--force"] if code and "--force" not in sys.argv else [])
+                    os.execv(sys.executable, [sys.executable] + argv)
+                started = time.perf_counter()
+                stories = {p for p in batch if p.parent == gw.STORIES_DIR}
+                images = {p.name for p in batch if p.parent != gw.STORIES_DIR}
+                rendered = watcher.rebuild_stories(stories) if stories else 0
+                if images:
+                    rendered += watcher.rebuild_images(images)
+                    state = snapshot()  # compression rewrites images in place
+                ms = (time.perf_counter() - started) * 1000
+                print(f"{len(batch)} change(s): rendered {rendered} page(s) in {ms:.0f} ms")
+                live.bump()
+                idle_since = time.monotonic()
+            elif not pending and watcher.dirty and now - idle_since >= IDLE_FLUSH:
+                watcher.flush()
+    except KeyboardInterrupt:
+        watcher.flush()
+        print("Stopped.")
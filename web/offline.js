@@ -0,0 +1,43 @@
+// Registers the service worker (sw.js, see service_worker.py) when served over http(s), and
+// on story pages adds a button that saves the story, its images and glossary for offline reading.
+(function () {
+  if (!('serviceWorker' in navigator) || !/^https?:$/.test(location.protocol)) return;
+  // Story pages and the level/category listings (build_facets.py) sit two folders below the root.
+  var m = /^(.*\/)(story|level|category)\/([^\/]+)\/(?:index\.html)?$/.exec(location.pathname);
+  var root = m ? m[1] : location.pathname.replace(/[^\/]*$/, '');
+  navigator.serviceWorker.register(root + 'sw.js', { scope: root }).catch(function () {});
+  var header = m && m[2] === 'story' && document.querySelector('.back-header');
+  if (!header) return;
+  var slug = decodeURIComponent(m[3]);
+  var pinned = false;
+  var button = document.createElement('button');
+  button.type = 'button';
+  button.className = 'offline-toggle';
+  button.hidden = true;
+  header.appendChild(button);
+
+  function ask(type) {
+    return navigator.serviceWorker.ready.then(function (reg) {
+      return new Promise(function (resolve) {
+        var channel = new MessageChannel();
+        channel.port1.onmessage = function (e) { resolve(e.data || {}); };
+        reg.active.postMessage({ type: type, slug: slug }, [channel.port2]);
+      });
+    });
+  }
+  function show(state) {
+    pinned = !!state.pinned;
+    button.hidden = false;
+    button.disabled = false;
+    button.textContent = state.error ? 'Offline download failed'
+      : pinned ? (state.missing ? 'Saved offline (' + state.missing + ' file(s) missing)' : 'Saved offline ✓')
+      : 'Download for offline';
+    button.title = pinned ? 'Remove the offline copy' : 'Keep this story readable without a connection';
+  }
+  button.addEventListener('click', function () {
+    button.disabled = true;
+    button.textContent = pinned ? 'Removing…' : 'Downloading…';
+    ask(pinned ? 'remove' : 'download').then(show);
+  });
+  ask('status').then(show);
+})();
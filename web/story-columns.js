@@ -0,0 +1,37 @@
+// --client-render --compact-payload: decodes the columnar story payload (generate_web.compact_story).
+// Items are only built as story-client.js asks for them; nothing is expanded up front.
+window.decodeStoryColumns = function (p) {
+  var strings = p.strings;
+  function str(i) { return i < 0 ? undefined : strings[i]; }
+  // Start of each item's run in the flattened bullet and highlight columns.
+  var bulletAt = [], highlightAt = [];
+  for (var i = 0, b = 0, h = 0; i < p.kinds.length; i++) {
+    bulletAt.push(b);
+    highlightAt.push(h);
+    b += p.bulletCounts[i];
+    h += p.highlightCounts[i];
+  }
+  function item(i) {
+    var kind = p.kinds.charAt(i);
+    if (kind === 'i') return { type: 'image', filename: str(p.text[i]), generation_prompt: str(p.translation[i]) };
+    if (kind !== 's') return {};
+    var bullets = [], highlights = [];
+    for (var k = bulletAt[i], end = k + p.bulletCounts[i]; k < end; k++) bullets.push(strings[p.bullets[k]]);
+    for (k = highlightAt[i], end = k + p.highlightCounts[i]; k < end; k++) {
+      highlights.push({ startIndex: p.highlightStarts[k], endIndex: p.highlightEnds[k], glossaryKey: str(p.highlightKeys[k]) });
+    }
+    return {
+      type: 'sentence', text: str(p.text[i]), translation: str(p.translation[i]),
+      detailedTranslation: bullets, highlights: highlights,
+    };
+  }
+  function glossary() {
+    if (!p.glossary) return undefined;
+    var out = {};
+    p.glossary[0].forEach(function (key, k) {
+      out[strings[key]] = { translation: str(p.glossary[1][k]), explanation: str(p.glossary[2][k]) };
+    });
+    return out;
+  }
+  return { meta: p.meta, count: p.kinds.length, item: item, glossary: glossary };
+};
@@ -0,0 +1,189 @@
+// Service worker: service_worker.py writes it to sw.js behind the build's manifest,
+//   self.SW_MANIFEST = {version, shell: {path: hash}, pages: {path: hash},
+//                       files: {path: [hash, bytes]}, stories: {slug: [paths]},
+//                       variants: {slug: [paths]}, limit}
+// with paths relative to the site root ("" is index.html, story pages end in "/").
+// Listed files are cached under path?__v=<hash>, so a rebuild only refetches what changed.
+// index.html and assets/ are precached; a story's page, images and vocab chunks go to its
+// own cache as they are read (or all at once when saved for offline reading; its image
+// variants, the WebP/AVIF widths, only as the browser picks them). Stories not
+// saved offline are evicted least recently read first once their files pass `limit` bytes.
+// Anything else (manifest shards, level/category listings, search index) is network-first
+// with a cached fallback.
+'use strict';
+var M = self.SW_MANIFEST;
+var SHELL = 'cuentito-shell', RUNTIME = 'cuentito-runtime', META = 'cuentito-meta', STORY = 'cuentito-story-';
+var base = self.registration.scope;
+var owner = {};  // path -> slug of the first story that lists it
+[M.stories, M.variants].forEach(function (lists) {
+  Object.keys(lists).forEach(function (slug) {
+    lists[slug].forEach(function (path) { if (!(path in owner)) owner[path] = slug; });
+  });
+});
+function lists(slug, path) {
+  return (M.stories[slug] || []).indexOf(path) >= 0 || (M.variants[slug] || []).indexOf(path) >= 0;
+}
+
+function hashOf(path) {
+  if (path in M.shell) return M.shell[path];
+  if (path in M.pages) return M.pages[path];
+  return path in M.files ? M.files[path][0] : null;
+}
+function key(path) { return base + path + '?__v=' + hashOf(path); }
+function pathOf(url) { return url.slice(base.length).split('?')[0]; }
+function pageSlug(path) { var m = /^story\/([^\/]+)\/$/.exec(path); return m && m[1]; }
+
+// path under its current hash from cache, else from another cache (a file two stories
+// share) or the network, stored in cache. Resolves to [response, fetched from network].
+function cached(cache, path) {
+  var k = key(path);
+  return cache.match(k).then(function (hit) {
+    return hit ? [hit, false] : caches.match(k).then(function (other) {
+      if (other) return cache.put(k, other.clone()).then(function () { return [other, false]; });
+      return fetch(base + path, { cache: 'no-cache' }).then(function (res) {
+        if (!res.ok) return [res, false];
+        return cache.put(k, res.clone()).then(function () { return [res, true]; });
+      });
+    });
+  });
+}
+function first(pair) { return pair[0]; }
+
+// {used: {slug: time}, pinned: {slug: true}} for eviction and offline downloads. Updates
+// run one at a time through metaQueue, so concurrent reads and downloads don't lose writes.
+var metaQueue = Promise.resolve();
+function readMeta() {
+  return caches.open(META).then(function (cache) { return cache.match(base + '__meta'); })
+    .then(function (res) { return res ? res.json() : { used: {}, pinned: {} }; });
+}
+function writeMeta(meta) {
+  return caches.open(META).then(function (cache) {
+    return cache.put(base + '__meta', new Response(JSON.stringify(meta), { headers: { 'Content-Type': 'application/json' } }));
+  });
+}
+function updateMeta(change) {
+  var done = metaQueue.then(readMeta).then(function (meta) { change(meta); return writeMeta(meta); });
+  metaQueue = done.catch(function () {});
+  return done;
+}
+function touch(slug) {
+  return updateMeta(function (meta) { meta.used[slug] = Date.now(); });
+}
+
+// Drop whole story caches, least recently read first, until the unsaved ones fit in M.limit.
+function evict() {
+  return Promise.all([readMeta(), caches.keys()]).then(function (r) {
+    var meta = r[0];
+    var slugs = r[1].filter(function (n) { return n.indexOf(STORY) === 0; }).map(function (n) { return n.slice(STORY.length); })
+      .filter(function (slug) { return !meta.pinned[slug]; });
+    return Promise.all(slugs.map(function (slug) {
+      return caches.open(STORY + slug).then(function (cache) { return cache.keys(); }).then(function (reqs) {
+        return reqs.reduce(function (n, req) { var f = M.files[pathOf(req.url)]; return n + (f ? f[1] : 0); }, 0);
+      });
+    })).then(function (sizes) {
+      var total = sizes.reduce(function (a, b) { return a + b; }, 0);
+      var order = slugs.map(function (slug, i) { return { slug: slug, bytes: sizes[i], used: meta.used[slug] || 0 }; })
+        .sort(function (a, b) { return a.used - b.used; });
+      var drop = [];
+      for (var i = 0; i < order.length - 1 && total > M.limit; i++) {  // the latest story stays
+        total -= order[i].bytes;
+        drop.push(caches.delete(STORY + order[i].slug));
+      }
+      return Promise.all(drop);
+    });
+  });
+}
+
+// A story's page or file; reading the page marks the story as used, new bytes may evict others.
+function storyFile(slug, path) {
+  return caches.open(STORY + slug).then(function (cache) { return cached(cache, path); }).then(function (r) {
+    if (r[1]) touch(slug).then(evict);
+    else if (pageSlug(path)) touch(slug);
+    return r[0];
+  });
+}
+
+function networkFirst(request) {
+  return caches.open(RUNTIME).then(function (cache) {
+    return fetch(request).then(function (res) {
+      if (res.ok) cache.put(request, res.clone());
+      return res;
+    }).catch(function () {
+      return cache.match(request).then(function (hit) { return hit || Response.error(); });
+    });
+  });
+}
+
+self.addEventListener('install', function (event) {
+  event.waitUntil(caches.open(SHELL).then(function (cache) {
+    return Promise.all(Object.keys(M.shell).map(function (path) { return cached(cache, path); }));
+  }).then(function () { return self.skipWaiting(); }));
+});
+
+// Remove what the new manifest no longer lists under the same hash.
+self.addEventListener('activate', function (event) {
+  var current = {};
+  Object.keys(M.shell).concat(Object.keys(M.pages), Object.keys(M.files)).forEach(function (path) { current[key(path)] = true; });
+  event.waitUntil(caches.keys().then(function (names) {
+    return Promise.all(names.map(function (name) {
+      if (name.indexOf(STORY) === 0 && !(('story/' + name.slice(STORY.length) + '/') in M.pages)) return caches.delete(name);
+      if (name !== SHELL && name.indexOf(STORY) !== 0) return null;
+      return caches.open(name).then(function (cache) {
+        return cache.keys().then(function (reqs) {
+          return Promise.all(reqs.filter(function (req) { return !current[req.url]; }).map(function (req) { return cache.delete(req); }));
+        });
+      });
+    }));
+  }).then(function () { return self.clients.claim(); }));
+});
+
+self.addEventListener('fetch', function (event) {
+  var request = event.request;
+  if (request.method !== 'GET' || request.url.indexOf(base) !== 0) return;
+  var path = pathOf(request.url).replace(/(^|\/)index\.html$/, '$1');
+  if (path in M.shell) {
+    event.respondWith(caches.open(SHELL).then(function (cache) { return cached(cache, path); }).then(first));
+  } else if (path in M.pages) {
+    event.respondWith(storyFile(pageSlug(path), path));
+  } else if (path in M.files) {
+    var ref = request.referrer && request.referrer.indexOf(base) === 0 ? pathOf(request.referrer) : '';
+    var from = pageSlug(ref.replace(/index\.html$/, ''));
+    var slug = from && lists(from, path) ? from : owner[path];
+    event.respondWith(storyFile(slug, path));
+  } else if (request.url.indexOf('/__livereload') < 0) {
+    event.respondWith(networkFirst(request));
+  }
+});
+
+// Messages from web/offline.js, answered on the transferred port:
+// {type: 'status' | 'download' | 'remove', slug} -> {pinned[, missing]}.
+function download(slug) {
+  var paths = ['story/' + slug + '/'].concat(M.stories[slug] || []);
+  return caches.open(STORY + slug).then(function (cache) {
+    return Promise.all(paths.map(function (path) {
+      return cached(cache, path).then(function (r) { return r[0].ok ? 0 : 1; }, function () { return 1; });
+    }));
+  }).then(function (failed) {
+    return updateMeta(function (meta) {
+      meta.pinned[slug] = true;
+      meta.used[slug] = Date.now();
+    }).then(function () { return { pinned: true, missing: failed.reduce(function (a, b) { return a + b; }, 0) }; });
+  });
+}
+
+function remove(slug) {
+  return updateMeta(function (meta) {
+    delete meta.pinned[slug];
+  }).then(function () { return caches.delete(STORY + slug); }).then(function () { return { pinned: false }; });
+}
+
+self.addEventListener('message', function (event) {
+  var msg = event.data || {}, port = event.ports[0];
+  if (!port || !(('story/' + msg.slug + '/') in M.pages)) return;
+  var work = msg.type === 'download' ? download(msg.slug)
+    : msg.type === 'remove' ? remove(msg.slug)
+    : readMeta().then(function (meta) { return { pinned: !!meta.pinned[msg.slug] }; });
+  event.waitUntil(work.then(function (result) { port.postMessage(result); }, function (e) {
+    port.postMessage({ error: String(e) });
+  }));
+});
@@ -0,0 +1,20 @@
+// Dark mode toggle shared by index.html and the story pages; the choice is kept in localStorage.
+(function () {
+  var darkToggle = document.getElementById('darkToggle');
+  var iconSun = document.getElementById('iconSun');
+  var iconMoon = document.getElementById('iconMoon');
+  try {
+    if (localStorage.getItem('darkMode') === '1') {
+      document.body.classList.add('dark');
+      iconSun.style.display = 'none';
+      iconMoon.style.display = 'block';
+    } else { iconMoon.style.display = 'none'; }
+  } catch (e) {}
+  darkToggle.addEventListener('click', function () {
+    document.body.classList.toggle('dark');
+    var isDark = document.body.classList.contains('dark');
+    iconSun.style.display = isDark ? 'none' : 'block';
+    iconMoon.style.display = isDark ? 'block' : 'none';
+    try { localStorage.setItem('darkMode', isDark ? '1' : '0'); } catch (e) {}
+  });
+})();